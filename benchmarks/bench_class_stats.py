@@ -0,0 +1,85 @@
+"""Class dashboard refresh cost: full recompute vs incremental.
+
+Fills a temporary progress store with several class periods of saved
+students, then measures a dashboard refresh after one period's worth of new
+submissions two ways:
+
+- ``full``: a fresh ``ClassStats`` that reads and aggregates every student
+- ``incremental``: the long-lived ``ClassStats`` that only folds in students
+  saved since its previous refresh
+
+    python benchmarks/bench_class_stats.py --students 1000 --changed 30
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SCENARIOS = ["🌊 Lake Erie Algal Bloom Monitor", "❄️ Lake Superior Ice Watch", "🌲 Michigan Forest Health"]
+ORBITS = ["Low Earth Orbit (LEO)", "Geostationary (GEO)", "Sun-Synchronous"]
+INSTRUMENTS = ["Multispectral Imager", "Thermal Sensor", "Radar", "Lidar"]
+
+
+def _snapshot(bank, rng):
+    return {
+        "xp_points": rng.randint(0, 500),
+        "quiz_answers": {item_id: rng.randint(-1, 3) for item_id in bank.ids},
+        "mission_data": {"type": rng.choice(SCENARIOS), "orbit": rng.choice(ORBITS),
+                         "instruments": rng.sample(INSTRUMENTS, rng.randint(1, 3))},
+    }
+
+
+def _timed(function, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Class dashboard refresh cost")
+    parser.add_argument("--students", type=int, default=1000, help="students already saved")
+    parser.add_argument("--changed", type=int, default=30, help="students who submit before the refresh")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    import class_stats
+    import item_bank
+    from progress_store import ProgressStore
+
+    bank = item_bank.load_bank("quiz")
+    rng = random.Random(1)
+    with tempfile.TemporaryDirectory() as directory:
+        store = ProgressStore(os.path.join(directory, "progress.sqlite3"))
+        for student in range(args.students):
+            store.save(f"student-{student}", _snapshot(bank, rng))
+        store.flush()
+        live = class_stats.ClassStats(store)
+        live.refresh()
+
+        def submit_and_refresh():
+            for student in rng.sample(range(args.students), args.changed):
+                store.save(f"student-{student}", _snapshot(bank, rng))
+            store.flush()
+            live.refresh()
+
+        def full():
+            class_stats.ClassStats(store).refresh()
+
+        incremental_seconds = _timed(submit_and_refresh, args.repeat)
+        full_seconds = _timed(full, args.repeat)
+        store.close()
+
+    print(f"{args.students} saved students, {args.changed} new submissions per refresh (best of {args.repeat})")
+    print(f"full recompute      {full_seconds * 1000:8.1f} ms")
+    print(f"incremental refresh {incremental_seconds * 1000:8.1f} ms  (includes saving the new submissions)")
+
+
+if __name__ == "__main__":
+    main()
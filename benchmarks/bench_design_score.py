@@ -0,0 +1,79 @@
+"""Scenario match scoring: table lookups vs computing each score directly.
+
+Builds the score tables, then scores ``--designs`` random mission designs
+three ways:
+
+- ``direct``: recomputing orbit credit, instrument overlap and cost per design
+- ``lookup``: ``DesignScorer.score`` one design at a time (the live page path)
+- ``bulk``: ``DesignScorer.score_many`` over all of them (saved designs)
+
+    python benchmarks/bench_design_score.py --designs 20000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _direct(mission, scenarios):
+    import design_score
+    import tradeoffs
+
+    scenario = scenarios[mission["type"]]
+    chosen = set(mission["instruments"])
+    wanted = {name for name in tradeoffs.INSTRUMENT_COST
+              if tradeoffs.recommended(name, scenario["recommended_instruments"])}
+    union = len(chosen | wanted)
+    cost = tradeoffs.mission_cost(mission)
+    return (design_score.WEIGHTS["orbit"] * design_score.orbit_credit(mission["orbit"], scenario["recommended_orbit"])
+            + design_score.WEIGHTS["instruments"] * (len(chosen & wanted) / union if union else 0)
+            + design_score.WEIGHTS["budget"] * min(1.0, tradeoffs.BUDGETS[mission["budget"]] / cost))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scenario match scoring cost")
+    parser.add_argument("--designs", type=int, default=20000)
+    args = parser.parse_args()
+
+    import content_store
+    import design_score
+    import tradeoffs
+
+    start = time.perf_counter()
+    scorer = design_score.load_scorer()
+    build = time.perf_counter() - start
+
+    content = content_store.load_page("design_challenge")
+    rng = random.Random(1)
+    designs = [{
+        "type": rng.choice(list(content["scenarios"])), "num_satellites": rng.randint(1, 20),
+        "orbit": rng.choice(tradeoffs.ORBITS),
+        "instruments": rng.sample(content["instruments"], rng.randint(0, 4)),
+        "use_3d_printing": rng.random() < 0.5, "timeline": rng.choice(list(tradeoffs.TIMELINES)),
+        "budget": rng.choice(list(tradeoffs.BUDGETS)),
+    } for _ in range(args.designs)]
+
+    timings = {}
+    start = time.perf_counter()
+    direct = [_direct(design, content["scenarios"]) for design in designs]
+    timings["direct"] = time.perf_counter() - start
+    start = time.perf_counter()
+    lookup = [scorer.score(design).total for design in designs]
+    timings["lookup"] = time.perf_counter() - start
+    start = time.perf_counter()
+    bulk = scorer.score_many(designs)
+    timings["bulk"] = time.perf_counter() - start
+
+    worst = max(abs(a - b) for a, b in zip(direct, bulk))
+    print(f"tables: {scorer.total.size:,} cells ({scorer.total.nbytes / 1e6:.1f} MB) built in {build * 1000:.0f} ms")
+    for name, seconds in timings.items():
+        print(f"{name:<7} {seconds * 1e6 / args.designs:7.2f} us per design")
+    print(f"largest difference between direct and table scores: {worst:.4f} points (float32 tables)")
+    assert abs(lookup[0] - bulk[0]) < 1e-9
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Ground-track map cost per rerun of the Design Challenge orbit map.
+
+Times the first base-map stitch with no tiles on disk, then a restart that
+reads the tiles back, then every orbit, constellation size and window a
+student can pick with the base map warm, which is what a control change
+costs. Tiles go to a temporary directory so the app's cache is untouched.
+
+    python benchmarks/bench_ground_track.py
+"""
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def main():
+    import ground_track
+    import orbit_sim
+
+    ground_track.TILE_DIR = tempfile.mkdtemp(prefix="tiles-")
+    for label in ("base map, tiles rendered", "base map, tiles from disk"):
+        ground_track.tile.cache_clear()
+        ground_track.base_map.cache_clear()
+        start = time.perf_counter()
+        ground_track.base_map()
+        print(f"{label:<28}{(time.perf_counter() - start) * 1000:>8.1f} ms")
+
+    print(f"\n{'orbit':<28}{'median ms':>10}{'max ms':>9}")
+    for orbit in orbit_sim.ORBITS:
+        times = []
+        for satellites in range(1, 21):
+            for hours in (1, 3, 6, 12, 24):
+                start = time.perf_counter()
+                ground_track.render_map(orbit, satellites, hours)
+                times.append((time.perf_counter() - start) * 1000)
+        print(f"{orbit:<28}{statistics.median(times):>10.1f}{max(times):>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
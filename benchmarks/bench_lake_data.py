@@ -0,0 +1,57 @@
+"""Great Lakes dataset access: memory-mapped views vs loading the history per session.
+
+Times opening the dataset, a zero-copy lake/date slice and the chart frame
+the satellites page builds, and compares them with reading every array
+into memory the way a per-session load would.
+
+    python benchmarks/bench_lake_data.py
+"""
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def timed(function, repeat=200):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(times)
+
+
+def main():
+    import lake_data
+
+    directory = lake_data.version_dir()
+    dataset = lake_data.LakeDataset(directory)
+    files = [os.path.join(directory, variable["file"]) for variable in dataset.variables.values()]
+    total_bytes = sum(os.path.getsize(path) for path in files)
+
+    _, view = dataset.series("ice_cover", "Erie", "2014-01-01", "2014-04-30")
+    print(f"dataset: {len(dataset.lakes)} lakes x {len(dataset.dates)} days x {len(dataset.variables)} variables, "
+          f"{total_bytes / 1e6:.2f} MB; slice shares the mapped buffer: "
+          f"{np.shares_memory(view, dataset._arrays['ice_cover'])}\n")
+    rows = [
+        ("open (mmap)", lambda: lake_data.LakeDataset(directory)),
+        ("open (read every array)", lambda: [np.load(path) for path in files]),
+        ("lake x winter slice", lambda: dataset.series("ice_cover", "Erie", "2014-01-01", "2014-04-30")),
+        ("chart frame, 5 years", lambda: dataset.frame("surface_temperature", ["Superior", "Erie"],
+                                                       "2020-01-01", "2024-12-31")),
+        ("chart frame, 30 years", lambda: dataset.frame("surface_temperature")),
+        ("winter ice frame + total", lambda: dataset.frame("ice_cover", start="2013-12-01", end="2014-04-30",
+                                                           total="All five lakes")),
+    ]
+    print(f"{'operation':<28}{'median us':>10}")
+    for label, function in rows:
+        print(f"{label:<28}{timed(function):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Mission report cost on the script thread: inline render vs background pool.
+
+Renders ``--missions`` distinct mission designs (with rule-based feedback)
+and reports, per submission, how long the Streamlit rerun would block:
+
+- ``inline``: calling ``mission_report.render`` directly
+- ``pool``: ``renderer.request``, which only queues the render
+- ``cached``: ``renderer.request`` again for a design already rendered
+
+    python benchmarks/bench_mission_report.py --missions 200
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ORBITS = ["Low Earth Orbit (LEO)", "Geostationary (GEO)", "Polar Orbit"]
+INSTRUMENTS = ["Multispectral Imager", "Thermal Sensor", "Radar Altimeter", "Synthetic Aperture Radar (SAR)"]
+
+
+def _mission(number, rng):
+    return {
+        "name": f"Lake Watch {number}", "type": "🌊 Great Lakes Monitoring", "num_satellites": rng.randint(1, 20),
+        "orbit": rng.choice(ORBITS), "recommended_orbit": ORBITS[0],
+        "instruments": rng.sample(INSTRUMENTS, rng.randint(0, 3)), "recommended_instruments": INSTRUMENTS[:3],
+        "goal": "Track algal blooms in western Lake Erie " * rng.randint(1, 5),
+        "michigan_impact": "Earlier warnings for Toledo and Monroe water intakes.",
+        "use_3d_printing": rng.random() < 0.5, "budget": "Medium ($50M)", "timeline": "Standard (3 years)",
+        "data_priority": "Balanced",
+    }
+
+
+def _blocking_ms(function, items):
+    times = []
+    for item in items:
+        start = time.perf_counter()
+        function(item)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times), max(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mission report render cost on the script thread")
+    parser.add_argument("--missions", type=int, default=200)
+    args = parser.parse_args()
+
+    import feedback_engine
+    import mission_report
+
+    rng = random.Random(1)
+    designs = [(mission, feedback_engine.mission_feedback(mission))
+               for mission in (_mission(number, rng) for number in range(args.missions))]
+    renderer = mission_report.ReportRenderer(max_cached=args.missions)
+
+    results = {
+        "inline": _blocking_ms(lambda design: mission_report.render(*design), designs),
+        "pool": _blocking_ms(lambda design: renderer.request(*design), designs),
+    }
+    for design in designs:
+        renderer.request(*design).result()
+    results["cached"] = _blocking_ms(lambda design: renderer.request(*design), designs)
+
+    print(f"{args.missions} submissions, time the rerun is blocked per report")
+    for name, (median, worst) in results.items():
+        print(f"{name:<7} median {median:7.3f} ms   max {worst:7.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""Coverage simulator cost inside the Design Challenge form handler.
+
+Runs ``orbit_sim.simulate`` cold (memo cleared) for every orbit and
+constellation size a student can pick, over each scenario's region, and
+reports the median and worst time per submit.
+
+    python benchmarks/bench_orbit_sim.py
+"""
+import json
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def main():
+    import orbit_sim
+
+    with open(os.path.join(ROOT, "content", "pages", "design_challenge.json"), encoding="utf-8") as f:
+        scenarios = json.load(f)["scenarios"]
+    print(f"{'region':<34}{'median ms':>10}{'max ms':>9}{'grid points':>13}")
+    for scenario in scenarios.values():
+        region = scenario["region"]
+        times = []
+        for orbit in orbit_sim.ORBITS:
+            for satellites in range(1, 21):
+                orbit_sim._simulate.cache_clear()
+                start = time.perf_counter()
+                orbit_sim.simulate(orbit, satellites, region["bounds"])
+                times.append((time.perf_counter() - start) * 1000)
+        points = len(orbit_sim.region_grid(region["bounds"])[0])
+        print(f"{region['name']:<34}{statistics.median(times):>10.1f}{max(times):>9.1f}{points:>13}")
+
+
+if __name__ == "__main__":
+    main()
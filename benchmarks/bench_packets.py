@@ -0,0 +1,66 @@
+"""Download packet cost: first build vs disk cache vs memory cache.
+
+Times each packet three ways into a temporary cache directory:
+
+- ``build``: nothing cached, the PDF/ZIP is generated from the content files
+- ``disk``: after a server restart, read back from ``PACKET_CACHE_DIR``
+- ``memory``: every later download in the same server process
+
+then has ``--clients`` threads request a packet at once on an empty cache and
+reports how many builds actually ran.
+
+    python benchmarks/bench_packets.py --clients 30
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Download packet build and cache cost")
+    parser.add_argument("--clients", type=int, default=30, help="simultaneous first downloads")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ["PACKET_CACHE_DIR"] = directory
+        import packets
+
+        print(f"{'packet':<14}{'bytes':>9}{'build ms':>11}{'disk ms':>10}{'memory ms':>11}")
+        for name in packets.PACKETS:
+            build = _timed(lambda: packets.packet(name))
+            packets._packet_bytes.clear()
+            disk = _timed(lambda: packets.packet(name))
+            memory = _timed(lambda: packets.packet(name))
+            print(f"{name:<14}{len(packets.packet(name)):>9}{build * 1000:>11.1f}{disk * 1000:>10.1f}"
+                  f"{memory * 1000:>11.3f}")
+
+        for old in os.listdir(directory):
+            os.remove(os.path.join(directory, old))
+        packets._packet_bytes.clear()
+        builds = []
+        build, file_name, mime = packets.PACKETS["student"]
+        packets.PACKETS["student"] = (lambda: builds.append(1) or build(), file_name, mime)
+        threads = [threading.Thread(target=packets.packet, args=("student",)) for _ in range(args.clients)]
+        elapsed = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - elapsed
+        print(f"{args.clients} simultaneous student packet downloads: {len(builds)} build(s), "
+              f"{elapsed * 1000:.1f} ms total")
+
+
+if __name__ == "__main__":
+    main()
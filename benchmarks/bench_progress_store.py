@@ -0,0 +1,133 @@
+"""Throughput of the progress store for a 150-student day.
+
+Every student reruns the app many times; most reruns change their progress
+(XP, checks, achievements, answers). This replays that load from several
+threads, spread over ``--spread`` seconds, against two strategies and then
+rehydrates every student from a fresh store, as after a server restart:
+
+- ``write-behind``: ``ProgressStore.save`` with the background batch writer
+- ``sync``: the same store flushed after every save, i.e. one SQLite
+  transaction per click
+
+    python benchmarks/bench_progress_store.py --students 150 --reruns 80
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from progress_bits import ACHIEVEMENT_NAMES, AchievementSet, CheckSet  # noqa: E402
+from progress_store import ProgressStore  # noqa: E402
+
+CHECKS = ["atmo_q1", "atmo_q2", "ocean_q1", "ocean_q2", "land_q1", "land_q2", "ice_q1", "ice_q2",
+          "printing_q1", "design_challenge", "professor_feedback", "quiz_complete"]
+
+
+def _percentile(data, pct):
+    data = sorted(data)
+    return data[min(len(data) - 1, max(0, round(pct / 100 * (len(data) - 1))))]
+
+
+def _student_states(student, reruns, rng):
+    """Yield the session state after each rerun of one student's lesson."""
+    state = {"xp_points": 0, "achievements": AchievementSet(), "completed_checks": CheckSet(), "mission_data": None,
+             "quiz_short_answers": None}
+    for rerun in range(reruns):
+        if rng.random() < 0.6:
+            check = CHECKS[rerun % len(CHECKS)]
+            if state["completed_checks"].add(check):
+                state["xp_points"] += 15
+                if len(state["completed_checks"]) % 4 == 0:
+                    state["achievements"].add(ACHIEVEMENT_NAMES[len(state["achievements"])])
+            elif check == "design_challenge":
+                state["mission_data"] = {"name": f"Mission-{student}-{rerun}", "num_satellites": rng.randint(1, 20)}
+            else:
+                state["quiz_short_answers"] = {"q7": f"answer {rerun}", "q8": "thermal sensors"}
+        yield state
+
+
+def run(strategy, students, reruns, threads, spread, directory):
+    store = ProgressStore(os.path.join(directory, f"{strategy}.sqlite3"), flush_interval=1.0)
+    latencies = []
+    lock = threading.Lock()
+
+    def worker(ids):
+        rng = random.Random(ids[0])
+        local = []
+        flows = {student: _student_states(student, reruns, rng) for student in ids}
+        while flows:
+            time.sleep(spread / reruns)
+            for student, flow in list(flows.items()):
+                try:
+                    state = next(flow)
+                except StopIteration:
+                    del flows[student]
+                    continue
+                start = time.perf_counter()
+                store.save(f"student-{student}", state)
+                if strategy == "sync":
+                    store.flush()
+                local.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(local)
+
+    started = time.perf_counter()
+    pool = [threading.Thread(target=worker, args=(list(range(i, students, threads)),)) for i in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    click_seconds = time.perf_counter() - started
+    store.close()
+    total_seconds = time.perf_counter() - started
+
+    fresh = ProgressStore(store.path)
+    start = time.perf_counter()
+    restored = sum(fresh.load(f"student-{student}") is not None for student in range(students))
+    rehydrate_seconds = time.perf_counter() - start
+
+    return {
+        "strategy": strategy,
+        "saves": len(latencies),
+        "saves_per_s": len(latencies) / sum(latencies),
+        "day_s": click_seconds,
+        "save_p50_us": _percentile(latencies, 50) * 1e6,
+        "save_p99_us": _percentile(latencies, 99) * 1e6,
+        "rows_written": store.rows_written,
+        "transactions": store.batches,
+        "total_s": total_seconds,
+        "restored": restored,
+        "rehydrate_ms_per_student": rehydrate_seconds / students * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Progress store throughput for a class day")
+    parser.add_argument("--students", type=int, default=150)
+    parser.add_argument("--reruns", type=int, default=80, help="reruns per student")
+    parser.add_argument("--threads", type=int, default=8, help="concurrent server threads")
+    parser.add_argument("--spread", type=float, default=10.0, help="seconds the day is compressed into")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        results = [run(strategy, args.students, args.reruns, args.threads, args.spread, directory)
+                   for strategy in ("sync", "write-behind")]
+
+    columns = ["saves", "day_s", "saves_per_s", "save_p50_us", "save_p99_us", "rows_written", "transactions",
+               "total_s", "restored", "rehydrate_ms_per_student"]
+    print(f"{args.students} students x {args.reruns} reruns on {args.threads} threads over {args.spread:.0f} s"
+          " (saves_per_s is per second spent inside save)")
+    print(f"{'':<26}" + "".join(f"{result['strategy']:>14}" for result in results))
+    for column in columns:
+        print(f"{column:<26}" + "".join(
+            f"{result[column]:>14.1f}" if isinstance(result[column], float) else f"{result[column]:>14}"
+            for result in results))
+
+
+if __name__ == "__main__":
+    main()
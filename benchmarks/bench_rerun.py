@@ -0,0 +1,92 @@
+"""Per-rerun CPU time of every lesson page, measured headlessly with AppTest.
+
+Every widget interaction reruns app.py, so this is the cost a student pays
+on each click. Compare the current checkout with an older commit:
+
+    python benchmarks/bench_rerun.py
+    python benchmarks/bench_rerun.py --ref HEAD~1 --reruns 30
+
+Each tree is measured in its own subprocess so their modules never mix.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PAGES = ["home", "article", "objectives", "satellites", "3d_printing",
+         "design_challenge", "quiz", "resources", "downloads"]
+
+
+def measure(app_path, reruns):
+    """Return {page: CPU milliseconds per rerun} for the app at ``app_path``."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(app_path, default_timeout=120)
+    at.run()
+    results = {}
+    for page in PAGES:
+        at.session_state.page = page
+        at.run()
+        start = time.process_time()
+        for _ in range(reruns):
+            at.run()
+        results[page] = (time.process_time() - start) / reruns * 1000
+    return results
+
+
+def _measure_in_subprocess(app_path, reruns):
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--app", app_path, "--reruns", str(reruns), "--json"],
+        check=True, capture_output=True, text=True, cwd=os.path.dirname(app_path),
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def _export_ref(ref, directory):
+    archive = subprocess.run(["git", "archive", ref], check=True, capture_output=True, cwd=REPO_ROOT).stdout
+    archive_path = os.path.join(directory, "tree.tar")
+    with open(archive_path, "wb") as f:
+        f.write(archive)
+    with tarfile.open(archive_path) as tar:
+        tar.extractall(directory)
+    return os.path.join(directory, "app.py")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-rerun CPU time for each lesson page")
+    parser.add_argument("--app", default=os.path.join(REPO_ROOT, "app.py"))
+    parser.add_argument("--ref", help="git ref to compare against the current checkout")
+    parser.add_argument("--reruns", type=int, default=20)
+    parser.add_argument("--json", action="store_true", help="print raw results as JSON")
+    args = parser.parse_args()
+
+    if args.json:
+        print(json.dumps(measure(os.path.abspath(args.app), args.reruns)))
+        return
+
+    current = _measure_in_subprocess(os.path.abspath(args.app), args.reruns)
+    baseline = None
+    if args.ref:
+        with tempfile.TemporaryDirectory() as directory:
+            baseline = _measure_in_subprocess(_export_ref(args.ref, directory), args.reruns)
+
+    header = f"{'page':<18}{'current ms':>12}"
+    if baseline:
+        header += f"{args.ref + ' ms':>16}{'change':>10}"
+    print(header)
+    for page in PAGES:
+        line = f"{page:<18}{current[page]:>12.1f}"
+        if baseline:
+            change = (current[page] - baseline[page]) / baseline[page] * 100
+            line += f"{baseline[page]:>16.1f}{change:>+9.0f}%"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Semester-sized gradebook export: Parquet dataset vs CSV.
+
+Generates ``--days`` school days of quiz and mission submissions, writes
+them through ``ResultsExporter`` (one append per class period, compacting
+finished days at each date rollover as the background writer does), then compares loading everything back into pandas from the Parquet
+dataset with ``pandas.read_csv`` on the same rows, and measures peak memory
+of the streaming CSV writer against building the CSV from a DataFrame.
+
+    python benchmarks/bench_results_export.py --days 90 --students 150
+"""
+import argparse
+import datetime
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd  # noqa: E402
+import pyarrow as pa  # noqa: E402
+
+import results_export  # noqa: E402
+
+SCENARIOS = ["🌊 Lake Erie Algal Bloom Monitor", "❄️ Lake Superior Ice Watch", "🌲 Michigan Forest Health"]
+ORBITS = ["Low Earth Orbit (LEO)", "Geostationary (GEO)", "Sun-Synchronous"]
+INSTRUMENTS = ["Multispectral Imager", "Thermal Sensor", "Radar", "Lidar"]
+CHECKS = ["atmo_q1", "atmo_q2", "ocean_q1", "ocean_q2", "land_q1", "land_q2", "ice_q1", "ice_q2"]
+
+
+def _state(student, rng):
+    return {
+        "student_id": f"student-{student}",
+        "session_id": f"{rng.getrandbits(64):016x}",
+        "xp_points": rng.randint(0, 500),
+        "achievements": ["🌟 First Steps"],
+        "completed_checks": rng.sample(CHECKS, rng.randint(0, len(CHECKS))),
+        "quiz_answers": {f"quiz_q{number}": rng.randint(0, 3) for number in range(1, 7)},
+        "quiz_short_answers": {"q7": "Cheaper tanks mean more satellites and better data. " * rng.randint(1, 4),
+                               "q8": "Thermal sensors track Lake Erie temperature for algal bloom warnings.",
+                               "mc_score": rng.randint(0, 6), "mc_total": 6},
+        "mission_data": {"name": f"Mission-{student}", "type": rng.choice(SCENARIOS), "orbit": rng.choice(ORBITS),
+                         "instruments": rng.sample(INSTRUMENTS, 2), "num_satellites": rng.randint(1, 20),
+                         "use_3d_printing": rng.random() < 0.5, "budget": "Medium ($50M)",
+                         "timeline": "Standard (3 years)", "data_priority": "Balanced"},
+    }
+
+
+def _best(function, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _peak_mb(function):
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gradebook export: Parquet vs CSV")
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--students", type=int, default=150)
+    parser.add_argument("--periods", type=int, default=5, help="appends per day")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    start_day = datetime.datetime(2026, 9, 1, 13, tzinfo=datetime.timezone.utc)
+    with tempfile.TemporaryDirectory() as directory:
+        exporter = results_export.ResultsExporter(os.path.join(directory, "submissions"))
+        started = time.perf_counter()
+        for day in range(args.days):
+            now = start_day + datetime.timedelta(days=day)
+            exporter.compact(before=now.date().isoformat())
+            for period in range(args.periods):
+                rows = [results_export.submission(kind, _state(student, rng), now)
+                        for student in range(period, args.students, args.periods) for kind in ("quiz", "mission")]
+                exporter._write_part(now.date().isoformat(), pa.Table.from_pylist(rows, schema=results_export.SCHEMA))
+        write_seconds = time.perf_counter() - started
+
+        csv_path = os.path.join(directory, "gradebook.csv")
+        with open(csv_path, "wb") as f:
+            exporter.write_csv(f)
+        rows = len(exporter.load(columns=["kind"]))
+        parquet_bytes = sum(os.path.getsize(os.path.join(root, name))
+                            for root, _, names in os.walk(exporter.directory) for name in names)
+
+        parquet_seconds = _best(exporter.load, args.repeat)
+        csv_seconds = _best(lambda: pd.read_csv(csv_path), args.repeat)
+        streaming_mb = _peak_mb(lambda: exporter.write_csv(open(os.devnull, "wb")))
+        dataframe_mb = _peak_mb(lambda: exporter.load().to_csv(io.StringIO()))
+
+        files = sum(len(names) for _, _, names in os.walk(exporter.directory))
+        print(f"{rows} submissions over {args.days} days in {files} files, written in {write_seconds:.1f} s")
+        print(f"{'':<22}{'parquet':>12}{'csv':>12}")
+        print(f"{'size MB':<22}{parquet_bytes / 1e6:>12.1f}{os.path.getsize(csv_path) / 1e6:>12.1f}")
+        print(f"{'load into pandas ms':<22}{parquet_seconds * 1000:>12.0f}{csv_seconds * 1000:>12.0f}")
+        print(f"CSV export peak Python heap (tracemalloc): streaming {streaming_mb:.1f} MB, via DataFrame {dataframe_mb:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Satellite lab cost per interaction.
+
+Times the first NDVI/albedo computation of each sample scene (memoized
+afterwards), then what a threshold or pixel change costs: one comparison,
+the share above the threshold and the three previews. Reading the scene
+into memory on every interaction is shown for comparison.
+
+    python benchmarks/bench_scene_lab.py
+"""
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def timed(function, repeat=50):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times), max(times)
+
+
+def interaction(scenes, scene, index, threshold):
+    import scene_lab
+
+    values = scenes.index(scene, index)
+    above = values > threshold
+    step = scenes.preview_step(scene)
+    scene_lab.colorize(values[::step, ::step], index)
+    scene_lab.highlight(scenes.true_color(scene), above[::step, ::step])
+    return above.mean()
+
+
+def main():
+    import scene_lab
+
+    directory = scene_lab.version_dir()
+    print(f"{'scene':<12}{'index':<8}{'first ms':>10}{'median ms':>11}{'max ms':>9}{'eager ms':>10}")
+    for scene in scene_lab.SceneSet(directory).scenes:
+        for index, settings in scene_lab.INDICES.items():
+            scenes = scene_lab.SceneSet(directory)
+            start = time.perf_counter()
+            interaction(scenes, scene, index, settings["threshold"])
+            first = (time.perf_counter() - start) * 1000
+            thresholds = iter(np.linspace(*settings["range"], 1000))
+            median, worst = timed(lambda: interaction(scenes, scene, index, next(thresholds)))
+            # the same interaction, reading the scene and recomputing the index every time
+            eager, _ = timed(lambda: interaction(scene_lab.SceneSet(directory), scene, index, settings["threshold"]))
+            print(f"{scene:<12}{index:<8}{first:>10.2f}{median:>11.2f}{worst:>9.2f}{eager:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
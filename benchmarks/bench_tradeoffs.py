@@ -0,0 +1,50 @@
+"""Trade-off explorer cost: vectorized sweep vs pricing designs one at a time.
+
+Builds the sweep for one scenario, then times a slider move (slicing the
+arrays and finding the Pareto frontier) for every printing/timeline/priority/
+budget combination, against a Python loop calling ``mission_cost`` for each
+design at one setting.
+
+    python benchmarks/bench_tradeoffs.py
+"""
+import itertools
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SCENARIO = "🌊 Great Lakes Monitoring"
+
+
+def main():
+    import tradeoffs
+
+    start = time.perf_counter()
+    sweep = tradeoffs.load_sweep(SCENARIO)
+    build = time.perf_counter() - start
+
+    settings = list(itertools.product([False, True], tradeoffs.TIMELINES, tradeoffs.PRIORITIES, tradeoffs.BUDGETS))
+    times = []
+    for setting in settings:
+        start = time.perf_counter()
+        sweep.frontier(*setting)
+        times.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    for satellites, orbit, subset in itertools.product(tradeoffs.SATELLITES, tradeoffs.ORBITS, sweep.subsets):
+        tradeoffs.mission_cost({"num_satellites": int(satellites), "orbit": orbit, "use_3d_printing": True,
+                                "instruments": [name for name, on in zip(sweep.instruments, subset) if on],
+                                "timeline": "Standard (3 years)"})
+    loop = (time.perf_counter() - start) * 1000
+
+    print(f"{sweep.cost.size} cost cells, {sweep.value.size} value cells; sweep built in {build * 1000:.0f} ms "
+          "(includes one coverage simulation per orbit)")
+    print(f"slider move (slice + Pareto frontier), {len(settings)} settings: "
+          f"median {statistics.median(times):.2f} ms, max {max(times):.2f} ms")
+    print(f"Python loop pricing the {sweep.cost[..., 0, 0].size} designs of one setting: {loop:.1f} ms (no frontier)")
+
+
+if __name__ == "__main__":
+    main()
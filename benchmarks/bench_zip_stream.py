@@ -0,0 +1,76 @@
+"""Presentation bundle memory: streaming ZIP writer vs building the archive in memory.
+
+Creates ``--mb`` of assets (half already-compressed images, half text data)
+in a temporary directory and zips them two ways:
+
+- ``in-memory``: ``zipfile`` into a ``BytesIO``, what a download button needs
+- ``streaming``: ``zip_stream.iter_zip``, chunks handed on as they are produced
+
+reporting peak Python heap (tracemalloc; memory-mapped pages are file-backed
+and not counted), time to the first output chunk and total time.
+
+    python benchmarks/bench_zip_stream.py --mb 200
+"""
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import zipfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import zip_stream  # noqa: E402
+
+
+def _make_assets(directory, megabytes):
+    files = max(2, megabytes // 25)
+    size = megabytes * 1_000_000 // files
+    line = b"lake,2026-01-01,surface_temp_c,4.2,ice_cover_pct,61.5\n"
+    for number in range(files):
+        with open(os.path.join(directory, f"asset-{number:02d}{'.png' if number % 2 else '.csv'}"), "wb") as f:
+            f.write(os.urandom(size) if number % 2 else (line * (size // len(line) + 1))[:size])
+
+
+def _in_memory(entries):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, path in entries:
+            archive.write(path, name, zipfile.ZIP_STORED if name.endswith(".png") else zipfile.ZIP_DEFLATED)
+    yield buffer.getvalue()
+
+
+def _measure(chunks):
+    tracemalloc.start()
+    start = time.perf_counter()
+    first = None
+    total = 0
+    for chunk in chunks:
+        if first is None:
+            first = time.perf_counter() - start
+        total += len(chunk)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return total, peak, first, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Streaming vs in-memory ZIP of presentation assets")
+    parser.add_argument("--mb", type=int, default=200, help="total asset size in MB")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        _make_assets(directory, args.mb)
+        entries = list(zip_stream.tree_entries(directory))
+        print(f"{len(entries)} assets, {args.mb} MB")
+        print(f"{'writer':<11}{'zip MB':>8}{'peak heap MB':>14}{'first chunk ms':>16}{'total s':>9}")
+        for name, chunks in [("in-memory", _in_memory(entries)), ("streaming", zip_stream.iter_zip(entries))]:
+            total, peak, first, elapsed = _measure(chunks)
+            print(f"{name:<11}{total / 1e6:>8.1f}{peak / 1e6:>14.1f}{first * 1000:>16.1f}{elapsed:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+"""Class-sized load test: many headless sessions walking the real lesson flow.
+
+Each simulated student is an AppTest session that clicks through the
+sidebar, answers the satellite quick checks, submits ``mission_design`` and
+waits for Professor Xavier's streamed feedback, then submits ``final_quiz``
+and asks for short-answer feedback. Feedback goes to the bundled stand-in
+server (``local_llm_server.py``), so the run is offline and repeatable.
+
+    python benchmarks/load_test.py --sessions 35
+    python benchmarks/load_test.py --sessions 35 --check            # compare with the baseline
+    python benchmarks/load_test.py --sessions 35 --update-baseline  # store a new baseline
+
+Reports rerun latency percentiles, memory per session (process RSS growth,
+which includes AppTest's own element trees, plus the pickled session_state)
+and throughput.
+Baselines live in ``benchmarks/baselines/`` keyed by session count; ``--check``
+exits non-zero when a tracked number is worse than the baseline by more than
+``--tolerance``.
+"""
+import argparse
+import collections
+import json
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+BASELINE_PATH = os.path.join(BENCH_DIR, "baselines", "load_test.json")
+sys.path.insert(0, REPO_ROOT)
+
+import content_store  # noqa: E402
+import item_bank  # noqa: E402
+import rerun_profiler  # noqa: E402
+
+# Lower is better for every tracked number, so throughput is tracked as seconds_per_flow.
+TRACKED = ["rerun_p50_ms", "rerun_p95_ms", "rerun_p99_ms", "feedback_p95_s", "memory_per_session_kb",
+           "seconds_per_flow"]
+
+# What a simulated student picks, read from the lesson content so edits to it can't break the flow
+Answers = collections.namedtuple("Answers", "checks instruments quiz")
+
+
+def lesson_answers():
+    """Correct quick-check options, the first scenario's recommended instruments and the quiz key."""
+    checks = item_bank.load_bank("checks")
+    quiz = item_bank.load_bank("quiz")
+    scenario = next(iter(content_store.load_page("design_challenge")["scenarios"].values()))
+    return Answers(
+        checks={item["id"]: item["options"][item["answer"]] for item in checks.items},
+        instruments=scenario["recommended_instruments"][:2],
+        quiz=[(item["id"], item["options"], item["answer"]) for item in quiz.items],
+    )
+
+
+def _rss_bytes():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _percentile(data, pct):
+    data = sorted(data)
+    if not data:
+        return None
+    return data[min(len(data) - 1, max(0, round(pct / 100 * (len(data) - 1))))]
+
+
+class SimulatedStudent:
+    """One AppTest session; ``latencies`` collects the wall time of every rerun.
+
+    ``walk`` is a generator that yields after each rerun, so a single thread
+    can interleave many students the way one Streamlit server process does.
+    AppTest itself is not thread-safe, so sessions never run in parallel.
+    """
+
+    def __init__(self, number, timeout):
+        from streamlit.testing.v1 import AppTest
+
+        self.number = number
+        self.at = AppTest.from_file(os.path.join(REPO_ROOT, "app.py"), default_timeout=timeout)
+        self.latencies = []
+        self.feedback_seconds = None
+        self.state_bytes = None
+        self.errors = []
+
+    def run(self, element=None):
+        start = time.perf_counter()
+        (element or self.at).run()
+        self.latencies.append(time.perf_counter() - start)
+        if self.at.exception:
+            self.errors.append(self.at.exception[0].message)
+
+    def sidebar_button(self, text):
+        return next(b for b in self.at.sidebar.button if text in b.label)
+
+    def button(self, text):
+        return next(b for b in self.at.button if text in b.label)
+
+    def walk(self, feedback_wait, answers):
+        self.run()
+        yield
+        for label in [b.label for b in self.at.sidebar.button]:
+            self.run(self.sidebar_button(label).click())
+            yield
+
+        self.run(self.sidebar_button("Satellites").click())
+        yield
+        on_page = {radio.key for radio in self.at.radio}
+        for key, answer in answers.checks.items():
+            if key not in on_page:
+                continue
+            self.at.radio(key=key).set_value(answer)
+            self.run(self.at.button(key=f"check_{key}").click())
+            yield
+
+        self.run(self.sidebar_button("Design Challenge").click())
+        yield
+        self.at.text_input[0].input(f"GreatLakes-Watch-{self.number}")
+        self.at.text_area[0].input(f"Track algal blooms in Lake Erie for class team {self.number}")
+        for instrument in answers.instruments:
+            self.at.multiselect[0].select(instrument)
+        self.run(self.button("Submit Mission Design").click())
+        yield
+        self.run(self.button("Get Feedback from Professor Xavier").click())
+        start = time.perf_counter()
+        while time.perf_counter() - start < feedback_wait:
+            job = self.at.session_state["mission_feedback_job"]
+            if job is None or job.done:
+                break
+            yield "waiting"
+        self.feedback_seconds = time.perf_counter() - start
+        self.run()
+        yield
+
+        self.run(self.sidebar_button("Quiz").click())
+        yield
+        # Mostly right, with a different miss pattern per student
+        for position, (key, options, answer) in enumerate(answers.quiz):
+            choice = answer if (self.number + position) % 4 else (answer + 1) % len(options)
+            self.at.radio(key=key).set_value(options[choice])
+        self.at.text_area(key="quiz_q7").input("Cheaper tanks mean more satellites, more data and better science.")
+        self.at.text_area(key="quiz_q8").input(f"Thermal sensors track Lake Erie temperature; student {self.number}.")
+        self.run(self.button("Submit Quiz").click())
+        yield
+        self.run(self.button("Get Professor Xavier's Feedback on Short Answers").click())
+        self.state_bytes = rerun_profiler.state_size(self.at.session_state)
+
+
+def run_load_test(sessions, feedback_wait, timeout):
+    """Interleave ``sessions`` students round-robin until every flow has finished."""
+    answers = lesson_answers()
+    warmup = SimulatedStudent(-1, timeout)
+    for _ in warmup.walk(0, answers):
+        pass
+    rss_before = _rss_bytes()
+
+    students = [SimulatedStudent(number, timeout) for number in range(sessions)]
+    active = {student: student.walk(feedback_wait, answers) for student in students}
+    started = time.perf_counter()
+    while active:
+        all_waiting = True
+        for student, flow in list(active.items()):
+            try:
+                if next(flow) != "waiting":
+                    all_waiting = False
+            except StopIteration:
+                del active[student]
+            except Exception as e:
+                student.errors.append(f"{type(e).__name__}: {e}")
+                del active[student]
+        if all_waiting:
+            time.sleep(0.05)
+    elapsed = time.perf_counter() - started
+    rss_after = _rss_bytes()
+
+    latencies = [seconds for student in students for seconds in student.latencies]
+    feedback = [s.feedback_seconds for s in students if s.feedback_seconds is not None]
+    state_sizes = [s.state_bytes for s in students if s.state_bytes is not None]
+    errors = [error for student in students for error in student.errors]
+    return {
+        "sessions": sessions,
+        "reruns": len(latencies),
+        "errors": len(errors),
+        "first_errors": errors[:5],
+        "elapsed_s": round(elapsed, 2),
+        "reruns_per_s": round(len(latencies) / elapsed, 2),
+        "seconds_per_flow": round(elapsed / sessions, 3),
+        "rerun_p50_ms": round(_percentile(latencies, 50) * 1000, 1),
+        "rerun_p95_ms": round(_percentile(latencies, 95) * 1000, 1),
+        "rerun_p99_ms": round(_percentile(latencies, 99) * 1000, 1),
+        "feedback_p95_s": round(_percentile(feedback, 95), 2) if feedback else None,
+        "memory_per_session_kb": round((rss_after - rss_before) / sessions / 1024, 1),
+        "session_state_kb": round(sum(state_sizes) / len(state_sizes) / 1024, 2) if state_sizes else None,
+    }
+
+
+def compare(result, baseline, tolerance):
+    """Return (name, baseline, current) for every tracked number that regressed."""
+    regressions = []
+    for name in TRACKED:
+        old, new = baseline.get(name), result.get(name)
+        if old is None or new is None or old <= 0:
+            continue
+        if new > old * (1 + tolerance):
+            regressions.append((name, old, new))
+    return regressions
+
+
+def _load_baselines():
+    if not os.path.exists(BASELINE_PATH):
+        return {}
+    with open(BASELINE_PATH) as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless class-sized load test of app.py")
+    parser.add_argument("--sessions", type=int, default=35)
+    parser.add_argument("--llm-latency", type=float, default=0.5, help="stand-in seconds before the first byte")
+    parser.add_argument("--llm-chunks-per-second", type=float, default=80.0)
+    parser.add_argument("--feedback-wait", type=float, default=120.0, help="max seconds to wait for feedback")
+    parser.add_argument("--timeout", type=float, default=120.0, help="AppTest timeout per rerun")
+    parser.add_argument("--check", action="store_true", help="fail if worse than the stored baseline")
+    parser.add_argument("--update-baseline", action="store_true", help="store this run as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed regression, as a fraction")
+    args = parser.parse_args()
+
+    import local_llm_server
+
+    server = local_llm_server.start_server(
+        local_llm_server.StandInConfig(latency=args.llm_latency, jitter=args.llm_latency / 4,
+                                       chunks_per_second=args.llm_chunks_per_second, words=150, seed=1),
+        port=0,
+    )
+    os.environ["FEEDBACK_BACKEND"] = "local"
+    os.environ["FEEDBACK_BACKEND_URL"] = f"http://127.0.0.1:{server.server_address[1]}/v1/messages"
+    os.environ.setdefault("FEEDBACK_CACHE_PATH", os.path.join(tempfile.mkdtemp(), "feedback_cache.sqlite3"))
+    os.environ.setdefault("RERUN_TRACE_DIR", tempfile.mkdtemp())
+
+    result = run_load_test(args.sessions, args.feedback_wait, args.timeout)
+    server.shutdown()
+    result["machine"] = f"{platform.machine()} {os.cpu_count()} cpu, Python {platform.python_version()}"
+    print(json.dumps(result, indent=2))
+
+    key = str(args.sessions)
+    baselines = _load_baselines()
+    status = 0
+    if result["errors"]:
+        print(f"{result['errors']} session errors", file=sys.stderr)
+        status = 1
+    if args.check:
+        if key not in baselines:
+            print(f"no stored baseline for {key} sessions", file=sys.stderr)
+            status = 1
+        else:
+            for name, old, new in compare(result, baselines[key], args.tolerance):
+                print(f"REGRESSION {name}: {old} -> {new}", file=sys.stderr)
+                status = 1
+    if args.update_baseline:
+        baselines[key] = {name: result[name] for name in TRACKED + ["machine"]}
+        os.makedirs(os.path.dirname(BASELINE_PATH), exist_ok=True)
+        with open(BASELINE_PATH, "w") as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+            f.write("\n")
+    sys.exit(status)
+
+
+if __name__ == "__main__":
+    main()
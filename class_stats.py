@@ -0,0 +1,155 @@
+"""Class-wide aggregates for the teacher dashboard, kept up to date incrementally.
+
+Every saved student (see ``progress_store``) contributes a handful of
+weighted "facts": their quiz score, each question they missed, their rank
+badge, and the orbit and instruments they picked for their mission scenario.
+The running totals are one pandas Series indexed by (metric, group, value).
+
+``refresh`` only reads students saved since the previous call. For each of
+them the facts counted last time are added again with weight -1 and the new
+ones with weight +1, and that small delta frame is folded into the totals
+with one ``groupby().sum()``. The cost of a refresh therefore depends on how
+many students changed, not on how many class periods are stored.
+"""
+import threading
+
+import numpy as np
+import pandas as pd
+
+import item_bank
+import progress_store
+from ranks import LEVELS, level_for
+
+FACT_COLUMNS = ["metric", "group", "value"]
+
+
+def student_facts(data, grades=None):
+    """(metric, group, value) facts for one stored progress snapshot.
+
+    ``grades`` is this student's row from a batch ``ItemBank.grade`` call, as
+    (score, correct flags), when they have submitted the final quiz.
+    """
+    facts = [("badge", "", level_for(data.get("xp_points", 0)))]
+    if grades is not None:
+        score, correct = grades
+        facts.append(("quiz", "", "submitted"))
+        facts.append(("score", "", int(score)))
+        facts += [("miss", "", item_id) for item_id, ok in zip(item_bank.load_bank("quiz").ids, correct) if not ok]
+    mission = data.get("mission_data")
+    if mission:
+        scenario = mission.get("type", "")
+        facts.append(("mission", scenario, ""))
+        facts.append(("orbit", scenario, mission.get("orbit", "")))
+        facts += [("instrument", scenario, instrument) for instrument in mission.get("instruments", [])]
+    return facts
+
+
+class ClassStats:
+    """Running class totals fed from a ``ProgressStore``."""
+
+    def __init__(self, store):
+        self.store = store
+        self._lock = threading.Lock()
+        self._cursor = 0.0
+        self._facts = {}
+        self._seen = {}
+        self._counts = pd.Series(dtype="int64", index=pd.MultiIndex.from_tuples([], names=FACT_COLUMNS))
+        self._xp = pd.Series(dtype="int64")
+        self.refreshes = 0
+        self.students_processed = 0
+
+    def refresh(self):
+        """Fold in every student saved since the last call; returns how many were processed."""
+        with self._lock:
+            rows, self._cursor = self.store.changed_since(self._cursor)
+            updated_at = {student_id: saved_at for student_id, (_, saved_at) in rows.items()
+                          if self._seen.get(student_id) != saved_at}
+            changed = {student_id: rows[student_id][0] for student_id in updated_at}
+            if not changed:
+                return 0
+            bank = item_bank.load_bank("quiz")
+            quiz_takers = [student_id for student_id, data in changed.items() if data.get("quiz_answers")]
+            graded = {}
+            if quiz_takers:
+                grades = bank.grade(bank.matrix([changed[student_id]["quiz_answers"] for student_id in quiz_takers]))
+                graded = {student_id: (grades["score"][row], grades["correct"][row])
+                          for row, student_id in enumerate(quiz_takers)}
+
+            delta = []
+            for student_id, data in changed.items():
+                delta += [(*fact, -1) for fact in self._facts.get(student_id, [])]
+                facts = student_facts(data, graded.get(student_id))
+                delta += [(*fact, 1) for fact in facts]
+                self._facts[student_id] = facts
+                self._seen[student_id] = updated_at[student_id]
+            delta = pd.DataFrame(delta, columns=FACT_COLUMNS + ["weight"]).astype({"value": str})
+            totals = self._counts.add(delta.groupby(FACT_COLUMNS)["weight"].sum(), fill_value=0)
+            self._counts = totals[totals != 0].astype("int64")
+
+            xp = pd.Series({student_id: data.get("xp_points", 0) for student_id, data in changed.items()},
+                           dtype="int64")
+            self._xp = pd.concat([self._xp.drop(xp.index, errors="ignore"), xp])
+            self.refreshes += 1
+            self.students_processed += len(changed)
+            return len(changed)
+
+    def _metric(self, metric):
+        if metric not in self._counts.index.get_level_values("metric"):
+            return pd.Series(dtype="int64", index=pd.MultiIndex.from_tuples([], names=["group", "value"]))
+        return self._counts.xs(metric, level="metric")
+
+    def students(self):
+        return len(self._xp)
+
+    def quizzes_submitted(self):
+        submitted = self._metric("quiz")
+        return int(submitted.sum()) if len(submitted) else 0
+
+    def score_distribution(self):
+        """Students per final-quiz score, including empty scores."""
+        total = len(item_bank.load_bank("quiz"))
+        scores = self._metric("score").droplevel("group")
+        scores.index = scores.index.astype(int)
+        return scores.reindex(range(total + 1), fill_value=0).rename_axis("score").rename("students")
+
+    def miss_rates(self):
+        """Misses and miss rate per quiz question, hardest first."""
+        ids = item_bank.load_bank("quiz").ids
+        misses = self._metric("miss").droplevel("group").reindex(ids, fill_value=0)
+        submitted = self.quizzes_submitted()
+        frame = pd.DataFrame({"question": ids, "missed": misses.to_numpy()})
+        frame["miss rate"] = (frame["missed"] / submitted).round(2) if submitted else 0.0
+        return frame.sort_values("missed", ascending=False, kind="stable")
+
+    def xp_percentiles(self, percentiles=(25, 50, 75, 90)):
+        if self._xp.empty:
+            return {}
+        values = np.percentile(self._xp.to_numpy(), percentiles)
+        return {f"p{pct}": float(value) for pct, value in zip(percentiles, values)}
+
+    def badges(self):
+        """Students per rank badge, lowest rank first."""
+        names = [name for _, name in reversed(LEVELS)]
+        return self._metric("badge").droplevel("group").reindex(names, fill_value=0).rename("students")
+
+    def mission_choices(self):
+        """Most-chosen orbit and instrument per mission scenario."""
+        missions = self._metric("mission")
+        if missions.empty:
+            return pd.DataFrame(columns=["scenario", "missions", "top orbit", "top instrument"])
+        rows = []
+        for scenario, count in missions.droplevel("value").items():
+            rows.append({"scenario": scenario, "missions": int(count),
+                         "top orbit": self._top("orbit", scenario),
+                         "top instrument": self._top("instrument", scenario)})
+        return pd.DataFrame(rows).sort_values("missions", ascending=False, kind="stable")
+
+    def _top(self, metric, scenario):
+        choices = self._metric(metric)
+        if scenario not in choices.index.get_level_values("group"):
+            return "—"
+        picks = choices.xs(scenario, level="group")
+        return f"{picks.idxmax()} ({int(picks.max())})"
+
+
+stats = ClassStats(progress_store.store)
@@ -0,0 +1,127 @@
+"""Lesson text, check questions, quiz items and scenarios loaded from ``content/``.
+
+The words on each page live in ``content/pages/<page>.json`` instead of
+string literals in the page modules, so a rerun no longer rebuilds them and
+a new page can be added by dropping in a JSON file and listing it in
+``content/lesson.json``. Files are read and compiled once per process:
+
+- multi-line text is stored as a list of lines and joined here, already
+  dedented, so Streamlit's own text cleanup has nothing left to do
+- ``table`` blocks become DataFrames and check questions get their correct
+  option resolved
+- check IDs and achievements are looked up in ``progress_bits`` and each
+  ``requires`` list becomes a bitmask
+- unknown block types are rejected at load time instead of mid-render
+
+Markdown is still turned into HTML in the browser: Streamlit sends the
+markdown source to the frontend, so there is no server-side rendering step
+to move ahead of time.
+"""
+import json
+import os
+
+import pandas as pd
+import streamlit as st
+
+import progress_bits
+
+CONTENT_DIR = os.environ.get(
+    "LESSON_CONTENT_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "content"))
+
+TEXT_BLOCKS = ("markdown", "html", "info", "success", "warning", "error", "caption")
+BLOCK_TYPES = TEXT_BLOCKS + ("divider", "metric", "table", "columns", "tabs", "expander", "reveal",
+                             "check", "bonus", "slot")
+
+
+class ContentError(Exception):
+    """A content file is missing or holds something the renderer does not understand."""
+
+
+def text(value):
+    """Join a list of lines into one string; plain strings pass through."""
+    return "\n".join(value) if isinstance(value, list) else value
+
+
+def _compile_check(check, source):
+    check = dict(check)
+    try:
+        check["correct_option"] = check["options"][check["answer"]]
+    except (KeyError, IndexError, TypeError):
+        raise ContentError(f"{source}: check {check.get('key')!r} needs options and a valid answer index")
+    check.setdefault("button_key", f"check_{check['key']}")
+    check.setdefault("check_id", check["key"])
+    _registered(progress_bits.CHECKS, [check["check_id"]], source)
+    if check.get("achievement"):
+        check["achievement"] = _compile_unlock(check["achievement"], source)
+    return check
+
+
+def _compile_unlock(unlock, source):
+    """Resolve an achievement's ``requires`` list to a check bitmask."""
+    _registered(progress_bits.ACHIEVEMENTS, [unlock["name"]], source)
+    return dict(unlock, requires_mask=_registered(progress_bits.CHECKS, unlock["requires"], source))
+
+
+def _registered(registry, names, source):
+    try:
+        return registry.mask(names)
+    except KeyError as e:
+        raise ContentError(f"{source}: {e.args[0]}")
+
+
+def _compile_block(block, source):
+    kind = next((name for name in BLOCK_TYPES if name in block), None)
+    if kind is None:
+        raise ContentError(f"{source}: unknown block with keys {sorted(block)}")
+    block = dict(block, type=kind)
+    if kind in TEXT_BLOCKS:
+        block[kind] = text(block[kind])
+    elif kind == "table":
+        block["table"] = pd.DataFrame(block["table"])
+    elif kind == "check":
+        block["check"] = _compile_check(block["check"], source)
+    elif kind == "bonus":
+        block["bonus"] = dict(_compile_unlock(block["bonus"], source), message=text(block["bonus"]["message"]))
+        _registered(progress_bits.CHECKS, [block["bonus"]["check_id"]], source)
+    if kind in ("columns", "tabs"):
+        block["blocks"] = [compile_blocks(children, source) for children in block["blocks"]]
+    elif "blocks" in block:
+        block["blocks"] = compile_blocks(block["blocks"], source)
+    return block
+
+
+def compile_blocks(blocks, source="content"):
+    """Validate and precompute a list of content blocks."""
+    return [_compile_block(block, source) for block in blocks]
+
+
+def _read(relative_path):
+    path = os.path.join(CONTENT_DIR, relative_path)
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        raise ContentError(f"missing content file {path}")
+
+
+@st.cache_resource(show_spinner=False)
+def load(name):
+    """Return ``content/<name>.json`` as plain data."""
+    return _read(f"{name}.json")
+
+
+@st.cache_resource(show_spinner=False)
+def load_page(page):
+    """Return ``content/pages/<page>.json`` with its block lists compiled."""
+    source = f"pages/{page}.json"
+    content = _read(source)
+    if "blocks" in content:
+        content["blocks"] = compile_blocks(content["blocks"], source)
+    content["sections"] = {
+        name: compile_blocks(blocks, source) for name, blocks in content.get("sections", {}).items()
+    }
+    return content
+
+
+def has_page(page):
+    return os.path.exists(os.path.join(CONTENT_DIR, "pages", f"{page}.json"))
@@ -0,0 +1,150 @@
+"""Scenario match score for design-challenge submissions, as table lookups.
+
+A design is rated 0-100 against its scenario's recommendations:
+
+- orbit (35 points): the recommended orbit, or half credit for one in the
+  same altitude band (LEO and polar are both low, MEO and GEO both high)
+- instruments (40 points): overlap between the chosen and recommended
+  instrument sets (intersection over union)
+- budget fit (25 points): full marks when the ``tradeoffs`` cost estimate is
+  within the chosen budget, shrinking as cap / cost when it is over
+
+Every option is discrete, so ``DesignScorer`` computes the whole table once
+per process, one score per scenario x satellites x orbit x instrument set x
+printing x timeline x budget (about 370,000 cells). Scoring a design is then
+one array index, live in the page or vectorized over every saved design:
+
+    python design_score.py
+"""
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+import content_store
+import orbit_sim
+import tradeoffs
+
+WEIGHTS = {"orbit": 35, "instruments": 40, "budget": 25}
+LOW_ORBIT_KM = 2000
+SAME_BAND_CREDIT = 0.5
+
+Score = namedtuple("Score", ["total", "orbit", "instruments", "budget"])
+
+
+def orbit_credit(chosen, recommended):
+    if chosen == recommended:
+        return 1.0
+    low = [orbit_sim.ORBITS[orbit][0] < LOW_ORBIT_KM for orbit in (chosen, recommended)]
+    return SAME_BAND_CREDIT if low[0] == low[1] else 0.0
+
+
+class DesignScorer:
+    """Precomputed score tables for every scenario and option combination."""
+
+    def __init__(self, scenarios, instruments):
+        self.scenarios = list(scenarios)
+        self.instruments = list(instruments)
+        subsets, cost = tradeoffs.cost_grid(self.instruments)
+        counts = subsets.sum(axis=1)
+
+        # (scenario, orbit) and (scenario, instrument subset) component tables, 0..1
+        self.orbit = np.array([[orbit_credit(orbit, scenario["recommended_orbit"]) for orbit in tradeoffs.ORBITS]
+                               for scenario in scenarios.values()])
+        recommended = np.array([[tradeoffs.recommended(name, scenario["recommended_instruments"])
+                                 for name in self.instruments] for scenario in scenarios.values()])
+        overlap = subsets.astype(np.int64) @ recommended.T.astype(np.int64)  # (subset, scenario)
+        union = counts[:, None] + recommended.sum(axis=1)[None, :] - overlap
+        self.instrument = (overlap / np.maximum(union, 1)).T
+
+        # (satellites, orbit, subset, printing, timeline, budget), independent of the scenario
+        caps = np.array(list(tradeoffs.BUDGETS.values()), dtype=np.float64)
+        self.budget = np.minimum(1.0, caps / cost[..., None])
+
+        self.total = (
+            WEIGHTS["orbit"] * self.orbit[:, None, :, None, None, None, None]
+            + WEIGHTS["instruments"] * self.instrument[:, None, None, :, None, None, None]
+            + WEIGHTS["budget"] * self.budget[None]
+        ).astype(np.float32)
+
+        self._positions = {
+            "scenario": {name: position for position, name in enumerate(self.scenarios)},
+            "orbit": {name: position for position, name in enumerate(tradeoffs.ORBITS)},
+            "instrument": {name: 1 << position for position, name in enumerate(self.instruments)},
+            "timeline": {name: position for position, name in enumerate(tradeoffs.TIMELINES)},
+            "budget": {name: position for position, name in enumerate(tradeoffs.BUDGETS)},
+        }
+
+    def index(self, mission):
+        """Table index of a ``mission_data`` design, or None for options the tables don't know."""
+        try:
+            index = (
+                self._positions["scenario"][mission["type"]],
+                int(mission["num_satellites"]) - int(tradeoffs.SATELLITES[0]),
+                self._positions["orbit"][mission["orbit"]],
+                sum(self._positions["instrument"][name] for name in mission.get("instruments") or []),
+                int(bool(mission.get("use_3d_printing"))),
+                self._positions["timeline"][mission.get("timeline", "Standard (3 years)")],
+                self._positions["budget"][mission.get("budget", "Medium ($50M)")],
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+        return index if 0 <= index[1] < len(tradeoffs.SATELLITES) else None
+
+    def score(self, mission):
+        """``Score`` in points for one design, or None if it can't be scored."""
+        index = self.index(mission)
+        if index is None:
+            return None
+        scenario, satellites, orbit, subset, printing, timeline, budget = index
+        return Score(
+            total=float(self.total[index]),
+            orbit=WEIGHTS["orbit"] * float(self.orbit[scenario, orbit]),
+            instruments=WEIGHTS["instruments"] * float(self.instrument[scenario, subset]),
+            budget=WEIGHTS["budget"] * float(self.budget[satellites, orbit, subset, printing, timeline, budget]),
+        )
+
+    def score_many(self, missions):
+        """Total score per design as a float array (NaN where a design can't be scored)."""
+        indexes = [self.index(mission) for mission in missions]
+        valid = np.array([index is not None for index in indexes], dtype=bool)
+        scores = np.full(len(indexes), np.nan)
+        if valid.any():
+            columns = np.array([index for index in indexes if index is not None]).T
+            scores[valid] = self.total[tuple(columns)]
+        return scores
+
+
+@st.cache_resource(show_spinner=False)
+def load_scorer():
+    """Score tables for the design-challenge scenarios, built once per process."""
+    content = content_store.load_page("design_challenge")
+    return DesignScorer(content["scenarios"], content["instruments"])
+
+
+def saved_scores(store):
+    """Scenario match of every saved mission design, one row per student."""
+    rows = [(student_id, data["mission_data"]) for student_id, data in store.snapshots().items()
+            if data.get("mission_data")]
+    scores = load_scorer().score_many([mission for _, mission in rows])
+    return pd.DataFrame({
+        "student_id": [student_id for student_id, _ in rows],
+        "scenario": [mission.get("type") for _, mission in rows],
+        "score": scores,
+    })
+
+
+def main():
+    import progress_store
+
+    scores = saved_scores(progress_store.store)
+    if scores.empty:
+        print("no saved mission designs")
+        return
+    summary = scores.groupby("scenario")["score"].describe()[["count", "mean", "min", "50%", "max"]]
+    print(summary.round(1).to_string())
+
+
+if __name__ == "__main__":
+    main()
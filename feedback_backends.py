@@ -0,0 +1,198 @@
+"""Pluggable providers that produce Professor Xavier feedback text.
+
+Both feedback paths talk to a FeedbackBackend instead of calling the hosted
+API directly, so the same code can run against the bundled stand-in server
+(``local_llm_server.py``) in air-gapped CI and load tests. Credentials and
+model choices come from the environment or ``.streamlit/secrets.toml`` and
+never from the source.
+
+Providers:
+
+- ``anthropic``: the hosted messages API, authenticated with
+  ``ANTHROPIC_API_KEY``
+- ``local``: the stand-in server at ``FEEDBACK_BACKEND_URL``
+  (default ``http://127.0.0.1:8787/v1/messages``)
+
+Each feature has its own settings, so short-answer feedback can go to a
+faster model than mission review. For a feature ``mission_review`` or
+``short_answer`` the settings are read from ``FEEDBACK_<FEATURE>_PROVIDER``,
+``_MODEL``, ``_MAX_TOKENS`` and ``_TIMEOUT``. ``FEEDBACK_BACKEND`` sets the
+default provider for every feature.
+
+Every call records ``llm.<provider>.latency``, ``llm.<provider>.input_tokens``
+and ``llm.<provider>.output_tokens`` in ``metrics``.
+"""
+import json
+import os
+import time
+from collections import namedtuple
+
+import llm_client
+import metrics
+
+FeatureSettings = namedtuple("FeatureSettings", ["provider", "model", "max_tokens", "timeout"])
+
+FEATURE_DEFAULTS = {
+    "mission_review": FeatureSettings("anthropic", "claude-sonnet-4-20250514", 2000, 60),
+    "short_answer": FeatureSettings("anthropic", "claude-sonnet-4-20250514", 2000, 60),
+}
+
+
+class BackendHTTPError(Exception):
+    """The backend answered with a non-200 status."""
+
+    def __init__(self, status_code, retry_after=None):
+        super().__init__(f"feedback backend returned HTTP {status_code}")
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class MissingCredentials(Exception):
+    """No API key is configured for a provider that needs one."""
+
+
+def _setting(name, default=None):
+    """Read ``name`` from the environment, then from Streamlit secrets."""
+    if name in os.environ:
+        return os.environ[name]
+    try:
+        import streamlit as st
+        return st.secrets.get(name, default)
+    except Exception:
+        return default
+
+
+class FeedbackBackend:
+    """Interface every feedback provider implements."""
+
+    name = "base"
+
+    def stream_text(self, prompt, settings):
+        """Yield the feedback text in pieces as it is produced."""
+        raise NotImplementedError
+
+    def complete(self, prompt, settings):
+        """Return the whole feedback text at once."""
+        raise NotImplementedError
+
+
+class MessagesAPIBackend(FeedbackBackend):
+    """Any server that speaks the Anthropic ``/v1/messages`` protocol."""
+
+    def __init__(self, name, url, api_key=None, requires_key=True):
+        self.name = name
+        self.url = url
+        self.api_key = api_key
+        self.requires_key = requires_key
+
+    def _payload(self, prompt, settings, stream):
+        if self.requires_key and not self.api_key:
+            raise MissingCredentials(f"no API key configured for the {self.name!r} provider")
+        payload = {
+            "model": settings.model,
+            "max_tokens": settings.max_tokens,
+            "messages": [{"role": "user", "content": prompt}]
+        }
+        if stream:
+            payload["stream"] = True
+        return payload
+
+    def _record(self, start, usage):
+        metrics.record(f"llm.{self.name}.latency", time.perf_counter() - start)
+        for field in ("input_tokens", "output_tokens"):
+            if field in usage:
+                metrics.record(f"llm.{self.name}.{field}", usage[field])
+
+    def stream_text(self, prompt, settings):
+        payload = self._payload(prompt, settings, stream=True)
+        start = time.perf_counter()
+        usage = {}
+        with llm_client.message_request(payload, self.api_key or "", stream=True,
+                                        timeout=settings.timeout, url=self.url) as response:
+            _raise_for_status(response)
+            yield from iter_text_deltas(response.iter_lines(decode_unicode=True), usage)
+        self._record(start, usage)
+
+    def complete(self, prompt, settings):
+        payload = self._payload(prompt, settings, stream=False)
+        start = time.perf_counter()
+        response = llm_client.post_message(payload, self.api_key or "", timeout=settings.timeout, url=self.url)
+        _raise_for_status(response)
+        data = response.json()
+        self._record(start, data.get("usage", {}))
+        return data["content"][0]["text"]
+
+
+def _raise_for_status(response):
+    if response.status_code == 200:
+        return
+    try:
+        retry_after = float(response.headers.get("retry-after", ""))
+    except ValueError:
+        retry_after = None
+    raise BackendHTTPError(response.status_code, retry_after)
+
+
+def iter_text_deltas(lines, usage=None):
+    """Yield the text of each ``content_block_delta`` event in an SSE stream.
+
+    Token counts from ``message_start`` and ``message_delta`` are copied into
+    ``usage`` when a dict is given.
+    """
+    if usage is None:
+        usage = {}
+    for line in lines:
+        if not line or not line.startswith("data:"):
+            continue
+        event = json.loads(line[len("data:"):].strip())
+        if event.get("type") == "content_block_delta":
+            text = event.get("delta", {}).get("text")
+            if text:
+                yield text
+        elif event.get("type") == "message_start":
+            usage.update(event.get("message", {}).get("usage", {}))
+        elif event.get("type") == "message_delta":
+            usage.update(event.get("usage", {}))
+        elif event.get("type") == "error":
+            raise RuntimeError(event.get("error", {}).get("message", "stream error"))
+
+
+BACKENDS = {
+    "anthropic": lambda: MessagesAPIBackend(
+        "anthropic", llm_client.API_URL, api_key=_setting("ANTHROPIC_API_KEY")),
+    "local": lambda: MessagesAPIBackend(
+        "local", _setting("FEEDBACK_BACKEND_URL", "http://127.0.0.1:8787/v1/messages"), requires_key=False),
+}
+
+_backends = {}
+
+
+def get_backend(name):
+    """Return the provider called ``name``, built on first use."""
+    if name not in _backends:
+        if name not in BACKENDS:
+            raise ValueError(f"unknown feedback provider {name!r}; expected one of {sorted(BACKENDS)}")
+        _backends[name] = BACKENDS[name]()
+    return _backends[name]
+
+
+def feature_settings(feature):
+    """Resolve provider, model, token budget and timeout for ``feature``."""
+    defaults = FEATURE_DEFAULTS[feature]
+    prefix = f"FEEDBACK_{feature.upper()}_"
+    return FeatureSettings(
+        provider=_setting(prefix + "PROVIDER") or _setting("FEEDBACK_BACKEND") or defaults.provider,
+        model=_setting(prefix + "MODEL") or defaults.model,
+        max_tokens=int(_setting(prefix + "MAX_TOKENS") or defaults.max_tokens),
+        timeout=float(_setting(prefix + "TIMEOUT") or defaults.timeout),
+    )
+
+
+def stream_feedback(prompt, settings):
+    """Yield feedback text for ``prompt`` from the provider in ``settings``."""
+    return get_backend(settings.provider).stream_text(prompt, settings)
+
+
+def complete_feedback(prompt, settings):
+    """Return feedback text for ``prompt`` from the provider in ``settings``."""
+    return get_backend(settings.provider).complete(prompt, settings)
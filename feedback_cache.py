@@ -0,0 +1,95 @@
+"""Persistent cache of Professor Xavier feedback keyed by prompt content.
+
+Most mission designs are built from the same handful of dropdown options,
+so identical prompts come up again and again across a class. Responses are
+stored in a local SQLite file under a hash of the normalized prompt, expire
+after ``TTL_SECONDS`` and are evicted least-recently-used first once the
+cache holds more than ``MAX_ENTRIES`` rows.
+"""
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+
+CACHE_PATH = os.environ.get(
+    "FEEDBACK_CACHE_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "feedback_cache.sqlite3"),
+)
+TTL_SECONDS = 7 * 24 * 60 * 60
+MAX_ENTRIES = 500
+
+_lock = threading.Lock()
+_conn = None
+_hits = 0
+_misses = 0
+
+
+def cache_key(prompt, model):
+    """Hash the prompt with runs of whitespace collapsed, so formatting noise still hits."""
+    normalized = re.sub(r"\s+", " ", prompt).strip()
+    return hashlib.sha256(f"{model}\n{normalized}".encode("utf-8")).hexdigest()
+
+
+def _connection():
+    global _conn
+    if _conn is None:
+        os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+        _conn = sqlite3.connect(CACHE_PATH, check_same_thread=False, timeout=5)
+        _conn.execute(
+            "CREATE TABLE IF NOT EXISTS feedback ("
+            " key TEXT PRIMARY KEY,"
+            " response TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " last_used REAL NOT NULL)"
+        )
+        _conn.execute("CREATE INDEX IF NOT EXISTS feedback_last_used ON feedback (last_used)")
+        _conn.commit()
+    return _conn
+
+
+def get(prompt, model):
+    """Return the cached feedback for ``prompt`` or None, counting the hit or miss."""
+    global _hits, _misses
+    key = cache_key(prompt, model)
+    now = time.time()
+    with _lock:
+        conn = _connection()
+        row = conn.execute(
+            "SELECT response FROM feedback WHERE key = ? AND created_at > ?",
+            (key, now - TTL_SECONDS),
+        ).fetchone()
+        if row is None:
+            _misses += 1
+            return None
+        conn.execute("UPDATE feedback SET last_used = ? WHERE key = ?", (now, key))
+        conn.commit()
+        _hits += 1
+        return row[0]
+
+
+def put(prompt, model, response):
+    """Store ``response`` for ``prompt`` and trim expired and least-recently-used rows."""
+    key = cache_key(prompt, model)
+    now = time.time()
+    with _lock:
+        conn = _connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO feedback (key, response, created_at, last_used) VALUES (?, ?, ?, ?)",
+            (key, response, now, now),
+        )
+        conn.execute("DELETE FROM feedback WHERE created_at <= ?", (now - TTL_SECONDS,))
+        conn.execute(
+            "DELETE FROM feedback WHERE key IN ("
+            " SELECT key FROM feedback ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (MAX_ENTRIES,),
+        )
+        conn.commit()
+
+
+def stats():
+    """Hit and miss counts for this server process plus the number of stored responses."""
+    with _lock:
+        entries = _connection().execute("SELECT COUNT(*) FROM feedback").fetchone()[0]
+        return {"hits": _hits, "misses": _misses, "entries": entries}
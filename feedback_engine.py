@@ -0,0 +1,154 @@
+"""Rule-based Professor Xavier feedback that needs no network.
+
+These fragments used to be rebuilt as dict literals inside the feedback
+button handlers on every click, and were only reachable after an API
+failure. They are indexed once at import instead: the homework block for
+each scenario and the short-answer paragraphs are joined ahead of time, so
+building feedback is a handful of lookups. The same engine serves the
+instant feedback buttons and the API fallback; scoring a whole class of
+saved designs in one call is ``design_score.saved_scores``.
+"""
+from functools import lru_cache
+
+ORBIT_EXPLANATIONS = {
+    "Low Earth Orbit (LEO)": "At 200-2000 km altitude, LEO satellites travel at ~7.8 km/s, completing an orbit every 90 minutes. The proximity to Earth provides excellent image resolution - Landsat can see objects as small as 30 meters! Trade-off: narrow field of view means you need multiple satellites for frequent coverage.",
+    "Medium Earth Orbit (MEO)": "At 2,000-35,000 km, MEO balances coverage and detail. GPS satellites at ~20,200 km can each 'see' about 38% of Earth's surface, which is why 24-30 satellites provide global navigation coverage.",
+    "Geostationary (GEO)": "At exactly 35,786 km, a satellite's orbital period matches Earth's 24-hour rotation - it appears to hover! GOES-East watches the entire Americas continuously, which is why your TV weather shows real-time storm movement. Trade-off: the distance means lower resolution.",
+    "Polar Orbit": "These orbits pass over both poles. As the satellite completes each 90-minute orbit, Earth rotates ~22.5° beneath it. After about 14 orbits, the satellite has seen the entire planet! NASA's Aqua satellite uses this to map global ocean temperatures."
+}
+
+DEFAULT_ORBIT_EXPLANATION = "This orbit type has specific advantages for certain missions."
+
+INSTRUMENT_DETAILS = {
+    "Multispectral Imager": "📸 **Multispectral Imager:** Captures light in multiple bands including near-infrared (NIR). Chlorophyll in healthy plants absorbs red light (for photosynthesis) but reflects NIR strongly. Scientists calculate NDVI = (NIR-Red)/(NIR+Red). Values near +1 indicate healthy vegetation; near 0 means stressed or dead plants. This is how we monitor Michigan's forests and farms from space!",
+    "Radar Altimeter": "📏 **Radar Altimeter:** Sends radar pulses at ~13.6 GHz and measures return time. At light speed (299,792 km/s), we can calculate distance to centimeter precision. For the Great Lakes, this tracks water levels - crucial because every inch of lake level change affects how much cargo freighters can carry through the Soo Locks!",
+    "Thermal Sensor": "🌡️ **Thermal Sensor:** Detects infrared radiation (8-14 μm wavelength) emitted by surfaces. The Stefan-Boltzmann law tells us emission increases with temperature⁴. A 15°C Great Lakes surface vs. 5°C dramatically changes lake-effect snow - warmer water = more evaporation = heavier snowfall on Michigan's west coast!",
+    "Microwave Radiometer": "📡 **Microwave Radiometer:** Measures natural microwave emissions (~6.9 GHz) from surfaces. Key advantage: microwaves penetrate clouds! Even during Michigan's cloudiest winter days, we can measure Great Lakes ice coverage and surface temperature.",
+    "SAR (Synthetic Aperture Radar)": "🛰️ **SAR:** Creates radar images using its own microwave signal. Smooth surfaces (water) reflect radar away and appear dark; rough surfaces (ice, land) scatter radar back and appear bright. Works through clouds, day and night - essential for monitoring Great Lakes ice during dark Michigan winters!",
+    "Spectrometer": "🔬 **Spectrometer:** Identifies gases by their absorption 'fingerprints.' CO₂ absorbs at 4.26 μm and 15 μm; methane at 3.3 μm; ozone at 9.6 μm. This is how scientists track greenhouse gases and monitor Detroit's air quality from orbit!"
+}
+
+HOMEWORK_RECOMMENDATIONS = {
+    "🌊 Great Lakes Monitoring": [
+        ("CK-12: Ocean Currents", "https://www.ck12.org/earth-science/ocean-currents/", "Understanding how water moves helps predict where pollutants and algae spread"),
+        ("Khan Academy: The Water Cycle", "https://www.khanacademy.org/science/biology/ecology/biogeochemical-cycles/v/the-water-cycle", "Lake evaporation drives lake-effect weather patterns"),
+        ("CK-12: Electromagnetic Spectrum", "https://www.ck12.org/physics/electromagnetic-spectrum/", "Your satellite instruments detect different wavelengths of light"),
+    ],
+    "🌀 Hurricane & Storm Tracking": [
+        ("CK-12: Layers of the Atmosphere", "https://www.ck12.org/earth-science/layers-of-the-atmosphere/", "Storms form in the troposphere - understanding atmospheric layers is key"),
+        ("CK-12: Air Masses and Fronts", "https://www.ck12.org/earth-science/air-masses/", "Cold fronts over warm lakes create lake-effect snow"),
+        ("CK-12: Heat Transfer", "https://www.ck12.org/physics/heat-transfer/", "Convection drives storm development and lake-effect weather"),
+    ],
+    "🌾 Michigan Agriculture Monitoring": [
+        ("Khan Academy: Photosynthesis", "https://www.khanacademy.org/science/biology/photosynthesis-in-plants/introduction-to-photosynthesis/v/photosynthesis", "NDVI measures plant health by detecting chlorophyll activity"),
+        ("CK-12: Soil Formation", "https://www.ck12.org/earth-science/soil-formation/", "Soil moisture affects crop health - satellites can detect this"),
+        ("NASA: Measuring Vegetation", "https://earthobservatory.nasa.gov/features/MeasuringVegetation", "Learn how satellites actually measure plant health from space"),
+    ],
+    "🧊 Arctic & Great Lakes Ice Monitoring": [
+        ("Khan Academy: Climate Change", "https://www.khanacademy.org/science/cosmology-and-astronomy/earth-history-topic/earth-title-topic/v/climate-change", "Ice coverage is a key indicator of climate trends"),
+        ("CK-12: The Greenhouse Effect", "https://www.ck12.org/earth-science/greenhouse-effect/", "Understanding why ice is melting"),
+        ("CK-12: Reflection of Light", "https://www.ck12.org/physics/reflection-of-light/", "Ice-albedo feedback depends on these principles"),
+    ],
+}
+
+DEFAULT_SCENARIO = "🌊 Great Lakes Monitoring"
+
+NO_INSTRUMENTS_NOTE = "⚠️ **Remember to select instruments!** Your satellite's sensors determine what data you can collect. For Great Lakes monitoring, consider thermal sensors (water temperature affects lake-effect snow) and multispectral imagers (detecting algal blooms by water color changes)."
+
+PRINTING_NOTE = "🖨️ **Excellent choice on 3D printing!** Additive manufacturing enables complex geometries impossible with traditional machining - like internal cooling channels and lattice structures that reduce weight while maintaining strength. Fewer welded joints also means fewer potential failure points in the harsh space environment."
+
+
+def _homework_text(recommendations):
+    hw_text = "📚 **Homework Resources:**\nTo strengthen the science behind your mission, study these resources:\n"
+    for i, (name, url, reason) in enumerate(recommendations, 1):
+        hw_text += f"\n{i}. [{name}]({url}) - {reason}"
+    hw_text += "\n4. [NASA: How Orbits Work](https://spaceplace.nasa.gov/how-orbits-work/) - Essential for understanding satellite orbits!"
+    return hw_text
+
+
+HOMEWORK_TEXT = {
+    scenario: _homework_text(recommendations)
+    for scenario, recommendations in HOMEWORK_RECOMMENDATIONS.items()
+}
+
+# Short answers longer than this count as a real attempt
+SHORT_ANSWER_MIN_LENGTH = 20
+
+Q7_FEEDBACK = {
+    True: "\n\n".join([
+        "**Question 7 - Innovation Chain:**",
+        "Good effort! The key concept is the **innovation chain**: 3D printing → Lower manufacturing costs → Cheaper satellites → More satellites launched → Better Earth coverage → More scientific data → Improved understanding of climate, weather, and ecosystems.",
+        "\n📚 **Study:** [CK-12: Engineering Design Process](https://www.ck12.org/engineering/engineering-design-process/) | [NASA: How Orbits Work](https://spaceplace.nasa.gov/how-orbits-work/)",
+    ]),
+    False: "\n\n".join([
+        "**Question 7 - Innovation Chain:**",
+        "This question asks about the **innovation chain** - how one technology improvement creates a cascade of benefits. Here's the concept: When 3D printing makes fuel tanks cheaper ($30K vs $150K), companies can afford more satellites. More satellites = better coverage of Earth. Better coverage = more data about our oceans, ice, and atmosphere. More data = better scientific understanding!",
+        "\n📚 **Study:** [CK-12: Engineering Design Process](https://www.ck12.org/engineering/engineering-design-process/) | [NASA: How Satellites Work](https://spaceplace.nasa.gov/how-orbits-work/)",
+    ]),
+}
+
+Q8_FEEDBACK = {
+    True: "\n\n".join([
+        "\n\n**Question 8 - Satellite Data & Michigan:**",
+        "Nice work! To strengthen your answer, be even MORE specific. For example: 'Satellites measure **chlorophyll-a concentrations** using blue (443nm) and green (555nm) light wavelengths to detect **harmful algal blooms** in Lake Erie. This protects drinking water for millions of people in Michigan and Ohio, and the fishing industry worth $7 billion annually.'",
+        "\n📚 **Study:** [CK-12: Electromagnetic Spectrum](https://www.ck12.org/physics/electromagnetic-spectrum/) | [NOAA Great Lakes CoastWatch](https://coastwatch.glerl.noaa.gov/)",
+    ]),
+    False: "\n\n".join([
+        "\n\n**Question 8 - Satellite Data & Michigan:**",
+        "This question wants a SPECIFIC example. Here's a model answer: 'Satellites use **thermal sensors** to measure Great Lakes surface temperature (in °C). Warmer lake temperatures (15-20°C vs 4°C) cause more evaporation, which creates intense **lake-effect snowstorms** that can dump 2-3 feet of snow on Michigan communities. This data helps meteorologists issue accurate warnings, protecting lives and the economy.'",
+        "\n📚 **Study:** [CK-12: Weather and Climate](https://www.ck12.org/earth-science/weather-and-climate/) | [NOAA Great Lakes Education](https://www.glerl.noaa.gov/education/)",
+    ]),
+}
+
+
+def _mission_key(mission):
+    return (
+        mission['name'],
+        mission['type'],
+        mission['num_satellites'],
+        mission['orbit'],
+        mission['recommended_orbit'],
+        tuple(mission['instruments']),
+        mission['use_3d_printing'],
+    )
+
+
+@lru_cache(maxsize=1024)
+def _mission_feedback(key):
+    name, mission_type, num_satellites, orbit, recommended_orbit, instruments, use_3d_printing = key
+    feedback_parts = [f"**Excellent initiative on your {name if name else mission_type} mission!** Let me explain the science behind your choices."]
+    feedback_parts.append(f"**Your orbit ({orbit}):** {ORBIT_EXPLANATIONS.get(orbit, DEFAULT_ORBIT_EXPLANATION)}")
+    
+    if orbit != recommended_orbit:
+        feedback_parts.append(f"💡 *Consider:* For {mission_type}, **{recommended_orbit}** is often preferred because it provides the specific coverage pattern needed. But your choice could work with enough satellites!")
+    
+    if instruments:
+        feedback_parts.append("**The science behind your instruments:**")
+        feedback_parts.extend(INSTRUMENT_DETAILS[inst] for inst in instruments if inst in INSTRUMENT_DETAILS)
+    else:
+        feedback_parts.append(NO_INSTRUMENTS_NOTE)
+    
+    if use_3d_printing:
+        feedback_parts.append(PRINTING_NOTE)
+    
+    feedback_parts.append(HOMEWORK_TEXT.get(mission_type, HOMEWORK_TEXT[DEFAULT_SCENARIO]))
+    feedback_parts.append(f"🤔 **Think deeper:** With your constellation of {num_satellites} satellites, calculate how often each point on the Great Lakes gets observed. How would losing one satellite affect your coverage? What's your backup plan?")
+    
+    return "\n\n".join(feedback_parts)
+
+
+def mission_feedback(mission):
+    """Markdown feedback for one ``st.session_state.mission_data`` dict."""
+    return _mission_feedback(_mission_key(mission))
+
+
+def _attempted(answer):
+    return bool(answer) and len(answer) > SHORT_ANSWER_MIN_LENGTH
+
+
+def short_answer_feedback(answers):
+    """Markdown feedback for one ``st.session_state.quiz_short_answers`` dict."""
+    return "\n\n".join([
+        Q7_FEEDBACK[_attempted(answers.get('q7'))],
+        Q8_FEEDBACK[_attempted(answers.get('q8'))],
+    ])
@@ -0,0 +1,155 @@
+"""Process-wide queue for Professor Xavier feedback requests.
+
+When a whole class reaches the Design Challenge together, every session
+used to call the API at once and the provider answered with bursts of 429s.
+All feedback requests now go through one FeedbackScheduler:
+
+- a bounded FIFO queue, with at most one waiting request per session and
+  feature so a student clicking repeatedly cannot push the rest of the class
+  back, while mission and quiz feedback can still wait side by side
+- a fixed number of worker threads, which caps requests in flight
+- a token bucket that spaces requests out to the provider's rate limit,
+  and pauses for ``Retry-After`` when the provider still says 429
+"""
+import os
+import threading
+import time
+from collections import deque
+
+import metrics
+
+MAX_IN_FLIGHT = int(os.environ.get("FEEDBACK_MAX_IN_FLIGHT", "4"))
+RATE_PER_MINUTE = float(os.environ.get("FEEDBACK_RATE_PER_MINUTE", "50"))
+BURST = int(os.environ.get("FEEDBACK_BURST", "5"))
+MAX_QUEUE = int(os.environ.get("FEEDBACK_MAX_QUEUE", "60"))
+MAX_ATTEMPTS = 3
+
+
+class QueueFull(Exception):
+    """Raised when the feedback queue already holds ``max_queue`` requests."""
+
+
+class RateLimited(Exception):
+    """Raised by a task when the provider answered 429; the task is retried."""
+
+    def __init__(self, retry_after=None):
+        super().__init__("rate limited by provider")
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """Classic token bucket: ``rate`` tokens per second up to ``capacity``."""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then take it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now >= self.paused_until:
+                    self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                    self.updated = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait = (1 - self.tokens) / self.rate
+                else:
+                    wait = self.paused_until - now
+            time.sleep(wait)
+
+    def pause(self, seconds):
+        """Stop handing out tokens for ``seconds`` and start refilling from empty."""
+        with self._lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+            self.updated = self.paused_until
+            self.tokens = 0.0
+
+
+class _Task:
+    def __init__(self, slot, job, run):
+        self.slot = slot
+        self.job = job
+        self.run = run
+        self.enqueued_at = time.perf_counter()
+        self.attempts = 0
+
+
+class FeedbackScheduler:
+    """Bounded FIFO of feedback tasks served by ``max_in_flight`` workers."""
+
+    def __init__(self, max_in_flight=MAX_IN_FLIGHT, rate_per_minute=RATE_PER_MINUTE,
+                 burst=BURST, max_queue=MAX_QUEUE):
+        self.max_queue = max_queue
+        self.bucket = TokenBucket(rate_per_minute / 60, burst)
+        self._queue = deque()
+        self._running = set()
+        self._cond = threading.Condition()
+        for i in range(max_in_flight):
+            threading.Thread(target=self._work, name=f"feedback-worker-{i}", daemon=True).start()
+
+    def submit(self, slot, job, run):
+        """Queue ``run(job)``, replacing any request still waiting in the same ``slot``.
+
+        ``slot`` is any hashable, usually ``(session_id, feature)``.
+        """
+        with self._cond:
+            for task in list(self._queue):
+                if task.slot == slot:
+                    self._queue.remove(task)
+                    task.job.finish(error=RuntimeError("replaced by a newer request"))
+            if len(self._queue) >= self.max_queue:
+                raise QueueFull(f"{len(self._queue)} feedback requests are already waiting")
+            self._queue.append(_Task(slot, job, run))
+            metrics.record("feedback.queue_depth", len(self._queue))
+            self._cond.notify()
+
+    def position(self, job):
+        """1-based place of ``job`` in line, 0 once it is being served or finished."""
+        with self._cond:
+            for index, task in enumerate(self._queue, 1):
+                if task.job is job:
+                    return index
+            return 0
+
+    def stats(self):
+        with self._cond:
+            return {"waiting": len(self._queue), "in_flight": len(self._running)}
+
+    def _work(self):
+        while True:
+            with self._cond:
+                while not self._queue:
+                    self._cond.wait()
+                task = self._queue.popleft()
+                self._running.add(task)
+            try:
+                self.bucket.acquire()
+                task.attempts += 1
+                if task.attempts == 1:
+                    metrics.record("feedback.queue_wait", time.perf_counter() - task.enqueued_at)
+                task.run(task.job)
+            except RateLimited as limited:
+                self.bucket.pause(limited.retry_after or 10)
+                if task.attempts >= MAX_ATTEMPTS:
+                    task.job.status_code = 429
+                    task.job.finish()
+                else:
+                    with self._cond:
+                        self._queue.appendleft(task)
+                        self._cond.notify()
+            except Exception as e:
+                if not task.job.done:
+                    task.job.finish(error=e)
+            finally:
+                with self._cond:
+                    self._running.discard(task)
+
+
+scheduler = FeedbackScheduler()
@@ -0,0 +1,109 @@
+"""Streamed Professor Xavier feedback produced on a background thread.
+
+The Streamlit script thread only queues a FeedbackJob and then polls it, so
+a slow API response no longer holds a script-runner thread for up to a
+minute. A scheduler worker streams the text from the configured feedback
+backend and appends each piece as it arrives.
+"""
+import threading
+import time
+
+import metrics
+from feedback_backends import BackendHTTPError, stream_feedback
+from feedback_scheduler import QueueFull, RateLimited, scheduler
+
+
+class FeedbackJob:
+    """Feedback text being streamed in for one request."""
+
+    def __init__(self, prompt, from_cache=False):
+        self.prompt = prompt
+        self.from_cache = from_cache
+        self.status_code = None
+        self.error = None
+        self.done = False
+        self.started_at = time.perf_counter()
+        self.first_token_at = None
+        self.finished_at = None
+        self._chunks = []
+        self._lock = threading.Lock()
+
+    @property
+    def text(self):
+        with self._lock:
+            return "".join(self._chunks)
+
+    @property
+    def ok(self):
+        """True once the stream finished cleanly with a 200 response."""
+        return self.done and self.status_code == 200 and self.error is None
+
+    @property
+    def time_to_first_token(self):
+        if self.first_token_at is None:
+            return None
+        return self.first_token_at - self.started_at
+
+    def append(self, text):
+        with self._lock:
+            if self.first_token_at is None:
+                self.first_token_at = time.perf_counter()
+                if not self.from_cache:
+                    metrics.record("feedback.time_to_first_token", self.time_to_first_token)
+            self._chunks.append(text)
+
+    def finish(self, error=None):
+        self.error = error
+        self.finished_at = time.perf_counter()
+        if not self.from_cache:
+            metrics.record("feedback.total", self.finished_at - self.started_at)
+        self.done = True
+
+
+def cached_feedback_job(prompt, text):
+    """Return an already finished job for feedback that was served from the cache."""
+    job = FeedbackJob(prompt, from_cache=True)
+    job.status_code = 200
+    job.append(text)
+    job.finish()
+    return job
+
+
+def start_feedback_job(prompt, settings, session_id, feature, on_success=None):
+    """Queue streamed feedback for ``prompt`` and return the job right away.
+
+    ``settings`` names the provider, model, token budget and timeout. The
+    request waits its turn in the class-wide scheduler; a newer request from
+    the same session for the same ``feature`` replaces it while it is still
+    waiting, one for another feature doesn't. ``on_success`` is
+    called from the worker thread with the prompt and the full text once the
+    stream completes cleanly. If the queue is full the job finishes at once
+    with a QueueFull error, which sends the student to the rule-based feedback.
+    """
+    job = FeedbackJob(prompt)
+    try:
+        scheduler.submit(
+            (session_id, feature), job,
+            lambda job: _stream_feedback(job, settings, on_success))
+    except QueueFull as e:
+        job.finish(error=e)
+    return job
+
+
+def _stream_feedback(job, settings, on_success):
+    try:
+        for text in stream_feedback(job.prompt, settings):
+            job.append(text)
+        job.status_code = 200
+        job.finish()
+    except BackendHTTPError as e:
+        if e.status_code == 429:
+            raise RateLimited(e.retry_after)
+        job.status_code = e.status_code
+        job.finish()
+        return
+    except Exception as e:
+        job.finish(error=e)
+        return
+    if on_success is not None and job.ok:
+        on_success(job.prompt, job.text)
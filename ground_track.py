@@ -0,0 +1,283 @@
+"""Offline map of a constellation's ground tracks and sensor swaths over the Great Lakes.
+
+The base map is Michigan and the Great Lakes from
+``content/map/great_lakes.json`` plus a latitude/longitude grid, rasterized
+with Pillow into 256-pixel Web Mercator tiles. That is the tiling online
+maps use, but the tiles are drawn here, so nothing is fetched from a tile
+service. Each tile is rendered once and kept in memory and under
+``MAP_TILE_DIR``. A view is stitched from the tiles once per process.
+
+A rerun only computes the overlay:
+
+- ``orbit_sim.ground_directions`` gives every satellite's sub-satellite point
+  over the chosen window in one vectorized call
+- the ground swept by each sensor's swath is shaded on a coarse pixel grid
+- the tracks are drawn as lines
+
+The swath is what an imager looking up to ``SENSOR_HALF_ANGLE_DEG`` off nadir
+can reach. It is capped at the 20-degree-elevation footprint that the
+coverage simulator counts, which is the whole swath for MEO and GEO.
+
+    python ground_track.py "Polar Orbit" 4 3 > map.png
+"""
+import hashlib
+import math
+import os
+import sys
+import tempfile
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+import content_store
+import orbit_sim
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+TILE_DIR = os.environ.get("MAP_TILE_DIR", os.path.join(APP_DIR, ".cache", "tiles"))
+ZOOM = int(os.environ.get("MAP_ZOOM", "6"))
+TILE_SIZE = 256
+OUTLINES = "map/great_lakes"
+
+# (south, north, west, east) in degrees, like the orbit_sim regions
+VIEW = (40.5, 49.5, -93.0, -75.0)
+GRID_DEGREES = 2
+MAX_LATITUDE = 85.0  # Web Mercator stops short of the poles
+TRACK_STEP_SECONDS = 60
+SENSOR_HALF_ANGLE_DEG = 30.0  # off-nadir reach of a wide-swath imager
+SWATH_CELL = 4  # swath shading is computed per 4 x 4 pixel block
+SAMPLE_CHUNK = 64  # track samples per matrix product; small, so the loop stops soon after the view is covered
+
+LAND = (236, 229, 206)
+MICHIGAN = (213, 227, 184)
+WATER = (158, 196, 228)
+SHORE = (96, 128, 160)
+GRID = (205, 200, 185)
+LABEL = (55, 70, 90)
+SWATH = np.array([255, 166, 38])
+SWATH_ALPHA = 0.35
+TRACK_COLORS = [(214, 39, 40), (31, 119, 180), (148, 103, 189), (44, 160, 44),
+                (255, 127, 14), (23, 190, 207), (227, 119, 194), (140, 86, 75)]
+LABELS = {"MICHIGAN": (-84.7, 43.4)}
+
+TrackMap = namedtuple("TrackMap", ["image", "swept", "tracks_in_view"])
+
+
+def world_pixels(lat, lon, zoom=ZOOM):
+    """Web Mercator pixel coordinates (x, y) at ``zoom``; degrees in, arrays out."""
+    scale = TILE_SIZE * 2 ** zoom
+    lat = np.radians(np.clip(lat, -MAX_LATITUDE, MAX_LATITUDE))
+    x = (np.asarray(lon, dtype=np.float64) + 180.0) / 360.0 * scale
+    y = (1 - np.log(np.tan(lat) + 1 / np.cos(lat)) / np.pi) / 2 * scale
+    return x, y
+
+
+def pixel_latlon(x, y, zoom=ZOOM):
+    """Inverse of ``world_pixels``: (lat, lon) in degrees."""
+    scale = TILE_SIZE * 2 ** zoom
+    lon = np.asarray(x, dtype=np.float64) / scale * 360.0 - 180.0
+    lat = np.degrees(np.arctan(np.sinh(np.pi * (1 - 2 * np.asarray(y, dtype=np.float64) / scale))))
+    return lat, lon
+
+
+def unit_vectors(lat, lon):
+    lat, lon = np.radians(lat), np.radians(lon)
+    return np.stack([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)], axis=-1)
+
+
+@lru_cache(maxsize=1)
+def tile_version():
+    """Hash of the outlines and this module, so edited outlines or colors get fresh tiles."""
+    digest = hashlib.sha256()
+    for path in (os.path.join(content_store.CONTENT_DIR, f"{OUTLINES}.json"), os.path.abspath(__file__)):
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:12]
+
+
+def render_tile(zoom, x, y):
+    """One TILE_SIZE x TILE_SIZE RGB tile as a uint8 array."""
+    outlines = content_store.load(OUTLINES)
+    image = Image.new("RGB", (TILE_SIZE, TILE_SIZE), LAND)
+    draw = ImageDraw.Draw(image)
+    left, top = x * TILE_SIZE, y * TILE_SIZE
+
+    def ring(points):
+        lon, lat = np.array(points, dtype=np.float64).T
+        px, py = world_pixels(lat, lon, zoom)
+        return list(zip((px - left).tolist(), (py - top).tolist()))
+
+    (north, south), (west, east) = pixel_latlon([left, left + TILE_SIZE], [top, top + TILE_SIZE], zoom)
+    for lat in range(math.ceil(south / GRID_DEGREES) * GRID_DEGREES, math.floor(north) + 1, GRID_DEGREES):
+        _, py = world_pixels(lat, 0.0, zoom)
+        draw.line([(0, float(py) - top), (TILE_SIZE, float(py) - top)], fill=GRID)
+    for lon in range(math.ceil(west / GRID_DEGREES) * GRID_DEGREES, math.floor(east) + 1, GRID_DEGREES):
+        px, _ = world_pixels(0.0, lon, zoom)
+        draw.line([(float(px) - left, 0), (float(px) - left, TILE_SIZE)], fill=GRID)
+    for points in outlines["land"].values():
+        draw.polygon(ring(points), fill=MICHIGAN, outline=SHORE)
+    for points in outlines["lakes"].values():
+        draw.polygon(ring(points), fill=WATER, outline=SHORE)
+    return np.asarray(image)
+
+
+@lru_cache(maxsize=256)
+def tile(zoom, x, y):
+    """A base-map tile, rendered on first use and then read from memory or ``TILE_DIR``."""
+    directory = os.path.join(TILE_DIR, tile_version(), str(zoom))
+    path = os.path.join(directory, f"{x}_{y}.png")
+    if os.path.exists(path):
+        with Image.open(path) as image:
+            return np.asarray(image.convert("RGB"))
+    pixels = render_tile(zoom, x, y)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, partial = tempfile.mkstemp(dir=directory, suffix=".part")
+        with os.fdopen(fd, "wb") as f:
+            Image.fromarray(pixels).save(f, format="PNG")
+        os.replace(partial, path)
+    except OSError:
+        pass  # a read-only checkout still gets the in-memory tile
+    return pixels
+
+
+def _view_pixels(view, zoom):
+    south, north, west, east = view
+    (left, right), (top, bottom) = world_pixels([north, south], [west, east], zoom)
+    return int(left), int(top), int(math.ceil(right)), int(math.ceil(bottom))
+
+
+def _draw_label(draw, text, x, y, font):
+    left, top, right, bottom = draw.textbbox((0, 0), text, font=font)
+    draw.text((x - (right - left) / 2, y - (bottom - top) / 2), text, fill=LABEL, font=font)
+
+
+@lru_cache(maxsize=8)
+def base_map(view=VIEW, zoom=ZOOM):
+    """The stitched base map for ``view`` as a read-only uint8 array, plus its world-pixel origin."""
+    left, top, right, bottom = _view_pixels(view, zoom)
+    columns = range(left // TILE_SIZE, (right - 1) // TILE_SIZE + 1)
+    rows = range(top // TILE_SIZE, (bottom - 1) // TILE_SIZE + 1)
+    mosaic = np.concatenate([np.concatenate([tile(zoom, column, row) for column in columns], axis=1)
+                             for row in rows], axis=0)
+    x0, y0 = left - columns[0] * TILE_SIZE, top - rows[0] * TILE_SIZE
+    image = Image.fromarray(mosaic[y0:y0 + bottom - top, x0:x0 + right - left])
+
+    # Labels go on the stitched view so they are never cut at a tile edge
+    draw = ImageDraw.Draw(image)
+    font = ImageFont.load_default()
+    outlines = content_store.load(OUTLINES)
+    places = dict(LABELS, **{f"Lake {name}": np.mean(points[:-1], axis=0)
+                             for name, points in outlines["lakes"].items()})
+    for text, (lon, lat) in places.items():
+        px, py = world_pixels(lat, lon, zoom)
+        _draw_label(draw, text, float(px) - left, float(py) - top, font)
+
+    pixels = np.asarray(image)
+    pixels.flags.writeable = False
+    return pixels, (left, top)
+
+
+@lru_cache(maxsize=8)
+def _shaded(view, zoom):
+    """The base map as it looks inside a swath, blended once so a rerun only selects pixels."""
+    pixels, _ = base_map(view, zoom)
+    shaded = (pixels * (1 - SWATH_ALPHA) + SWATH * SWATH_ALPHA).astype(np.uint8)
+    shaded.flags.writeable = False
+    return shaded
+
+
+@lru_cache(maxsize=8)
+def _cells(view, zoom):
+    """Unit vectors (N x 3, float32) at the centres of the SWATH_CELL blocks of the view, and the block grid shape."""
+    left, top, right, bottom = _view_pixels(view, zoom)
+    xs = left + SWATH_CELL * (np.arange(math.ceil((right - left) / SWATH_CELL)) + 0.5)
+    ys = top + SWATH_CELL * (np.arange(math.ceil((bottom - top) / SWATH_CELL)) + 0.5)
+    lat, lon = pixel_latlon(*np.meshgrid(xs, ys), zoom)
+    cells = unit_vectors(lat, lon).reshape(-1, 3).astype(np.float32)
+    centre = cells.mean(axis=0)
+    centre /= np.linalg.norm(centre)
+    radius = float(np.arccos(np.clip((cells @ centre).min(), -1.0, 1.0)))
+    return cells, (len(ys), len(xs)), centre, radius
+
+
+def swath_angle(altitude_km, half_angle_deg=SENSOR_HALF_ANGLE_DEG):
+    """Earth-central angle (radians) from the ground track to the edge of the sensor swath."""
+    look = math.radians(half_angle_deg)
+    ratio = (orbit_sim.EARTH_RADIUS_KM + altitude_km) / orbit_sim.EARTH_RADIUS_KM * math.sin(look)
+    footprint = orbit_sim.footprint_angle(altitude_km)
+    return footprint if ratio >= 1 else min(footprint, math.asin(ratio) - look)
+
+
+def ground_tracks(orbit, num_satellites, hours, region=orbit_sim.GREAT_LAKES):
+    """Earth-fixed unit vectors (T, S, 3) of each sub-satellite point every TRACK_STEP_SECONDS for ``hours``."""
+    times = np.arange(0, hours * 3600 + 1, TRACK_STEP_SECONDS, dtype=np.float64)
+    return orbit_sim.ground_directions(orbit, num_satellites, times, region)
+
+
+def swath_mask(directions, altitude_km, view=VIEW, zoom=ZOOM):
+    """Boolean image mask of the view: pixels inside any satellite's swath at any sampled time."""
+    cells, shape, centre, radius = _cells(view, zoom)
+    reach = swath_angle(altitude_km)
+    samples = directions.reshape(-1, 3).astype(np.float32)
+    # Only samples whose swath can reach the view are compared against it
+    samples = samples[samples @ centre >= math.cos(min(math.pi, radius + reach))]
+    threshold = math.cos(reach)
+    seen = np.zeros(len(cells), dtype=bool)
+    for start in range(0, len(samples), SAMPLE_CHUNK):
+        open_cells = np.flatnonzero(~seen)
+        if not len(open_cells):
+            break
+        chunk = samples[start:start + SAMPLE_CHUNK]
+        seen[open_cells] = (cells[open_cells] @ chunk.T >= threshold).any(axis=1)
+    left, top, right, bottom = _view_pixels(view, zoom)
+    blocks = seen.reshape(shape)
+    return blocks.repeat(SWATH_CELL, axis=0).repeat(SWATH_CELL, axis=1)[:bottom - top, :right - left]
+
+
+def _segments(x, y, width, height, wrap):
+    """Runs of consecutive points near the view, split where a line would cross the antimeridian."""
+    near = (x > -width) & (x < 2 * width) & (y > -height) & (y < 2 * height)
+    jump = np.concatenate([[True], np.abs(np.diff(x)) > wrap / 2])
+    starts = near & (jump | ~np.concatenate([[False], near[:-1]]))
+    run = np.cumsum(starts)
+    for label in np.unique(run[near]):
+        members = near & (run == label)
+        if members.sum() >= 2:
+            yield list(zip(x[members].tolist(), y[members].tolist()))
+
+
+def render_map(orbit, num_satellites, hours=3, region=orbit_sim.GREAT_LAKES, view=VIEW, zoom=ZOOM):
+    """``TrackMap`` of ``num_satellites`` in ``orbit`` over the next ``hours``."""
+    altitude, _ = orbit_sim.ORBITS[orbit]
+    base, (left, top) = base_map(view, zoom)
+    height, width = base.shape[:2]
+    directions = ground_tracks(orbit, int(num_satellites), hours, region)
+
+    mask = swath_mask(directions, altitude, view, zoom)
+    image = Image.fromarray(np.where(mask[..., None], _shaded(view, zoom), base))
+    draw = ImageDraw.Draw(image)
+    wrap = TILE_SIZE * 2 ** zoom
+
+    lat = np.degrees(np.arcsin(np.clip(directions[..., 2], -1, 1)))
+    lon = np.degrees(np.arctan2(directions[..., 1], directions[..., 0]))
+    x, y = world_pixels(lat, lon, zoom)
+    x, y = x - left, y - top
+
+    in_view = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+    for satellite in range(directions.shape[1]):
+        color = TRACK_COLORS[satellite % len(TRACK_COLORS)]
+        for segment in _segments(x[:, satellite], y[:, satellite], width, height, wrap):
+            draw.line(segment, fill=color, width=2)
+        end_x, end_y = x[-1, satellite], y[-1, satellite]
+        draw.ellipse([end_x - 5, end_y - 5, end_x + 5, end_y + 5], fill=color, outline=(255, 255, 255))
+    return TrackMap(image=image, swept=float(mask.mean()), tracks_in_view=int(in_view.any(axis=0).sum()))
+
+
+if __name__ == "__main__":
+    orbit_name, satellites = sys.argv[1], int(sys.argv[2])
+    window = float(sys.argv[3]) if len(sys.argv) > 3 else 3
+    result = render_map(orbit_name, satellites, window)
+    result.image.save(sys.stdout.buffer, format="PNG")
+    print(f"{result.swept:.0%} of the map swept, {result.tracks_in_view} track(s) in view", file=sys.stderr)
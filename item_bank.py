@@ -0,0 +1,187 @@
+"""Multiple-choice item banks and a vectorised grader.
+
+Every multiple-choice item in the lesson is described once in ``content/``:
+an ID, its options, the index of the right answer, XP and the Michigan
+standards it assesses. Two banks are built from that:
+
+- ``quiz``: the final-assessment items (``parts`` in ``content/pages/quiz.json``)
+- ``checks``: every ``check`` block on the lesson pages (the satellite and
+  3D printing quick checks)
+
+A submission is a row of answer indices (-1 for unanswered), so grading a
+whole class is one fancy-indexing lookup into an items x options table of
+accepted answers. The answer key is just an argument to ``grade``: saved
+responses can be re-graded against a corrected key (or one that accepts two
+options for a flawed item) without anyone re-running the app:
+
+    python item_bank.py quiz_q4=1,2
+"""
+import argparse
+
+import numpy as np
+import streamlit as st
+
+import content_store
+
+UNANSWERED = -1
+
+
+class ItemBank:
+    """Items in a fixed order plus their answer key as arrays."""
+
+    def __init__(self, items):
+        self.items = tuple(items)
+        self.ids = tuple(item["id"] for item in self.items)
+        self.positions = {item_id: position for position, item_id in enumerate(self.ids)}
+        self.option_index = [{option: index for index, option in enumerate(item["options"])}
+                             for item in self.items]
+        self.max_options = max((len(item["options"]) for item in self.items), default=0)
+        self.xp = np.array([item["xp"] for item in self.items], dtype=np.int32)
+        self.answer_key = self.key()
+        self.standards = {}
+        for position, item in enumerate(self.items):
+            for tag in item["standards"]:
+                self.standards.setdefault(tag, []).append(position)
+
+    def __len__(self):
+        return len(self.items)
+
+    def key(self, changes=None):
+        """Items x (options + 1) table of accepted answers.
+
+        ``changes`` maps item IDs to a new answer index or a list of indices
+        that should all count as correct. The extra last column stands for
+        "unanswered" and is never accepted.
+        """
+        accepted = np.zeros((len(self.items), self.max_options + 1), dtype=bool)
+        for position, item in enumerate(self.items):
+            accepted[position, item["answer"]] = True
+        for item_id, answers in (changes or {}).items():
+            position = self.positions[item_id]
+            answers = [answers] if isinstance(answers, int) else list(answers)
+            if any(not 0 <= answer < len(self.items[position]["options"]) for answer in answers):
+                raise ValueError(f"answer index out of range for {item_id!r}: {answers}")
+            accepted[position] = False
+            accepted[position, answers] = True
+        return accepted
+
+    def encode(self, choices):
+        """One response row from ``{item_id: chosen option text or index}``; missing items are unanswered."""
+        row = np.full(len(self.items), UNANSWERED, dtype=np.int16)
+        for item_id, choice in choices.items():
+            position = self.positions.get(item_id)
+            if position is None or choice is None:
+                continue
+            index = choice if isinstance(choice, int) else self.option_index[position].get(choice, UNANSWERED)
+            row[position] = index
+        return row
+
+    def matrix(self, submissions):
+        """Stack ``encode`` rows for a list of choice dicts into a students x items array."""
+        if not submissions:
+            return np.empty((0, len(self.items)), dtype=np.int16)
+        return np.stack([self.encode(choices) for choices in submissions])
+
+    def correct(self, responses, key=None):
+        """Boolean students x items array of correct answers."""
+        responses = np.atleast_2d(np.asarray(responses, dtype=np.int16))
+        if responses.shape[1] != len(self.items):
+            raise ValueError(f"expected {len(self.items)} answers per row, got {responses.shape[1]}")
+        accepted = self.answer_key if key is None else key
+        # Unanswered (-1) and out-of-range indices land on the never-accepted last column
+        columns = np.where((responses >= 0) & (responses < self.max_options), responses, self.max_options)
+        return accepted[np.arange(len(self.items)), columns]
+
+    def grade(self, responses, key=None):
+        """Score a whole class at once.
+
+        Returns ``correct`` (students x items), ``score`` and ``xp`` per student,
+        ``item_p`` (share of students right on each item) and ``standards``
+        (tag -> share of that standard's items each student got right).
+        """
+        correct = self.correct(responses, key)
+        return {
+            "correct": correct,
+            "score": correct.sum(axis=1),
+            "xp": correct.astype(np.int32) @ self.xp,
+            "item_p": correct.mean(axis=0) if len(correct) else np.zeros(len(self.items)),
+            "standards": {tag: correct[:, positions].mean(axis=1) for tag, positions in self.standards.items()},
+        }
+
+    def is_correct(self, item_id, choice):
+        """Grade a single answer, e.g. one quick check."""
+        return bool(self.correct(self.encode({item_id: choice}))[0, self.positions[item_id]])
+
+
+def _item(item, item_id, default_xp):
+    return {
+        "id": item_id,
+        "question": item["question"],
+        "options": list(item["options"]),
+        "answer": item["answer"],
+        "xp": item.get("xp", default_xp),
+        "standards": list(item.get("standards", [])),
+    }
+
+
+def _check_items(blocks):
+    for block in blocks:
+        if block["type"] == "check":
+            yield block["check"]
+        children = block.get("blocks", [])
+        if block["type"] in ("columns", "tabs"):
+            children = [child for column in children for child in column]
+        yield from _check_items(children)
+
+
+@st.cache_resource(show_spinner=False)
+def load_bank(name):
+    """The ``quiz`` or ``checks`` bank, built from the content files once per process."""
+    if name == "quiz":
+        content = content_store.load_page("quiz")
+        items = [_item(item, item["key"], 10) for part in content["parts"] for item in part["items"]]
+    elif name == "checks":
+        items = []
+        for entry in content_store.load("lesson")["navigation"]:
+            if content_store.has_page(entry["page"]):
+                content = content_store.load_page(entry["page"])
+                items += [_item(check, check["key"], 0) for check in _check_items(content.get("blocks", []))]
+    else:
+        raise KeyError(f"unknown item bank {name!r}")
+    return ItemBank(items)
+
+
+def regrade_saved(store, changes=None):
+    """Re-grade every saved final quiz in ``store`` against the key with ``changes`` applied.
+
+    Returns the student IDs in row order and the ``grade`` result.
+    """
+    bank = load_bank("quiz")
+    saved = {student_id: data["quiz_answers"] for student_id, data in store.snapshots().items()
+             if data.get("quiz_answers")}
+    return list(saved), bank.grade(bank.matrix(list(saved.values())), bank.key(changes))
+
+
+def _parse_change(text):
+    item_id, _, answers = text.partition("=")
+    return item_id, [int(answer) for answer in answers.split(",")]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-grade saved final quizzes with a changed answer key")
+    parser.add_argument("changes", nargs="*", type=_parse_change, metavar="ITEM=INDEX[,INDEX]",
+                        help="e.g. quiz_q4=1,2 accepts options B and C for question 4")
+    args = parser.parse_args()
+
+    import progress_store
+
+    students, grades = regrade_saved(progress_store.store, dict(args.changes))
+    bank = load_bank("quiz")
+    for student_id, score, xp in zip(students, grades["score"], grades["xp"]):
+        print(f"{student_id:<24} {score}/{len(bank)}  {xp} XP")
+    for item_id, share in zip(bank.ids, grades["item_p"]):
+        print(f"{item_id:<24} {share:.0%} correct")
+
+
+if __name__ == "__main__":
+    main()
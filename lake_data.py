@@ -0,0 +1,251 @@
+"""Daily Great Lakes records (ice cover, surface temperature, water level) as memory-mapped arrays.
+
+A dataset version is a directory ``data/great_lakes/v<N>/`` holding one
+``.npy`` file per variable, shaped (lake, day) so one lake's history is
+contiguous, plus ``manifest.json`` with the lakes, start date, units and a
+SHA-256 per file. ``LakeDataset`` opens the files with ``mmap_mode="r"``.
+Selecting a lake and date range returns views into the mapped file, so
+nothing is read until a chart touches the values. Every session shares the
+same pages through the OS cache.
+
+The bundled v1 is a SYNTHETIC SAMPLE made by ``python lake_data.py build``.
+It has a seasonal cycle, winter-to-winter variability and a warming trend,
+with per-lake magnitudes in the range of published Great Lakes climatology.
+It is not observed data, and the manifest says so (``"synthetic": true``).
+The sample is laid out on a calendar only so seasons and leap days line up;
+its years are placeholders, and pages show them as sample years 1 to 30.
+Real records exported in the same layout can be dropped in as a new version:
+
+    python lake_data.py                  # summary of the current version
+    python lake_data.py build            # regenerate the synthetic sample
+"""
+import hashlib
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.environ.get("LAKE_DATA_DIR", os.path.join(APP_DIR, "data", "great_lakes"))
+VERSION = os.environ.get("LAKE_DATA_VERSION", "1")
+MANIFEST = "manifest.json"
+MAX_CHART_POINTS = 2000
+
+# Generator settings for the synthetic sample
+SAMPLE_START = "1995-01-01"
+SAMPLE_END = "2024-12-31"
+SAMPLE_SEED = 1995
+# name, surface area (mi²), mean surface temp (°C), seasonal amplitude, typical peak ice cover (%), mean level (m, IGLD 85)
+SAMPLE_LAKES = [
+    ("Superior", 31_700, 6.5, 7.5, 55, 183.4),
+    ("Michigan", 22_300, 10.0, 10.5, 35, 176.4),
+    ("Huron", 23_000, 9.5, 10.0, 60, 176.4),
+    ("Erie", 9_910, 11.5, 12.0, 85, 174.2),
+    ("Ontario", 7_340, 10.0, 10.5, 25, 74.8),
+]
+TEMPERATURE_PEAK_DAY = 225  # mid-August
+ICE_PEAK_DAY = 55           # late February
+WARMING_PER_YEAR = 0.04     # °C
+
+
+class DatasetError(Exception):
+    """A dataset file is missing, has the wrong shape or doesn't match its manifest."""
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class LakeDataset:
+    """One version of the dataset, memory-mapped, with zero-copy slicing by lake and date range."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        try:
+            with open(os.path.join(directory, MANIFEST), encoding="utf-8") as f:
+                self.manifest = json.load(f)
+        except (OSError, ValueError) as error:
+            raise DatasetError(f"{directory}: can't read {MANIFEST}: {error}")
+        self.version = self.manifest["version"]
+        self.synthetic = bool(self.manifest.get("synthetic"))
+        self.lakes = [lake["name"] for lake in self.manifest["lakes"]]
+        self.area = np.array([lake["area_sq_mi"] for lake in self.manifest["lakes"]], dtype=np.float64)
+        self.variables = self.manifest["variables"]
+        self.start = np.datetime64(self.manifest["start"], "D")
+        self.dates = self.start + np.arange(self.manifest["days"])
+        self._rows = {name: row for row, name in enumerate(self.lakes)}
+        self._arrays = {}
+        for name, variable in self.variables.items():
+            path = os.path.join(directory, variable["file"])
+            try:
+                array = np.load(path, mmap_mode="r")
+            except (OSError, ValueError) as error:
+                raise DatasetError(f"{path}: {error}")
+            if array.shape != (len(self.lakes), len(self.dates)):
+                raise DatasetError(f"{path}: shape {array.shape}, manifest says "
+                                   f"{(len(self.lakes), len(self.dates))}")
+            self._arrays[name] = array
+
+    def verify(self):
+        """Check every file against the manifest's SHA-256; reads the whole dataset once."""
+        for variable in self.variables.values():
+            path = os.path.join(self.directory, variable["file"])
+            if file_sha256(path) != variable["sha256"]:
+                raise DatasetError(f"{path}: contents don't match {MANIFEST}")
+
+    def _day(self, date, default):
+        if date is None:
+            return default
+        offset = int((np.datetime64(date, "D") - self.start).astype(np.int64))
+        return min(max(offset, 0), len(self.dates) - 1)
+
+    def _columns(self, start, end, every):
+        return slice(self._day(start, 0), self._day(end, len(self.dates) - 1) + 1, every)
+
+    def series(self, variable, lake, start=None, end=None, every=1):
+        """(dates, values) of one lake between ``start`` and ``end`` inclusive, both views.
+
+        ``every`` keeps every n-th day, still without copying.
+        """
+        columns = self._columns(start, end, every)
+        return self.dates[columns], self._arrays[variable][self._rows[lake], columns]
+
+    def window(self, variable, start=None, end=None, every=1):
+        """(dates, values) of every lake, values shaped (lake, day), both views."""
+        columns = self._columns(start, end, every)
+        return self.dates[columns], self._arrays[variable][:, columns]
+
+    def area_weighted(self, variable, start=None, end=None, every=1):
+        """(dates, values) of the whole Great Lakes, each lake weighted by surface area."""
+        dates, values = self.window(variable, start, end, every)
+        return dates, self.area @ values / self.area.sum()
+
+    def frame(self, variable, lakes=None, start=None, end=None, total=None, max_points=MAX_CHART_POINTS):
+        """Chart-ready DataFrame indexed by date, thinned to about ``max_points`` rows.
+
+        Only the thinned rows are copied out of the mapped file. ``total``
+        names an extra area-weighted column for all five lakes.
+        """
+        first, last = self._day(start, 0), self._day(end, len(self.dates) - 1)
+        every = max(1, -(-(last - first + 1) // max_points))
+        dates, values = self.window(variable, start, end, every)
+        columns = {lake: values[self._rows[lake]] for lake in (lakes or self.lakes)}
+        if total:
+            columns[total] = self.area @ values / self.area.sum()
+        return pd.DataFrame(columns, index=pd.DatetimeIndex(dates, name="date"))
+
+    def units(self, variable):
+        return self.variables[variable]["units"]
+
+
+def version_dir(version=VERSION, data_dir=DATA_DIR):
+    return os.path.join(data_dir, f"v{version}")
+
+
+@st.cache_resource(show_spinner=False)
+def load_dataset(version=VERSION):
+    """The dataset, mapped once per process and shared by every session."""
+    return LakeDataset(version_dir(version))
+
+
+def _smooth_noise(rng, shape, scale, days):
+    """Red noise: white noise smoothed over about ``days`` days along the last axis."""
+    kernel = np.exp(-np.arange(4 * days) / days)
+    kernel /= np.sqrt((kernel ** 2).sum())
+    white = rng.normal(0.0, scale, shape[:-1] + (shape[-1] + len(kernel) - 1,))
+    return np.apply_along_axis(lambda row: np.convolve(row, kernel, mode="valid"), -1, white)
+
+
+def build_sample(directory, start=SAMPLE_START, end=SAMPLE_END, seed=SAMPLE_SEED):
+    """Write the synthetic sample as version 1 into ``directory``."""
+    rng = np.random.default_rng(seed)
+    dates = np.arange(np.datetime64(start, "D"), np.datetime64(end, "D") + 1)
+    day_of_year = (dates - dates.astype("datetime64[Y]")).astype(np.int64)
+    years = dates.astype("datetime64[Y]").astype(np.int64) + 1970
+    elapsed = (years - years[0]) + day_of_year / 365.25
+    names, area, mean_temp, amplitude, peak_ice, mean_level = (np.array(column) for column in zip(*SAMPLE_LAKES))
+    lakes, days = len(names), len(dates)
+
+    # Winter severity: one draw per winter shared by all lakes, plus a little per lake
+    winter = years + (day_of_year > 200)  # August to December count toward the next winter
+    severity = rng.normal(0.0, 1.0, winter.max() - winter.min() + 1)[winter - winter.min()]
+    severity = severity[None, :] + rng.normal(0.0, 0.3, (lakes, 1))
+    in_winter = np.exp(-(((day_of_year - ICE_PEAK_DAY + 182) % 365.25 - 182) / 45.0) ** 2)
+
+    seasonal = np.cos(2 * np.pi * (day_of_year - TEMPERATURE_PEAK_DAY) / 365.25)
+    temperature = (mean_temp[:, None] + amplitude[:, None] * seasonal[None, :]
+                   + WARMING_PER_YEAR * elapsed[None, :] - 1.2 * severity * in_winter[None, :]
+                   + _smooth_noise(rng, (lakes, days), 0.6, 6))
+    temperature = np.maximum(temperature, 0.0)
+
+    shape = np.exp(-(((day_of_year - ICE_PEAK_DAY + 182) % 365.25 - 182) / 32.0) ** 2)
+    peak = np.clip(peak_ice[:, None] * np.exp(0.45 * severity - 0.015 * elapsed[None, :]), 0.0, 98.0)
+    ice = np.clip(peak * shape[None, :] + _smooth_noise(rng, (lakes, days), 2.0, 4) * shape[None, :], 0.0, 100.0)
+
+    # Levels: seasonal rise to a summer high plus multi-year swings. Michigan and
+    # Huron are joined at the Straits of Mackinac, so they share one series.
+    swings = np.cumsum(rng.normal(0.0, 0.12, (lakes, years.max() - years.min() + 2)), axis=1)
+    swings -= swings.mean(axis=1, keepdims=True)
+    swing = np.array([np.interp(elapsed, np.arange(row.size), row) for row in swings])
+    level = (mean_level[:, None] + 0.15 * np.cos(2 * np.pi * (day_of_year - 200) / 365.25)[None, :]
+             + swing + _smooth_noise(rng, (lakes, days), 0.01, 3))
+    huron = list(names).index("Huron")
+    level[huron] = level[list(names).index("Michigan")]
+
+    os.makedirs(directory, exist_ok=True)
+    variables = {}
+    for name, values, units, description in (
+            ("ice_cover", ice, "%", "share of the lake surface covered by ice"),
+            ("surface_temperature", temperature, "°C", "lake-average surface water temperature"),
+            ("water_level", level, "m", "lake-average water level above IGLD 1985 datum")):
+        path = os.path.join(directory, f"{name}.npy")
+        np.save(path, np.ascontiguousarray(values, dtype=np.float32))
+        variables[name] = {"file": f"{name}.npy", "units": units, "description": description,
+                           "sha256": file_sha256(path)}
+    manifest = {
+        "name": "great-lakes-daily",
+        "version": "1",
+        "synthetic": True,
+        "about": ("Synthetic sample generated by lake_data.py build (seed "
+                  f"{seed}). Seasonal cycles, winter severity and trends are "
+                  "modelled on the typical magnitudes of Great Lakes records; "
+                  "the daily values are not observations and the calendar years "
+                  "are placeholders, not the winters they would name."),
+        "start": str(dates[0]),
+        "days": days,
+        "lakes": [{"name": str(name), "area_sq_mi": int(size)} for name, size in zip(names, area)],
+        "variables": variables,
+    }
+    with open(os.path.join(directory, MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    return manifest
+
+
+def main(argv):
+    if argv[:1] == ["build"]:
+        manifest = build_sample(version_dir("1"))
+        print(f"wrote v{manifest['version']}: {len(manifest['lakes'])} lakes x {manifest['days']} days")
+        return
+    dataset = LakeDataset(version_dir())
+    dataset.verify()
+    if dataset.synthetic:
+        years = (dataset.dates[-1] - dataset.dates[0]).astype(int) / 365.25
+        print(f"v{dataset.version} (synthetic sample), {years:.0f} sample years")
+    else:
+        print(f"v{dataset.version} (records), {dataset.dates[0]} to {dataset.dates[-1]}")
+    for name in dataset.variables:
+        _, values = dataset.window(name)
+        means = ", ".join(f"{lake} {row.mean():.1f}" for lake, row in zip(dataset.lakes, values))
+        print(f"  {name} ({dataset.units(name)}) mean: {means}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
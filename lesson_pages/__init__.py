@@ -0,0 +1,32 @@
+"""One module per interactive lesson page, imported the first time a student opens it.
+
+Streamlit re-executes ``app.py`` on every interaction, so keeping the page
+bodies here means a rerun only runs the active page; ``render`` looks the
+page up in ``PAGES`` and imports its module on first use, after which
+Python's module cache keeps it loaded for every session. Pages that are
+only text and quick checks have no module at all and are drawn straight
+from ``content/pages/<page>.json``.
+"""
+import importlib
+
+import content_store
+from lesson_pages.blocks import show_content_page
+
+PAGES = {
+    "satellites": ("lesson_pages.satellites", "show_satellites"),
+    "satellite_lab": ("lesson_pages.satellite_lab", "show_satellite_lab"),
+    "3d_printing": ("lesson_pages.printing", "show_3d_printing"),
+    "design_challenge": ("lesson_pages.design_challenge", "show_design_challenge"),
+    "quiz": ("lesson_pages.quiz", "show_quiz"),
+    "downloads": ("lesson_pages.downloads", "show_downloads"),
+    "class_dashboard": ("lesson_pages.class_dashboard", "show_class_dashboard"),
+}
+
+
+def render(page):
+    """Draw ``page``, falling back to the home page for unknown keys."""
+    if page in PAGES:
+        module_name, function_name = PAGES[page]
+        getattr(importlib.import_module(module_name), function_name)()
+        return
+    show_content_page(page if content_store.has_page(page) else "home")
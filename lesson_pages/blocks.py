@@ -0,0 +1,99 @@
+"""Draw compiled content blocks from ``content_store``."""
+import streamlit as st
+
+import content_store
+import item_bank
+from lesson_pages.common import award_xp
+
+DEVELOPER_CREDIT = "Developed by Xavier Honablue, M.Ed. for Grosse Pointe South High School"
+
+
+def page_header(title):
+    st.markdown(f'<div class="main-header">{title}</div>', unsafe_allow_html=True)
+    st.markdown(f'<p class="developer-credit">{DEVELOPER_CREDIT}</p>', unsafe_allow_html=True)
+
+
+def show_content_page(page, slots=None):
+    """Draw a page that is described entirely by ``content/pages/<page>.json``."""
+    content = content_store.load_page(page)
+    page_header(content["title"])
+    render_blocks(content["blocks"], slots)
+
+
+def render_blocks(blocks, slots=None):
+    """Draw ``blocks`` in order; ``slots`` maps slot names to callables for interactive parts."""
+    for block in blocks:
+        _render_block(block, slots or {})
+
+
+def _render_block(block, slots):
+    kind = block["type"]
+    if kind == "html":
+        st.markdown(block["html"], unsafe_allow_html=True)
+    elif kind in content_store.TEXT_BLOCKS:
+        getattr(st, kind)(block[kind])
+    elif kind == "divider":
+        st.markdown("---")
+    elif kind == "metric":
+        st.metric(*block["metric"], help=block.get("help"))
+    elif kind == "table":
+        st.table(block["table"])
+    elif kind in ("columns", "tabs"):
+        containers = st.columns(block["columns"]) if kind == "columns" else st.tabs(block["tabs"])
+        for container, children in zip(containers, block["blocks"]):
+            with container:
+                render_blocks(children, slots)
+    elif kind == "expander":
+        with st.expander(block["expander"], expanded=block.get("expanded", False)):
+            render_blocks(block["blocks"], slots)
+    elif kind == "reveal":
+        if st.button(block["reveal"], key=block.get("key")):
+            render_blocks(block["blocks"], slots)
+    elif kind == "check":
+        show_check(block["check"])
+    elif kind == "bonus":
+        show_bonus(block["bonus"])
+    elif kind == "slot":
+        slots[block["slot"]]()
+
+
+def show_check(check):
+    """Multiple-choice quick check with XP and an optional achievement for finishing a set."""
+    choice = st.radio(check["question"], check["options"], key=check["key"])
+
+    if not st.button("Check Answer", key=check["button_key"]):
+        return
+    if not item_bank.load_bank("checks").is_correct(check["key"], choice):
+        st.error(check["incorrect"])
+        return
+
+    achievement = check.get("achievement")
+    if not achievement:
+        first_steps = "🌟 First Steps" if check.get("first_steps") and not st.session_state.achievements else None
+        if award_xp(check["xp"], check["check_id"], first_steps):
+            st.balloons()
+            st.success(check["correct"])
+        else:
+            st.success(check["correct_again"])
+        return
+
+    newly_awarded = award_xp(check["xp"], check["check_id"])
+    if st.session_state.completed_checks.has_all(achievement["requires_mask"]):
+        if st.session_state.achievements.add(achievement["name"]):
+            st.balloons()
+            st.success(check["achievement_unlocked"])
+        else:
+            st.success(check["achievement_again"])
+    elif newly_awarded:
+        st.success(check["correct"])
+    else:
+        st.success(check["correct_again"])
+
+
+def show_bonus(bonus):
+    """Award a one-time bonus achievement once every check in ``requires`` is done."""
+    if st.session_state.completed_checks.has_all(bonus["requires_mask"]):
+        if st.session_state.achievements.add(bonus["name"]):
+            award_xp(bonus["xp"], bonus["check_id"])
+            st.balloons()
+            st.success(bonus["message"])
@@ -0,0 +1,103 @@
+"""Teacher class dashboard: results of every student who saved progress."""
+import contextlib
+import os
+import secrets
+import time
+
+import streamlit as st
+
+import packets
+import results_export
+from class_stats import stats as class_stats
+from lesson_pages.blocks import page_header
+from lesson_pages.common import teacher_unlocked
+
+GRADEBOOK_PREFIX = "gradebook-"
+GRADEBOOK_TTL = 15 * 60  # seconds a prepared gradebook link stays valid
+
+
+def _discard_expired_gradebooks():
+    if not os.path.isdir(packets.BUNDLE_DIR):
+        return
+    cutoff = time.time() - GRADEBOOK_TTL
+    for name in os.listdir(packets.BUNDLE_DIR):
+        path = os.path.join(packets.BUNDLE_DIR, name)
+        # Another teacher's dashboard may be sweeping at the same time
+        with contextlib.suppress(FileNotFoundError):
+            if name.startswith(GRADEBOOK_PREFIX) and os.path.getmtime(path) < cutoff:
+                os.remove(path)
+
+
+def _publish_gradebook():
+    """Stream the CSV export into the static folder; returns (file name, size in bytes).
+
+    Served like the presentation bundle, straight from disk, so the export is
+    never held in memory. The static route has no access control, so the name
+    carries a random token and the file is removed after ``GRADEBOOK_TTL``.
+    """
+    os.makedirs(packets.BUNDLE_DIR, exist_ok=True)
+    file_name = f"{GRADEBOOK_PREFIX}{time.strftime('%Y%m%d')}-{secrets.token_urlsafe(16)}.csv"
+    path = os.path.join(packets.BUNDLE_DIR, file_name)
+    temporary = os.path.join(packets.BUNDLE_DIR, f".{file_name}.tmp")
+    with open(temporary, "wb") as f:
+        results_export.exporter.write_csv(f)
+    os.replace(temporary, path)
+    return file_name, os.path.getsize(path)
+
+
+def show_class_dashboard():
+    page_header("📊 Class Dashboard")
+    if not teacher_unlocked():
+        st.error("The class dashboard is for teachers: enter the teacher passcode under **Teacher Mode** in the sidebar.")
+        return
+    class_stats.refresh()
+    st.caption("Students who entered a Student ID. Totals update as new work is saved; "
+               "click **Refresh** to pull in the latest.")
+    st.button("🔄 Refresh", key="refresh_class_dashboard")
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Students", class_stats.students())
+    col2.metric("Quizzes submitted", class_stats.quizzes_submitted())
+    col3.metric("Missions designed", int(class_stats.mission_choices()["missions"].sum()))
+
+    st.markdown("### 📝 Quiz scores")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.bar_chart(class_stats.score_distribution(), x_label="Score", y_label="Students")
+    with col2:
+        st.dataframe(class_stats.miss_rates(), hide_index=True)
+
+    st.markdown("### 🏆 XP and rank badges")
+    percentiles = class_stats.xp_percentiles()
+    if percentiles:
+        columns = st.columns(len(percentiles))
+        for column, (name, value) in zip(columns, percentiles.items()):
+            column.metric(f"XP {name}", f"{value:.0f}")
+    badges = class_stats.badges()
+    for column, (badge, count) in zip(st.columns(len(badges)), badges.items()):
+        column.metric(badge, int(count))
+
+    st.markdown("### 🛰️ Mission choices by scenario")
+    choices = class_stats.mission_choices()
+    if choices.empty:
+        st.info("No mission designs saved yet.")
+    else:
+        st.dataframe(choices, hide_index=True)
+
+    st.markdown("### 📤 Gradebook export")
+    export_stats = results_export.exporter.stats()
+    st.caption(f"Every quiz and mission submission is appended to date-partitioned Parquet files in "
+               f"`{results_export.EXPORT_DIR}` ({export_stats['files']} files, "
+               f"{export_stats['pending']} submissions waiting to be written).")
+    _discard_expired_gradebooks()
+    if st.button("Prepare gradebook CSV", key="prepare_gradebook_csv"):
+        results_export.exporter.flush()
+        with st.spinner("Preparing..."):
+            st.session_state.gradebook_csv = _publish_gradebook()
+    gradebook = st.session_state.get("gradebook_csv")
+    if gradebook and os.path.exists(os.path.join(packets.BUNDLE_DIR, gradebook[0])):
+        file_name, size = gradebook
+        st.link_button("Download gradebook CSV", f"{packets.BUNDLE_URL}/{file_name}")
+        st.caption(f"{size / 1e6:.1f} MB · the link works for {GRADEBOOK_TTL // 60} minutes")
+    st.caption("The same CSV can be streamed from the command line: "
+               "`python results_export.py csv --start YYYY-MM-DD > gradebook.csv`.")
@@ -0,0 +1,87 @@
+"""Helpers shared by several lesson pages."""
+import hmac
+import os
+
+import streamlit as st
+
+from feedback_scheduler import scheduler as feedback_scheduler
+
+
+# XP Award Function
+def award_xp(points, check_id, achievement_name=None):
+    """Award XP points and track completed checks to prevent double-counting"""
+    if st.session_state.completed_checks.add(check_id):
+        st.session_state.xp_points += points
+        if achievement_name:
+            st.session_state.achievements.add(achievement_name)
+        return True
+    return False
+
+# Streamed feedback display
+@st.fragment(run_every=0.3)
+def show_feedback_stream(job, waiting_message):
+    """Poll a background feedback job; only this fragment reruns while text streams in"""
+    if job.done:
+        st.rerun()
+    st.markdown("### 💬 Professor Xavier's Feedback:")
+    position = feedback_scheduler.position(job)
+    if position:
+        st.info(f"⏳ You're #{position} in line — Professor Xavier is helping other students first. Feel free to keep exploring!")
+    elif job.text:
+        st.markdown(f"""
+        <div class="success-box">
+        {job.text} ▌
+        </div>
+        """, unsafe_allow_html=True)
+    else:
+        st.info(f"⏳ {waiting_message}")
+
+
+
+# Teacher mode: the class dashboard, gradebook export and instrumentation panel
+TEACHER_PASSCODE = "TEACHER_PASSCODE"
+
+
+def _teacher_passcode():
+    """The passcode from the environment, then Streamlit secrets; None when neither sets one."""
+    if os.environ.get(TEACHER_PASSCODE):
+        return os.environ[TEACHER_PASSCODE]
+    try:
+        return st.secrets.get(TEACHER_PASSCODE) or None
+    except Exception:
+        return None
+
+
+def teacher_unlocked():
+    """True once this session has entered the passcode; always False when none is configured."""
+    return bool(_teacher_passcode()) and st.session_state.get("teacher_unlocked", False)
+
+
+def _check_teacher_passcode():
+    entered = st.session_state.teacher_passcode_input
+    passcode = _teacher_passcode()
+    st.session_state.teacher_unlocked = bool(passcode) and hmac.compare_digest(
+        entered.encode("utf-8"), str(passcode).encode("utf-8"))
+    st.session_state.teacher_passcode_rejected = bool(entered) and not st.session_state.teacher_unlocked
+    st.session_state.teacher_passcode_input = ""
+
+
+def _leave_teacher_mode():
+    st.session_state.teacher_unlocked = False
+    if st.session_state.get("page") == "class_dashboard":
+        st.session_state.page = "home"
+
+
+def teacher_login():
+    """Sidebar passcode box; returns whether teacher mode is on for this session."""
+    if not _teacher_passcode():
+        st.caption(f"Teacher mode is off: set {TEACHER_PASSCODE} in the environment or secrets to enable it.")
+        return False
+    if teacher_unlocked():
+        st.button("🔒 Leave teacher mode", on_click=_leave_teacher_mode)
+        return True
+    st.text_input("Teacher passcode", type="password", key="teacher_passcode_input",
+                  on_change=_check_teacher_passcode)
+    if st.session_state.get("teacher_passcode_rejected"):
+        st.error("That passcode isn't right.")
+    return False
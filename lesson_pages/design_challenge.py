@@ -0,0 +1,467 @@
+"""Design Challenge page: mission builder and Professor Xavier feedback."""
+import datetime
+
+import pandas as pd
+import streamlit as st
+
+import content_store
+import design_score
+import feedback_cache
+import feedback_engine
+import ground_track
+import mission_report
+import orbit_sim
+import results_export
+import tradeoffs
+from feedback_backends import feature_settings
+from feedback_stream import cached_feedback_job, start_feedback_job
+from lesson_pages.blocks import page_header, render_blocks
+from lesson_pages.common import award_xp, show_feedback_stream
+
+
+def show_design_challenge():
+    content = content_store.load_page("design_challenge")
+    page_header(content["title"])
+    render_blocks(content["sections"]["intro"])
+    
+    scenarios = content["scenarios"]
+    mission_type = st.selectbox("Select your mission:", list(scenarios.keys()))
+    
+    selected_scenario = scenarios[mission_type]
+    
+    with st.expander("📋 Mission Details & Recommendations", expanded=True):
+        st.write(f"**Goal:** {selected_scenario['description']}")
+        st.write(f"**Challenge:** {selected_scenario['challenges']}")
+        st.write(f"**Michigan Relevance:** {selected_scenario['michigan_relevance']}")
+        st.write("**Suggested Measurements:**")
+        for measure in selected_scenario['measures']:
+            st.write(f"- {measure}")
+        
+        st.markdown("---")
+        st.markdown("#### 💡 Professor Xavier's Recommendations:")
+        st.success(f"**Recommended Orbit:** {selected_scenario['recommended_orbit']}\n\n**Why:** {selected_scenario['orbit_reason']}")
+        st.info(f"**Recommended Instruments:** {', '.join(selected_scenario['recommended_instruments'])}")
+    
+    # Educational content about orbits and instruments
+    render_blocks(content["sections"]["learn"],
+                  slots={"orbit_map": lambda: show_orbit_map(mission_type, selected_scenario, content["orbits"])})
+    
+    with st.form("mission_design"):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            mission_name = st.text_input("Mission Name:", placeholder="e.g., GreatLakes-Watch-1")
+            
+            num_sats = st.slider("Number of Satellites:", 1, 20, 4)
+            
+            # Simplified orbit selection with recommendations shown
+            st.markdown(f"**Orbit Type:** *(Professor Xavier recommends: {selected_scenario['recommended_orbit']})*")
+            orbit_type = st.selectbox("Select Orbit:", content["orbits"], label_visibility="collapsed")
+        
+        with col2:
+            mission_goal = st.text_area("Mission Goal (What problem will you solve?):", 
+                placeholder="Describe the Earth science problem your mission will address...")
+            
+            # Simplified instrument selection with recommendations
+            st.markdown(f"**Instruments:** *(Recommended: {', '.join(selected_scenario['recommended_instruments'])})*")
+            instruments = st.multiselect("Select Instruments:", content["instruments"], label_visibility="collapsed")
+        
+        st.markdown("### Step 3: Consider Engineering Trade-offs")
+        
+        col3, col4 = st.columns(2)
+        
+        with col3:
+            use_3d_printing = st.checkbox("Use 3D-printed fuel tanks?")
+            if use_3d_printing:
+                st.success(f"✅ Cost savings: ~${tradeoffs.PRINTING_SAVINGS_PER_SATELLITE:,} per satellite")
+            
+            data_priority = st.select_slider("Data Priority:",
+                options=["Coverage (more area)", "Balanced", "Resolution (more detail)"])
+        
+        with col4:
+            budget = st.select_slider("Budget Level:",
+                options=["Low ($10M)", "Medium ($50M)", "High ($200M)"])
+            
+            timeline = st.select_slider("Development Timeline:",
+                options=["Fast (1 year)", "Standard (3 years)", "Extended (5 years)"])
+        
+        st.markdown("### Step 4: Michigan Impact Statement")
+        
+        michigan_impact = st.text_area("How will your mission benefit Michigan specifically?",
+            placeholder="Explain how your satellite mission will help Michigan communities, industries, or ecosystems...")
+        
+        submitted = st.form_submit_button("Submit Mission Design")
+        
+        if submitted:
+            # Award XP for completing the design challenge
+            if award_xp(50, "design_challenge", "🔧 Space Engineer"):
+                st.balloons()
+                st.success("🎉 Mission Design Submitted! +50 XP! 🎖️ Achievement Unlocked: Space Engineer!")
+            else:
+                st.success("🎉 Mission Design Submitted!")
+            
+            # Calculate estimated cost
+            design = {"type": mission_type, "num_satellites": num_sats, "orbit": orbit_type,
+                      "instruments": instruments, "use_3d_printing": use_3d_printing,
+                      "timeline": timeline, "budget": budget}
+            base_cost = tradeoffs.mission_cost(design)
+            match = design_score.load_scorer().score(design)
+            
+            st.markdown("### 📊 Mission Summary")
+            
+            summary_col1, summary_col2, summary_col3 = st.columns(3)
+            
+            with summary_col1:
+                st.metric("Satellites", num_sats)
+            with summary_col2:
+                st.metric("Estimated Cost", f"${base_cost/1000000:.1f}M")
+            with summary_col3:
+                st.metric("Instruments", len(instruments))
+            
+            # Simulate one day of the constellation over the scenario's region
+            region = selected_scenario.get("region", {"name": "Great Lakes", "bounds": orbit_sim.GREAT_LAKES})
+            coverage = orbit_sim.simulate(orbit_type, num_sats, region["bounds"])
+            
+            coverage_col1, coverage_col2, coverage_col3 = st.columns(3)
+            
+            with coverage_col1:
+                st.metric(f"{region['name']} Covered", f"{coverage.coverage:.0%}")
+            with coverage_col2:
+                st.metric("Typical Revisit", "Continuous" if coverage.revisit_hours == 0 else f"{coverage.revisit_hours:.1f} h")
+            with coverage_col3:
+                st.metric("Longest Gap", f"{coverage.max_gap_hours:.1f} h")
+            
+            st.caption(f"🛰️ Simulated over 24 hours: your constellation {orbit_sim.describe(coverage)} and keeps "
+                       f"a point in view {coverage.time_covered:.0%} of the day (one orbit takes "
+                       f"{coverage.period_minutes:.0f} minutes; a satellite counts once it is "
+                       f"{orbit_sim.MIN_ELEVATION_DEG:.0f}° above the horizon).")
+            
+            if match is not None:
+                st.metric("🎯 Scenario Match", f"{match.total:.0f}/100")
+                st.caption(f"Orbit {match.orbit:.0f}/{design_score.WEIGHTS['orbit']} · "
+                           f"Instruments {match.instruments:.0f}/{design_score.WEIGHTS['instruments']} · "
+                           f"Budget fit {match.budget:.0f}/{design_score.WEIGHTS['budget']}")
+            
+            st.markdown(f"""
+            **Mission:** {mission_name if mission_name else 'Unnamed Mission'}
+            
+            **Orbit:** {orbit_type}
+            
+            **Goal:** {mission_goal if mission_goal else 'Not specified'}
+            
+            **Michigan Impact:** {michigan_impact if michigan_impact else 'Not specified'}
+            
+            **3D Printing:** {'Yes - Cost optimized!' if use_3d_printing else 'No - Traditional manufacturing'}
+            """)
+            
+            if use_3d_printing:
+                st.info(f"💰 By using 3D-printed fuel tanks, you saved **${num_sats * tradeoffs.PRINTING_SAVINGS_PER_SATELLITE:,}** on this mission!")
+            
+            # Store mission data for AI feedback (and drop feedback for the previous design)
+            st.session_state.mission_feedback_job = None
+            st.session_state.instant_mission_feedback = False
+            st.session_state.mission_data = {
+                "name": mission_name,
+                "type": mission_type,
+                "num_satellites": num_sats,
+                "orbit": orbit_type,
+                "recommended_orbit": selected_scenario['recommended_orbit'],
+                "instruments": instruments,
+                "recommended_instruments": selected_scenario['recommended_instruments'],
+                "goal": mission_goal,
+                "michigan_impact": michigan_impact,
+                "use_3d_printing": use_3d_printing,
+                "budget": budget,
+                "timeline": timeline,
+                "data_priority": data_priority,
+                "region": region["name"],
+                "coverage": coverage._asdict(),
+                "scenario_match": None if match is None else round(match.total, 1),
+                "submitted_on": datetime.date.today().isoformat(),
+            }
+            results_export.exporter.record("mission", st.session_state)
+    
+    show_tradeoff_explorer(mission_type)
+    
+    # AI Feedback Section (outside the form)
+    render_blocks(content["sections"]["feedback_intro"])
+    
+    if 'mission_data' in st.session_state and st.session_state.mission_data:
+        mission = st.session_state.mission_data
+        
+        feedback_col, instant_col = st.columns(2)
+        with feedback_col:
+            ask_professor = st.button("🎓 Get Feedback from Professor Xavier")
+        with instant_col:
+            ask_instant = st.button("⚡ Instant Feedback (no wait)", key="instant_mission_feedback_button")
+        
+        if ask_instant:
+            st.session_state.mission_feedback_job = None
+            st.session_state.instant_mission_feedback = True
+        
+        if ask_professor:
+            st.session_state.instant_mission_feedback = False
+            
+            coverage_line = "Not simulated"
+            if mission.get('coverage'):
+                coverage = orbit_sim.Coverage(**mission['coverage'])
+                coverage_line = (f"{mission['region']}: the constellation {orbit_sim.describe(coverage)}; "
+                                 f"{coverage.coverage:.0%} of the region is seen in 24 hours and the longest gap is "
+                                 f"{coverage.max_gap_hours:.1f} hours")
+            
+            # Build a detailed educational feedback prompt
+            feedback_prompt = f"""You are Professor Xavier, a satellite engineering expert and passionate Earth Science educator helping high school students in Michigan design satellite missions.
+
+Your role is to provide DEEPLY EDUCATIONAL feedback that teaches students the science behind their choices. Don't just say "good choice" - explain the physics, the engineering trade-offs, and real-world examples.
+
+## Student's Mission Design:
+- **Mission Name:** {mission['name'] if mission['name'] else 'Not named'}
+- **Mission Type:** {mission['type']}
+- **Number of Satellites:** {mission['num_satellites']}
+- **Orbit Selected:** {mission['orbit']} (Recommended was: {mission['recommended_orbit']})
+- **Instruments Selected:** {', '.join(mission['instruments']) if mission['instruments'] else 'None selected'}
+- **Recommended Instruments:** {', '.join(mission['recommended_instruments'])}
+- **Mission Goal:** {mission['goal'] if mission['goal'] else 'Not specified'}
+- **Michigan Impact:** {mission['michigan_impact'] if mission['michigan_impact'] else 'Not specified'}
+- **Using 3D Printing:** {'Yes' if mission['use_3d_printing'] else 'No'}
+- **Budget:** {mission['budget']}
+- **Timeline:** {mission['timeline']}
+- **Data Priority:** {mission['data_priority']}
+- **Simulated Coverage (24 hours):** {coverage_line}
+
+## Your Feedback Must Include:
+
+### 1. ORBIT ANALYSIS (Be specific and educational!)
+- Explain the PHYSICS of why their orbit choice does or doesn't match their mission
+- For LEO: Discuss orbital velocity (~7.8 km/s), revisit time, spatial resolution benefits
+- For GEO: Explain why satellites "hover" (orbital period = Earth's rotation = 24 hrs), and the 35,786 km altitude requirement
+- For Polar: Explain how Earth rotates beneath the satellite, enabling full global coverage
+- Give a SPECIFIC example: "For monitoring Great Lakes algal blooms, you need X because..."
+- If they chose differently than recommended, explain the trade-offs honestly
+
+### 2. INSTRUMENT DEEP DIVE (Teach the science!)
+For EACH instrument they selected, explain:
+- What electromagnetic spectrum it uses (visible, infrared, microwave, radar)
+- The physical principle behind how it works
+- SPECIFICALLY how it helps their mission type
+
+Example explanations to include:
+- **Radar Altimeter:** "This sends microwave pulses at ~13.6 GHz down to the surface. By measuring the round-trip time (at the speed of light), we can calculate surface height to within centimeters. For Great Lakes monitoring, this lets us track water level changes that affect shipping - every inch of water level change affects how much cargo ships can carry!"
+
+- **Multispectral Imager:** "Healthy plants reflect 40-50% of near-infrared light but only 10-20% of red light because chlorophyll absorbs red for photosynthesis. We calculate NDVI = (NIR - Red)/(NIR + Red). Values near +1 mean healthy vegetation; values near 0 mean stressed or dead plants."
+
+- **Thermal Sensor:** "Everything above absolute zero emits infrared radiation according to the Stefan-Boltzmann law. Warmer objects emit more, and at shorter wavelengths (Wien's law). Great Lakes surface temps of 4°C vs 20°C dramatically affect lake-effect snow - warmer water = more evaporation = more snow!"
+
+- **SAR:** "Unlike optical sensors that need sunlight, SAR creates its own 'illumination' using radar pulses. Different surfaces have different radar backscatter - water appears dark (smooth surface reflects radar away), while ice appears bright (rough surface scatters radar back). This is why SAR can map Great Lakes ice even during cloudy Michigan winters!"
+
+- **Microwave Radiometer:** "Water molecules emit microwave radiation based on their temperature. Microwaves at ~6.9 GHz penetrate clouds, so we can measure sea surface temperature even when it's overcast. For Michigan, this helps track Great Lakes temps that drive lake-effect weather."
+
+- **Spectrometer:** "Different gases absorb specific wavelengths of light - CO2 absorbs at 4.26 μm and 15 μm, methane at 3.3 μm. By measuring which wavelengths are 'missing' from reflected sunlight, we can identify and quantify atmospheric gases. Detroit's air quality monitoring uses this principle!"
+
+### 3. ENGINEERING TRADE-OFFS
+- Discuss how their budget/timeline choices affect what's realistic
+- If they chose 3D printing, explain the specific manufacturing advantages (lattice structures, reduced part count, optimized fuel flow channels)
+- Connect number of satellites to revisit time using the simulated coverage above: "With {mission['num_satellites']} satellites in {mission['orbit']}, you'll get coverage every X hours..."
+
+### 4. MICHIGAN CONNECTION
+- Make specific connections to how this mission would help Michigan
+- Reference real examples: NOAA GLERL, CoastWatch, Landsat imagery of Great Lakes
+
+### 5. HOMEWORK RECOMMENDATIONS WITH DIRECT LINKS
+Based on the student's mission type and the science concepts involved, recommend 3-4 specific lessons from CK-12 or Khan Academy for homework practice. Use these EXACT URLs:
+
+**For Great Lakes/Ocean Monitoring missions, recommend:**
+- "CK-12: Ocean Currents" - https://www.ck12.org/earth-science/ocean-currents/
+- "Khan Academy: The water cycle" - https://www.khanacademy.org/science/biology/ecology/biogeochemical-cycles/v/the-water-cycle
+- "CK-12: Electromagnetic Spectrum" - https://www.ck12.org/physics/electromagnetic-spectrum/
+- "NOAA: Great Lakes Monitoring" - https://coastwatch.glerl.noaa.gov/
+
+**For Hurricane/Storm Tracking missions, recommend:**
+- "CK-12: Layers of the Atmosphere" - https://www.ck12.org/earth-science/layers-of-the-atmosphere/
+- "Khan Academy: Climate and weather" - https://www.khanacademy.org/science/cosmology-and-astronomy/earth-history-topic/earth-title-topic/v/weather-vs-climate
+- "CK-12: Air Masses and Fronts" - https://www.ck12.org/earth-science/air-masses/
+- "CK-12: Heat Transfer" - https://www.ck12.org/physics/heat-transfer/
+
+**For Agriculture Monitoring missions, recommend:**
+- "Khan Academy: Photosynthesis" - https://www.khanacademy.org/science/biology/photosynthesis-in-plants/introduction-to-photosynthesis/v/photosynthesis
+- "CK-12: Soil Formation" - https://www.ck12.org/earth-science/soil-formation/
+- "CK-12: Electromagnetic Spectrum" - https://www.ck12.org/physics/electromagnetic-spectrum/
+- "NASA: Measuring Vegetation from Space" - https://earthobservatory.nasa.gov/features/MeasuringVegetation
+
+**For Ice/Climate Monitoring missions, recommend:**
+- "Khan Academy: Global climate change" - https://www.khanacademy.org/science/cosmology-and-astronomy/earth-history-topic/earth-title-topic/v/climate-change
+- "CK-12: The Greenhouse Effect" - https://www.ck12.org/earth-science/greenhouse-effect/
+- "CK-12: Reflection and Absorption of Light" - https://www.ck12.org/physics/reflection-of-light/
+- "NASA: Climate Kids - Ice" - https://climatekids.nasa.gov/arctic-sea-ice/
+
+**For ALL missions (satellite technology), also consider:**
+- "NASA: How Satellites Work" - https://spaceplace.nasa.gov/how-orbits-work/
+- "CK-12: Waves and Electromagnetic Radiation" - https://www.ck12.org/physics/electromagnetic-wave/
+- "Khan Academy: Introduction to waves" - https://www.khanacademy.org/science/physics/mechanical-waves-and-sound/introduction-to-waves/v/introduction-to-waves
+
+Format this section as:
+"📚 **Homework Resources:**
+To strengthen your understanding of the science behind your mission, study these resources:
+1. [Resource name](URL) - [brief explanation of why it's relevant to their mission]
+2. [Resource name](URL) - [brief explanation of why it's relevant to their mission]
+3. [Resource name](URL) - [brief explanation of why it's relevant to their mission]"
+
+### 6. THOUGHTFUL QUESTION
+End with a specific, thought-provoking question that extends their learning, such as:
+- "What would happen to your data quality if one satellite failed?"
+- "How might climate change affect what your instruments detect over the next 20 years?"
+- "Could your satellite detect the difference between natural algae and a harmful algal bloom?"
+
+Write 5-6 substantive paragraphs. Be encouraging but prioritize TEACHING. Use specific numbers, wavelengths, and scientific principles. Make this a genuine learning experience!"""
+
+            settings = feature_settings("mission_review")
+            
+            # Identical designs get the stored feedback; new ones stream on a background thread
+            cached_feedback = feedback_cache.get(feedback_prompt, settings.model)
+            if cached_feedback is not None:
+                st.session_state.mission_feedback_job = cached_feedback_job(feedback_prompt, cached_feedback)
+            else:
+                st.session_state.mission_feedback_job = start_feedback_job(
+                    feedback_prompt, settings, st.session_state.session_id, "mission_review",
+                    on_success=lambda prompt, text: feedback_cache.put(prompt, settings.model, text))
+        
+        job = st.session_state.get('mission_feedback_job')
+        report_feedback = None
+        
+        if job is not None and not job.done:
+            show_feedback_stream(job, "Professor Xavier is reviewing your mission design...")
+        elif job is not None:
+            if job.ok:
+                feedback_text = job.text
+                report_feedback = feedback_text
+                
+                st.markdown("### 💬 Professor Xavier's Feedback:")
+                st.markdown(f"""
+                <div class="success-box">
+                {feedback_text}
+                </div>
+                """, unsafe_allow_html=True)
+                
+                # Award bonus XP for getting feedback
+                if award_xp(10, "professor_feedback"):
+                    st.success("🎉 +10 XP for seeking expert feedback!")
+                
+                if job.from_cache:
+                    st.caption("⚡ Served from saved feedback for an identical design")
+                elif job.time_to_first_token is not None:
+                    st.caption(f"⏱️ First words arrived after {job.time_to_first_token:.1f}s")
+            else:
+                # API unavailable, rate limited or queue full: rule-based feedback
+                report_feedback = feedback_engine.mission_feedback(mission)
+                st.markdown("### 💬 Professor Xavier's Feedback:")
+                st.success(report_feedback)
+        elif st.session_state.get('instant_mission_feedback'):
+            report_feedback = feedback_engine.mission_feedback(mission)
+            st.markdown("### ⚡ Instant Feedback:")
+            st.success(report_feedback)
+        
+        if job is None or job.done:
+            show_mission_report(mission, report_feedback)
+    else:
+        st.warning("👆 Please submit your mission design above first, then return here for feedback!")
+
+
+@st.fragment(run_every=0.5)
+def _wait_for_report(future):
+    """Poll the background render; only this fragment reruns until the PDF is ready"""
+    if future.done():
+        st.rerun()
+    st.caption("📄 Preparing your mission report PDF...")
+
+
+def show_mission_report(mission, feedback):
+    future = mission_report.renderer.request(mission, feedback, st.session_state.get("student_id") or None)
+    if not future.done():
+        _wait_for_report(future)
+        return
+    if future.exception() is not None:
+        st.caption("📄 The mission report PDF couldn't be prepared. Try submitting your design again.")
+        return
+    st.download_button("📄 Download Mission Report (PDF)", future.result(),
+                       file_name=mission_report.file_name(mission), mime="application/pdf",
+                       key="download_mission_report")
+    if not feedback:
+        st.caption("Get feedback from Professor Xavier to add it to your report.")
+
+
+@st.fragment
+def show_tradeoff_explorer(mission_type):
+    """Pareto frontier of cost vs science value; only this fragment reruns when a slider moves"""
+    st.markdown("### 📈 Trade-off Explorer")
+    st.caption("Every combination of satellites, orbit and instruments for this mission, priced and scored at once. "
+               "The points are the designs no cheaper design beats: the best science each budget can buy.")
+    
+    mission = st.session_state.get("mission_data") or {}
+    col1, col2 = st.columns(2)
+    with col1:
+        printing = st.checkbox("3D-printed fuel tanks", value=mission.get("use_3d_printing", False),
+                               key="tradeoff_printing")
+        budget = st.select_slider("Budget cap:", options=list(tradeoffs.BUDGETS),
+                                  value=mission.get("budget", "Medium ($50M)"), key="tradeoff_budget")
+    with col2:
+        timeline = st.select_slider("Timeline:", options=list(tradeoffs.TIMELINES),
+                                    value=mission.get("timeline", "Standard (3 years)"), key="tradeoff_timeline")
+        priority = st.select_slider("Data priority:", options=list(tradeoffs.PRIORITIES),
+                                    value=mission.get("data_priority", "Balanced"), key="tradeoff_priority")
+    
+    sweep = tradeoffs.load_sweep(mission_type)
+    frontier = sweep.frontier(printing, timeline, priority, budget)
+    if frontier.empty:
+        st.warning("No design fits this budget. Try a bigger budget or a longer timeline.")
+        return
+    
+    chart = frontier.assign(design=frontier["orbit"])
+    if mission.get("type") == mission_type:
+        cost, value = sweep.evaluate(mission["num_satellites"], mission["orbit"], mission["instruments"],
+                                     printing, timeline, priority)
+        chart = pd.concat([chart, pd.DataFrame([{"cost ($M)": cost / 1e6, "science value": value,
+                                                 "design": "⭐ Your design"}])])
+    st.scatter_chart(chart, x="cost ($M)", y="science value", color="design")
+    if mission.get("type") == mission_type:
+        match = design_score.load_scorer().score(dict(mission, use_3d_printing=printing, timeline=timeline,
+                                                      budget=budget))
+        if match is not None:
+            st.caption(f"⭐ Your design's scenario match with these settings: {match.total:.0f}/100")
+    
+    best = frontier.iloc[-1]
+    st.info(f"**Best design within {budget}:** {best['satellites']} satellite(s) in {best['orbit']} carrying "
+            f"{best['instruments']}: ${best['cost ($M)']:.1f}M for a science value of {best['science value']:.0f}/100")
+    with st.expander("All frontier designs"):
+        st.dataframe(frontier.round({"cost ($M)": 2, "science value": 1}), hide_index=True)
+
+
+@st.fragment
+def show_orbit_map(mission_type, scenario, orbits):
+    """Ground tracks and swaths over Michigan; only this fragment reruns when a control changes"""
+    st.markdown("#### 🗺️ Ground Track Explorer")
+    st.caption("Each line is the path a satellite traces over the ground and the dot is where it is at the end of the "
+               "window. The orange area is what the satellites' cameras can see along the way.")
+    
+    mission = st.session_state.get("mission_data") or {}
+    if mission.get("type") != mission_type:
+        mission = {}
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        orbit = st.selectbox("Orbit:", orbits, key="orbit_map_orbit",
+                             index=orbits.index(mission.get("orbit", scenario["recommended_orbit"])))
+    with col2:
+        satellites = st.slider("Satellites:", 1, 20, mission.get("num_satellites", 4), key="orbit_map_satellites")
+    with col3:
+        hours = st.select_slider("Hours shown:", options=[1, 3, 6, 12, 24], value=3, key="orbit_map_hours")
+    
+    region = scenario.get("region", {}).get("bounds", orbit_sim.GREAT_LAKES)
+    result = ground_track.render_map(orbit, satellites, hours, region)
+    st.image(result.image)
+    
+    if result.tracks_in_view == 0 and orbit_sim.ORBITS[orbit][1] == 0.0:
+        note = "Geostationary satellites hover over the equator, far south of this map, yet they see all of it."
+    elif result.tracks_in_view == 0:
+        note = "No satellite flies over this map in that window. Try more hours or more satellites."
+    else:
+        note = f"{result.tracks_in_view} of {satellites} satellite(s) pass over this map."
+    st.caption(f"{note} {result.swept:.0%} of the map is seen in {hours} hour(s).")
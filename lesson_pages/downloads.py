@@ -0,0 +1,94 @@
+"""Downloads page: printable lesson materials."""
+import streamlit as st
+
+import packets
+from lesson_pages.common import teacher_unlocked
+
+
+def _download(name, label, key):
+    """A Prepare button; the packet is only built and sent once it has been pressed."""
+    _, file_name, mime = packets.PACKETS[name]
+    if st.button(f"Prepare {label}", key=f"prepare_{key}"):
+        st.session_state[f"{key}_ready"] = True
+    if st.session_state.get(f"{key}_ready"):
+        with st.spinner("Preparing..."):
+            data = packets.packet(name)
+        st.download_button(f"Download {label}", data, file_name=file_name, mime=mime, key=key)
+
+
+def show_downloads():
+    st.markdown('<div class="main-header">📥 Downloads</div>', unsafe_allow_html=True)
+    st.markdown('<p class="developer-credit">Developed by Xavier Honablue, M.Ed. for Grosse Pointe South High School</p>', unsafe_allow_html=True)
+    
+    st.markdown("## 📄 Downloadable Materials")
+    
+    st.info("Download these materials for offline use or classroom distribution.")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### 📝 Student Materials")
+        
+        st.markdown("""
+        **Lesson Pages**
+        - 📄 Lesson text for every page, with data tables
+        - 📄 Quick-check questions
+        
+        **Worksheets**
+        - 📄 Design Challenge Worksheet
+        - 📄 Final Quiz with short-answer lines
+        """)
+        
+        _download("student", "Student Packet (PDF)", "download_student")
+    
+    with col2:
+        st.markdown("### 👩‍🏫 Teacher Materials")
+        
+        st.markdown("""
+        **Lesson Plans**
+        - 📄 Lesson Overview and Sequence (50-60 min)
+        - 📄 Learning Objectives
+        - 📄 Michigan Standards Alignment
+        
+        **Assessment**
+        - 📄 Answer Keys (quiz and quick checks)
+        - 📄 Scoring and Rank Thresholds
+        - 📄 Design Challenge Recommendations
+        """)
+        
+        # The packet holds the answer keys, so it is only offered in teacher mode
+        if teacher_unlocked():
+            _download("teacher", "Teacher Packet (PDF)", "download_teacher")
+        else:
+            st.info("🔒 Teacher mode required: enter the teacher passcode under **Teacher Mode** in the sidebar "
+                    "to download the teacher packet.")
+    
+    st.markdown("---")
+    st.markdown("### 🖼️ Presentation Materials")
+    
+    st.markdown("""
+    - 📊 Slide outline for every lesson page (Markdown, paste into your slide tool)
+    - 🗺️ Lesson data tables (CSV)
+    - 📄 Student packet (PDF)
+    - 🖼️ Slide decks, high-resolution images and maps supplied with the lesson
+    """)
+    
+    # Older bundles (which may hold files no longer meant to be public) stay reachable until removed
+    packets.discard_stale_bundles()
+    
+    # Built when asked for, then served from disk by Streamlit's static route instead
+    # of through a download button, which would hold the whole bundle in server memory
+    if st.button("Prepare Presentation Materials (ZIP)", key="prepare_presentation"):
+        st.session_state.presentation_ready = True
+    if st.session_state.get("presentation_ready"):
+        with st.spinner("Preparing..."):
+            parts = packets.presentation_bundle()
+        for number, (url, size) in enumerate(parts, start=1):
+            label = "Download Presentation Materials (ZIP)" if len(parts) == 1 else \
+                f"Download Presentation Materials, part {number} of {len(parts)} (ZIP)"
+            st.link_button(label, url)
+            if size > packets.STATIC_FILE_LIMIT:
+                st.warning(f"Part {number} is {size / 1e6:.0f} MB, more than Streamlit will serve. "
+                           "Download it with `python packets.py presentation` or from the reverse proxy.")
+            else:
+                st.caption(f"{size / 1e6:.1f} MB")
@@ -0,0 +1,33 @@
+"""3D printing innovation page; the text lives in content/pages/3d_printing.json."""
+import streamlit as st
+
+import tradeoffs
+from lesson_pages.blocks import show_content_page
+
+
+def show_3d_printing():
+    show_content_page("3d_printing", slots={"cost_calculator": show_cost_calculator})
+
+
+def show_cost_calculator():
+    num_satellites = st.slider("How many satellites in your mission?", 1, 50, 10)
+    
+    traditional_cost = num_satellites * tradeoffs.TANK_COST
+    printing_cost = num_satellites * tradeoffs.PRINTED_TANK_COST
+    savings = traditional_cost - printing_cost
+    savings_percent = (savings / traditional_cost) * 100
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("Traditional Cost", f"${traditional_cost:,}", 
+                 help=f"Based on ${tradeoffs.TANK_COST:,} per fuel tank")
+    
+    with col2:
+        st.metric("3D Printing Cost", f"${printing_cost:,}", 
+                 help=f"Based on ${tradeoffs.PRINTED_TANK_COST:,} per fuel tank")
+    
+    with col3:
+        st.metric("Savings", f"${savings:,}", f"-{savings_percent:.0f}%")
+    
+    st.success(f"💡 With 3D printing, you save **${savings:,}** on this mission! That's enough to launch {int(savings/printing_cost)} additional satellites!")
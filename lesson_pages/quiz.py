@@ -0,0 +1,215 @@
+"""Quiz & Assessment page with short-answer feedback."""
+import streamlit as st
+
+import content_store
+import feedback_engine
+import item_bank
+import results_export
+import feedback_cache
+from feedback_backends import feature_settings
+from feedback_stream import cached_feedback_job, start_feedback_job
+from lesson_pages.blocks import page_header, render_blocks
+from lesson_pages.common import award_xp, show_feedback_stream
+
+
+def show_quiz():
+    content = content_store.load_page("quiz")
+    page_header(content["title"])
+    render_blocks(content["blocks"])
+    
+    with st.form("final_quiz"):
+        choices = {}
+        for part in content["parts"]:
+            st.markdown(part["heading"])
+            
+            for item in part["items"]:
+                choices[item["key"]] = st.radio(item["question"], item["options"], key=item["key"])
+        
+        st.markdown(content["short_answer_heading"])
+        
+        q7, q8 = [st.text_area(item["question"], key=item["key"]) for item in content["short_answers"]]
+        
+        submitted = st.form_submit_button("Submit Quiz")
+        
+        if submitted:
+            bank = item_bank.load_bank("quiz")
+            total = len(bank)  # Multiple choice questions
+            
+            # Grade as answer indices, kept so a teacher can re-grade later
+            responses = bank.encode(choices)
+            st.session_state.quiz_answers = dict(zip(bank.ids, responses.tolist()))
+            grades = bank.grade(responses)
+            score = int(grades["score"][0])
+            
+            # Award XP based on score
+            xp_earned = int(grades["xp"][0])  # 10 XP per correct answer
+            
+            # Award quiz completion achievement
+            if st.session_state.completed_checks.add("quiz_complete"):
+                st.session_state.achievements.add("📝 Quiz Champion")
+                st.session_state.xp_points += xp_earned + 25  # Bonus 25 XP for completing
+                
+                # Check for perfect score
+                if score == total:
+                    if st.session_state.achievements.add("🏆 Perfect Score"):
+                        st.session_state.xp_points += 50  # Bonus for perfect score
+            
+            st.markdown("---")
+            st.markdown("### 📊 Results")
+            
+            percentage = (score / total) * 100
+            
+            col1, col2, col3, col4 = st.columns(4)
+            
+            with col1:
+                st.metric("Score", f"{score}/{total}")
+            with col2:
+                st.metric("Percentage", f"{percentage:.0f}%")
+            with col3:
+                st.metric("XP Earned", f"+{xp_earned + 25}")
+            with col4:
+                if percentage >= 80:
+                    st.metric("Status", "Excellent! 🌟")
+                elif percentage >= 60:
+                    st.metric("Status", "Good Work! 👍")
+                else:
+                    st.metric("Status", "Keep Studying 📚")
+            
+            if percentage == 100:
+                st.balloons()
+                st.success("🎉 PERFECT SCORE! +50 Bonus XP! 🏆 Achievement Unlocked: Perfect Score! You have mastered satellites, 3D printing, and their applications to Earth science!")
+            elif percentage >= 80:
+                st.balloons()
+                st.success("🎉 Great job! 🎖️ Achievement Unlocked: Quiz Champion! You have a strong understanding of the material!")
+            elif percentage >= 60:
+                st.info("👍 Good work! 🎖️ Achievement Unlocked: Quiz Champion! Review the sections where you missed questions to strengthen your understanding.")
+            else:
+                st.warning("📚 🎖️ Achievement Unlocked: Quiz Champion! Consider reviewing the lesson materials and trying the quick checks again to improve your score.")
+            
+            st.markdown("### Short Answer Feedback")
+            st.info("Your short answer responses have been recorded. Click below to get personalized feedback from Professor Xavier!")
+            
+            # Store short answer responses for AI feedback
+            st.session_state.quiz_short_answers = {
+                "q7": q7,
+                "q8": q8,
+                "mc_score": score,
+                "mc_total": total
+            }
+            st.session_state.pop('quiz_feedback_job', None)
+            results_export.exporter.record("quiz", st.session_state)
+    
+    # AI Feedback for Short Answers (outside the form)
+    if 'quiz_short_answers' in st.session_state and st.session_state.quiz_short_answers:
+        answers = st.session_state.quiz_short_answers
+        
+        if answers.get('q7') or answers.get('q8'):
+            st.markdown("---")
+            st.markdown("### 🤖 Get Feedback on Your Short Answers")
+            
+            if st.button("🎓 Get Professor Xavier's Feedback on Short Answers"):
+                feedback_prompt = f"""You are Professor Xavier, an encouraging but thorough Earth Science educator for high school students in Michigan. A student has completed short answer questions about satellites and Earth science.
+
+## Student's Responses:
+
+**Question 7:** "Explain how a single technological advancement (like 3D-printed fuel tanks) can lead to improvements in our understanding of Earth's systems. Use the innovation chain concept in your answer."
+
+**Student's Answer:** {answers.get('q7', 'No response provided') if answers.get('q7') else 'No response provided'}
+
+---
+
+**Question 8:** "Describe one way that satellite data is used to protect Michigan's environment or economy. Be specific about what is measured and why it matters."
+
+**Student's Answer:** {answers.get('q8', 'No response provided') if answers.get('q8') else 'No response provided'}
+
+---
+
+**Their Multiple Choice Score:** {answers.get('mc_score', 0)}/{answers.get('mc_total', 6)}
+
+## Your Task:
+
+Provide detailed, educational feedback on EACH short answer response. For each question:
+
+### 1. EVALUATE THEIR RESPONSE
+- What did they get RIGHT? Be specific and encouraging.
+- What key concepts did they MISS or could explain better?
+- Rate their understanding: Excellent / Good / Developing / Needs More Work
+
+### 2. TEACH WHAT'S MISSING
+- If they missed the "innovation chain" concept in Q7, explain: Technology → Lower Costs → More Satellites → Better Data → Better Science
+- If Q8 lacks specifics, provide a detailed example (e.g., "Satellites measure chlorophyll concentrations at 443nm and 555nm wavelengths to detect harmful algal blooms in Lake Erie, protecting drinking water for Toledo and Detroit")
+
+### 3. PROVIDE SPECIFIC HOMEWORK LINKS
+Based on gaps in their understanding, recommend 2-3 lessons from CK-12, Khan Academy, or NASA with DIRECT LINKS. Use these exact URLs:
+
+**For understanding the innovation chain / engineering / technology:**
+- https://www.ck12.org/engineering/engineering-design-process/ - "CK-12: Engineering Design Process"
+- https://www.khanacademy.org/science/engineering - "Khan Academy: Engineering"
+- https://spaceplace.nasa.gov/how-orbits-work/ - "NASA: How Orbits Work"
+
+**For understanding Earth's systems / water cycle:**
+- https://www.ck12.org/earth-science/water-cycle/ - "CK-12: The Water Cycle"
+- https://www.khanacademy.org/science/biology/ecology/biogeochemical-cycles/v/the-water-cycle - "Khan Academy: The Water Cycle"
+- https://www.ck12.org/earth-science/ocean-currents/ - "CK-12: Ocean Currents"
+
+**For understanding climate and weather:**
+- https://www.ck12.org/earth-science/weather-and-climate/ - "CK-12: Weather and Climate"
+- https://www.khanacademy.org/science/cosmology-and-astronomy/earth-history-topic/earth-title-topic/v/weather-vs-climate - "Khan Academy: Weather vs Climate"
+- https://www.ck12.org/earth-science/greenhouse-effect/ - "CK-12: The Greenhouse Effect"
+- https://climatekids.nasa.gov/ - "NASA Climate Kids"
+
+**For understanding electromagnetic spectrum / light / how satellites see:**
+- https://www.ck12.org/physics/electromagnetic-spectrum/ - "CK-12: Electromagnetic Spectrum"
+- https://www.khanacademy.org/science/physics/light-waves/introduction-to-light-waves/v/electromagnetic-waves-and-the-electromagnetic-spectrum - "Khan Academy: Electromagnetic Spectrum"
+- https://earthobservatory.nasa.gov/features/MeasuringVegetation - "NASA: Measuring Vegetation from Space"
+
+**For understanding Great Lakes / Michigan environment:**
+- https://www.glerl.noaa.gov/education/ - "NOAA Great Lakes Education"
+- https://coastwatch.glerl.noaa.gov/ - "NOAA CoastWatch Great Lakes"
+- https://www.michiganseagrant.org/lessons/lessons/by-broad-concept/earth-science/ - "Michigan Sea Grant: Earth Science"
+
+Format your recommendations like this:
+"📚 **Study These Resources:**
+1. [Resource Name](URL) - Why this will help: [specific reason based on their answer]
+2. [Resource Name](URL) - Why this will help: [specific reason based on their answer]"
+
+### 4. MODEL ANSWER
+Provide a brief "model answer" showing what an excellent response would include for each question. Keep it to 2-3 sentences each.
+
+Be encouraging but honest. If they left an answer blank, don't criticize - encourage them to try and explain why these concepts matter for Michigan."""
+
+                settings = feature_settings("short_answer")
+                
+                # Same queue and rate limit as mission feedback; identical answers reuse stored feedback
+                cached_feedback = feedback_cache.get(feedback_prompt, settings.model)
+                if cached_feedback is not None:
+                    st.session_state.quiz_feedback_job = cached_feedback_job(feedback_prompt, cached_feedback)
+                else:
+                    st.session_state.quiz_feedback_job = start_feedback_job(
+                        feedback_prompt, settings, st.session_state.session_id, "short_answer",
+                        on_success=lambda prompt, text: feedback_cache.put(prompt, settings.model, text))
+            
+            job = st.session_state.get('quiz_feedback_job')
+            if job is not None and not job.done:
+                show_feedback_stream(job, "Professor Xavier is reviewing your responses...")
+            elif job is not None:
+                if job.ok:
+                    st.markdown("### 💬 Professor Xavier's Feedback on Your Short Answers:")
+                    st.markdown(job.text)
+                    
+                    # Award bonus XP
+                    if award_xp(15, "quiz_short_answer_feedback"):
+                        st.success("🎉 +15 XP for getting detailed feedback on your short answers!")
+                    
+                    if job.from_cache:
+                        st.caption("⚡ Served from saved feedback for identical answers")
+                    elif job.time_to_first_token is not None:
+                        st.caption(f"⏱️ First words arrived after {job.time_to_first_token:.1f}s")
+                else:
+                    # API unavailable, rate limited or queue full: rule-based feedback
+                    st.markdown("### 💬 Professor Xavier's Feedback:")
+                    st.markdown(feedback_engine.short_answer_feedback(answers))
+            
+            if st.button("⚡ Instant Feedback on Short Answers (no wait)"):
+                st.markdown("### ⚡ Instant Feedback:")
+                st.markdown(feedback_engine.short_answer_feedback(answers))
@@ -0,0 +1,72 @@
+"""Satellite lab page: NDVI and albedo from sample scenes; the text lives in content/pages/satellite_lab.json."""
+import streamlit as st
+
+import scene_lab
+from lesson_pages.blocks import show_content_page
+
+MARKER = (255, 255, 255)
+THRESHOLD_LABELS = {"ndvi": "Healthy vegetation", "albedo": "Bright ice & snow"}
+
+
+def show_satellite_lab():
+    show_content_page("satellite_lab", slots={"lab": show_index_lab})
+
+
+def _with_marker(image, row, column, size=5):
+    image = image.copy()
+    image[max(row - size, 0):row + size + 1, column] = MARKER
+    image[row, max(column - size, 0):column + size + 1] = MARKER
+    return image
+
+
+def _formula(index, bands, value):
+    if index == "ndvi":
+        nir, red = bands["nir"], bands["red"]
+        return f"NDVI = ({nir:.3f} − {red:.3f}) / ({nir:.3f} + {red:.3f}) = **{value:.2f}**"
+    terms = " + ".join(f"{weight:.3f}×{bands[band]:.3f}" for band, weight in scene_lab.ALBEDO_WEIGHTS.items())
+    return f"Albedo = {terms} − {-scene_lab.ALBEDO_OFFSET} = **{value:.2f}**"
+
+
+@st.fragment
+def show_index_lab():
+    """Index maps, thresholds and one pixel worked out; only this fragment reruns when a control changes"""
+    scenes = scene_lab.load_scenes()
+    col1, col2 = st.columns(2)
+    with col1:
+        scene = st.selectbox("Scene:", list(scenes.scenes), key="lab_scene",
+                             format_func=lambda name: scenes.scenes[name]["title"])
+        index = st.radio("Compute:", list(scene_lab.INDICES), horizontal=True, key="lab_index",
+                         format_func=lambda name: scene_lab.INDICES[name]["label"])
+    settings = scene_lab.INDICES[index]
+    points = scenes.scenes[scene]["points"]
+    with col2:
+        low, high = settings["range"]
+        threshold = st.slider(f"{settings['label']} threshold:", low, high, settings["threshold"], 0.05,
+                              key=f"lab_threshold_{index}")
+        point = st.selectbox("Inspect a pixel:", list(points), key=f"lab_point_{scene}")
+    
+    values = scenes.index(scene, index)
+    above = values > threshold
+    step = scenes.preview_step(scene)
+    row, column = points[point]
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.image(_with_marker(scenes.true_color(scene), row // step, column // step), caption="True color")
+    with col2:
+        preview = scene_lab.colorize(values[::step, ::step], index)
+        st.image(_with_marker(preview, row // step, column // step), caption=f"{settings['label']} map")
+    with col3:
+        masked = scene_lab.highlight(scenes.true_color(scene), above[::step, ::step])
+        st.image(_with_marker(masked, row // step, column // step),
+                 caption=f"{settings['label']} above {threshold:.2f} (pink)")
+    
+    col1, col2, col3 = st.columns(3)
+    col1.metric(f"Average {settings['label']}", f"{values.mean():.2f}")
+    col2.metric(THRESHOLD_LABELS[index], f"{above.mean():.0%}", help=f"Share of pixels above {threshold:.2f}")
+    if index == "albedo":
+        col3.metric("Sunlight absorbed", f"{1 - values.mean():.0%}", help="1 − average albedo")
+    
+    bands = scenes.pixel(scene, row, column)
+    st.markdown(f"**{point}** (the white cross): " + _formula(index, bands, float(values[row, column])))
+    st.caption("Band reflectance at this pixel: " + ", ".join(f"{band} {value:.3f}" for band, value in bands.items()))
@@ -0,0 +1,92 @@
+"""Satellites & Earth Science page; the text lives in content/pages/satellites.json."""
+import pandas as pd
+import streamlit as st
+
+import lake_data
+from lesson_pages.blocks import show_content_page
+
+VARIABLES = {"🌡️ Surface temperature": "surface_temperature", "📏 Water level": "water_level"}
+ALL_LAKES = "All five lakes"
+
+
+def show_satellites():
+    show_content_page("satellites", slots={"lake_records": show_lake_records, "ice_records": show_ice_records})
+
+
+def _years(dataset):
+    return int(str(dataset.dates[0])[:4]), int(str(dataset.dates[-1])[:4])
+
+
+def _data_notice(dataset):
+    # The sample is stored on a calendar, but its years must not read as real winters
+    if dataset.synthetic:
+        st.info(f"🧪 **Practice data** (sample v{dataset.version}): generated to behave like Great Lakes "
+                "records, not real measurements. Years are numbered from the start of the sample.")
+    else:
+        st.caption(f"📊 Great Lakes records, dataset v{dataset.version}.")
+
+
+def _sample_years(dataset, index):
+    """A date index as years since the start of a synthetic sample (1.0 is its first day)."""
+    days = (index - pd.Timestamp(dataset.start.astype("datetime64[ns]"))).days
+    return pd.Index((1 + days / 365.25).round(3), name="Sample year")
+
+
+@st.fragment
+def show_lake_records():
+    """Temperature and level history by lake; only this fragment reruns when a control changes"""
+    dataset = lake_data.load_dataset()
+    first, last = _years(dataset)
+    # Synthetic samples are shown as years 1..N rather than calendar years
+    offset = first - 1 if dataset.synthetic else 0
+    st.markdown("#### 📈 Explore Great Lakes Data")
+    _data_notice(dataset)
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        label = st.radio("Measurement:", list(VARIABLES), horizontal=True, key="lake_records_variable")
+        years = st.slider("Sample years:" if dataset.synthetic else "Years:", first - offset, last - offset,
+                          (last - offset - 4, last - offset), key="lake_records_years")
+    with col2:
+        lakes = st.multiselect("Lakes:", dataset.lakes, default=["Superior", "Erie"], key="lake_records_lakes")
+    
+    variable = VARIABLES[label]
+    chart = dataset.frame(variable, lakes or None, f"{years[0] + offset}-01-01", f"{years[1] + offset}-12-31")
+    if dataset.synthetic:
+        chart.index = _sample_years(dataset, chart.index)
+    if variable == "water_level":
+        # Lakes sit at very different heights, so compare each with its own average
+        chart = (chart - chart.mean()) * 100
+        st.line_chart(chart, y_label="Level vs. average for these years (cm)")
+        st.caption("Lakes Michigan and Huron share one water level: they are joined at the Straits of Mackinac.")
+    else:
+        st.line_chart(chart, y_label=f"Surface temperature ({dataset.units(variable)})")
+
+
+@st.fragment
+def show_ice_records():
+    """Ice cover through one winter; only this fragment reruns when the winter changes"""
+    dataset = lake_data.load_dataset()
+    first, last = _years(dataset)
+    st.markdown("#### 🧊 Ice Cover by Winter")
+    _data_notice(dataset)
+    
+    if dataset.synthetic:
+        winters = {f"Sample winter {number}": year for number, year in enumerate(range(first + 1, last + 1), start=1)}
+    else:
+        winters = {f"{year - 1}-{year % 100:02d}": year for year in range(first + 1, last + 1)}
+    winter = st.select_slider("Winter:", options=list(winters), value=list(winters)[-1], key="ice_records_winter")
+    year = winters[winter]
+    chart = dataset.frame("ice_cover", start=f"{year - 1}-12-01", end=f"{year}-04-30", total=ALL_LAKES)
+    total = chart[ALL_LAKES]
+    peak_day = total.idxmax()
+    if dataset.synthetic:
+        chart.index = pd.Index((chart.index - chart.index[0]).days, name="Days since December 1")
+    
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        st.line_chart(chart, y_label="Ice cover (%)")
+    with col2:
+        st.metric("Peak ice cover", f"{total.max():.0f}%", f"on {peak_day:%b %d}", delta_color="off",
+                  help="All five lakes together, each weighted by its surface area")
+        st.metric("Iciest lake", chart.drop(columns=ALL_LAKES).max().idxmax())
@@ -0,0 +1,62 @@
+"""Teacher-mode instrumentation panel shown in the sidebar."""
+import json
+
+import pandas as pd
+import streamlit as st
+
+import feedback_cache
+import metrics
+import progress_store
+import rerun_profiler
+from feedback_scheduler import scheduler as feedback_scheduler
+
+LATENCY_SUFFIXES = (".latency", ".total", ".connect", ".time_to_first_token", ".queue_wait")
+
+
+def show_instrumentation_panel(trace):
+    """Draw rerun, page, state and LLM timings; ``trace`` is this session's finished rerun."""
+    st.markdown("#### ⏱️ This rerun")
+    col1, col2 = st.columns(2)
+    col1.metric("Wall time", f"{trace.wall_seconds * 1000:.0f} ms")
+    col2.metric("Page", f"{(trace.page_seconds or 0) * 1000:.0f} ms")
+    col1.metric("Widgets", "n/a" if trace.widgets is None else trace.widgets)
+    col2.metric("Session state", f"{trace.session_state_bytes / 1024:.1f} KB")
+
+    st.markdown("#### 📄 Page time, all sessions")
+    rows = rerun_profiler.page_summary()
+    if rows:
+        st.dataframe(pd.DataFrame(rows), hide_index=True)
+    wall = metrics.summary("rerun.wall").get("rerun.wall")
+    if wall:
+        st.caption(f"Rerun wall time: p50 {wall['p50'] * 1000:.0f} ms · p95 {wall['p95'] * 1000:.0f} ms · "
+                   f"{wall['count']} reruns")
+
+    st.markdown("#### 🤖 Feedback latency")
+    latency_rows = [
+        {"series": name, "calls": stats["count"], "p50 s": round(stats["p50"], 2),
+         "p95 s": round(stats["p95"], 2), "max s": round(stats["max"], 2)}
+        for name, stats in {**metrics.summary("llm."), **metrics.summary("feedback.")}.items()
+        if name.endswith(LATENCY_SUFFIXES)
+    ]
+    if latency_rows:
+        st.dataframe(pd.DataFrame(latency_rows), hide_index=True)
+    else:
+        st.caption("No feedback requests yet.")
+    cache_stats = feedback_cache.stats()
+    st.caption(f"Feedback cache: {cache_stats['hits']} hits · {cache_stats['misses']} misses · {cache_stats['entries']} saved")
+    queue_stats = feedback_scheduler.stats()
+    st.caption(f"Feedback queue: {queue_stats['waiting']} waiting · {queue_stats['in_flight']} in progress")
+    progress_stats = progress_store.store.stats()
+    st.caption(f"Saved progress: {progress_stats['students']} students · {progress_stats['pending']} waiting to be "
+               f"written · {progress_stats['rows_written']} rows in {progress_stats['batches']} batches")
+
+    st.markdown("#### 💾 Export")
+    if st.button("Save traces to file", key="export_rerun_traces"):
+        path = rerun_profiler.export_traces()
+        st.success(f"Saved {len(rerun_profiler.traces())} reruns to `{path}`")
+    st.download_button(
+        "Download LLM metrics (JSON)",
+        json.dumps(metrics.summary("llm."), indent=2),
+        file_name="llm_metrics.json",
+        mime="application/json",
+    )
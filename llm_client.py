@@ -0,0 +1,113 @@
+"""Shared, pooled HTTP client for the Professor Xavier feedback calls.
+
+One ``requests.Session`` is created per server process, so both feedback
+paths reuse kept-alive TLS connections instead of paying a handshake on
+every click. A semaphore caps how many requests are in flight at once.
+
+Per-request timings go to ``metrics``:
+
+- ``llm.connect``: seconds spent opening a new connection (0.0 when a pooled
+  connection was reused)
+- ``llm.total``: seconds from sending the request until the response was
+  fully read and closed
+"""
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+import metrics
+
+API_URL = "https://api.anthropic.com/v1/messages"
+API_VERSION = "2023-06-01"
+
+POOL_SIZE = int(os.environ.get("LLM_POOL_SIZE", "10"))
+MAX_CONCURRENT_REQUESTS = int(os.environ.get("LLM_MAX_CONCURRENT_REQUESTS", "8"))
+
+_connect_time = threading.local()
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    def connect(self):
+        start = time.perf_counter()
+        super().connect()
+        _connect_time.seconds = time.perf_counter() - start
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    def connect(self):
+        start = time.perf_counter()
+        super().connect()
+        _connect_time.seconds = time.perf_counter() - start
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _TimedAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections report how long they took to open."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+
+def _build_session():
+    session = requests.Session()
+    adapter = _TimedAdapter(pool_connections=2, pool_maxsize=POOL_SIZE, pool_block=True)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+session = _build_session()
+_slots = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+
+
+@contextmanager
+def message_request(payload, api_key, stream=False, timeout=60, url=API_URL):
+    """POST ``payload`` to the messages API and yield the response.
+
+    The concurrency slot is held and the response stays open until the
+    ``with`` block exits, so streamed bodies can be read inside it.
+    """
+    with _slots:
+        _connect_time.seconds = 0.0
+        start = time.perf_counter()
+        response = session.post(
+            url,
+            headers={
+                "Content-Type": "application/json",
+                "x-api-key": api_key,
+                "anthropic-version": API_VERSION
+            },
+            json=payload,
+            stream=stream,
+            timeout=timeout
+        )
+        metrics.record("llm.connect", _connect_time.seconds)
+        try:
+            yield response
+        finally:
+            response.close()
+            metrics.record("llm.total", time.perf_counter() - start)
+
+
+def post_message(payload, api_key, timeout=60, url=API_URL):
+    """Send a non-streamed messages request and return the fully read response."""
+    with message_request(payload, api_key, timeout=timeout, url=url) as response:
+        response.content
+    return response
@@ -0,0 +1,199 @@
+"""Offline stand-in for the messages API, for feedback load testing.
+
+Serves ``POST /v1/messages`` in the same shape as the hosted API, both as a
+single JSON reply and as a server-sent event stream, without any network
+access or API key. Latency, streaming speed and error rate are configurable
+so the feedback queue, cache and fallbacks can be benchmarked under
+realistic conditions:
+
+    python local_llm_server.py --latency 0.8 --chunks-per-second 30 --error-rate 0.05
+
+Point the app at it with ``FEEDBACK_BACKEND=local`` (and
+``FEEDBACK_BACKEND_URL`` if you change the port).
+"""
+import argparse
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FEEDBACK_TEXT = (
+    "Great work thinking like a satellite engineer! Your orbit choice sets how often you revisit "
+    "the Great Lakes: a low Earth orbit satellite circles the planet about every 90 minutes at "
+    "7.8 km/s, so more satellites mean shorter gaps between passes. Your instruments decide what "
+    "you can measure. Thermal sensors read surface temperature from emitted infrared, multispectral "
+    "imagers compare near-infrared and red light to compute NDVI, and radar works through the "
+    "clouds of a Michigan winter. Think about the trade-offs between cost, coverage and detail. "
+    "What would happen to your data if one satellite failed?"
+)
+
+
+class StandInConfig:
+    """Knobs for the stand-in server; shared by every request handler thread."""
+
+    def __init__(self, latency=0.5, jitter=0.2, chunks_per_second=40.0, words_per_chunk=3,
+                 error_rate=0.0, error_status=429, retry_after=2, words=300, seed=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.chunks_per_second = chunks_per_second
+        self.words_per_chunk = words_per_chunk
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.retry_after = retry_after
+        self.words = words
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+
+    def roll(self):
+        with self.lock:
+            return self.random.random()
+
+
+def _response_words(config, max_tokens):
+    base = FEEDBACK_TEXT.split()
+    count = min(config.words, max_tokens)
+    return [base[i % len(base)] for i in range(count)]
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    config = StandInConfig()
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        if self.path.rstrip("/") != "/v1/messages":
+            self._send_json(404, {"type": "error", "error": {"type": "not_found_error", "message": "not found"}})
+            return
+
+        config = self.config
+        time.sleep(max(0.0, config.latency + (config.roll() * 2 - 1) * config.jitter))
+
+        if config.roll() < config.error_rate:
+            self._send_error(config)
+            return
+
+        words = _response_words(config, payload.get("max_tokens", 1024))
+        prompt_text = json.dumps(payload.get("messages", []))
+        usage = {"input_tokens": len(prompt_text) // 4, "output_tokens": len(words)}
+        model = payload.get("model", "stand-in")
+
+        if payload.get("stream"):
+            self._stream(config, words, usage, model)
+        else:
+            self._send_json(200, {
+                "id": f"msg_{uuid.uuid4().hex[:24]}",
+                "type": "message",
+                "role": "assistant",
+                "model": model,
+                "content": [{"type": "text", "text": " ".join(words)}],
+                "stop_reason": "end_turn",
+                "usage": usage,
+            })
+
+    def _send_error(self, config):
+        body = json.dumps({
+            "type": "error",
+            "error": {"type": "rate_limit_error" if config.error_status == 429 else "api_error",
+                      "message": "injected by local_llm_server"},
+        }).encode("utf-8")
+        self.send_response(config.error_status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if config.error_status == 429:
+            self.send_header("retry-after", str(config.retry_after))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status, data):
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _stream(self, config, words, usage, model):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        message_id = f"msg_{uuid.uuid4().hex[:24]}"
+        self._event("message_start", {"type": "message_start", "message": {
+            "id": message_id, "type": "message", "role": "assistant", "model": model, "content": [],
+            "usage": {"input_tokens": usage["input_tokens"], "output_tokens": 0}}})
+        self._event("content_block_start", {"type": "content_block_start", "index": 0,
+                                            "content_block": {"type": "text", "text": ""}})
+        delay = 1.0 / config.chunks_per_second if config.chunks_per_second > 0 else 0.0
+        for start in range(0, len(words), config.words_per_chunk):
+            text = " ".join(words[start:start + config.words_per_chunk])
+            if start:
+                text = " " + text
+            self._event("content_block_delta", {"type": "content_block_delta", "index": 0,
+                                                "delta": {"type": "text_delta", "text": text}})
+            time.sleep(delay)
+        self._event("content_block_stop", {"type": "content_block_stop", "index": 0})
+        self._event("message_delta", {"type": "message_delta", "delta": {"stop_reason": "end_turn"},
+                                      "usage": {"output_tokens": usage["output_tokens"]}})
+        self._event("message_stop", {"type": "message_stop"})
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+    def _event(self, name, data):
+        chunk = f"event: {name}\ndata: {json.dumps(data)}\n\n".encode("utf-8")
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+        self.wfile.flush()
+
+
+def make_server(config=None, host="127.0.0.1", port=8787):
+    """Build a stand-in server using ``config`` (port 0 picks a free port)."""
+    handler = type("ConfiguredStandInHandler", (StandInHandler,), {"config": config or StandInConfig()})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def start_server(config=None, host="127.0.0.1", port=8787):
+    """Start the stand-in on a daemon thread and return the server."""
+    server = make_server(config, host, port)
+    threading.Thread(target=server.serve_forever, name="local-llm-server", daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--latency", type=float, default=0.5, help="seconds before the first byte")
+    parser.add_argument("--jitter", type=float, default=0.2, help="+/- seconds added to the latency")
+    parser.add_argument("--chunks-per-second", type=float, default=40.0, help="streamed deltas per second")
+    parser.add_argument("--words-per-chunk", type=int, default=3)
+    parser.add_argument("--words", type=int, default=300, help="length of each reply")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests that fail")
+    parser.add_argument("--error-status", type=int, default=429, help="status code for injected failures")
+    parser.add_argument("--retry-after", type=int, default=2, help="retry-after seconds sent with 429s")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    config = StandInConfig(
+        latency=args.latency, jitter=args.jitter, chunks_per_second=args.chunks_per_second,
+        words_per_chunk=args.words_per_chunk, error_rate=args.error_rate,
+        error_status=args.error_status, retry_after=args.retry_after, words=args.words, seed=args.seed,
+    )
+    server = make_server(config, args.host, args.port)
+    print(f"Local LLM stand-in listening on http://{args.host}:{args.port}/v1/messages")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Process-wide timing samples shared by every Streamlit session.
+
+Samples are kept in bounded deques so a long class day cannot grow memory
+without limit. Everything here is thread-safe because feedback workers
+record from background threads.
+"""
+import threading
+import time
+from collections import defaultdict, deque
+
+MAX_SAMPLES = 2000
+
+_lock = threading.Lock()
+_samples = defaultdict(lambda: deque(maxlen=MAX_SAMPLES))
+
+
+def record(name, value):
+    """Store one sample (usually seconds) under ``name``."""
+    with _lock:
+        _samples[name].append((time.time(), float(value)))
+
+
+def values(name):
+    """Return the recorded values for ``name``, oldest first."""
+    with _lock:
+        return [value for _, value in _samples.get(name, ())]
+
+
+def percentile(name, pct):
+    """Return the ``pct`` percentile of ``name`` or None if nothing was recorded."""
+    data = sorted(values(name))
+    if not data:
+        return None
+    index = min(len(data) - 1, max(0, round(pct / 100 * (len(data) - 1))))
+    return data[index]
+
+
+def names():
+    with _lock:
+        return sorted(_samples)
+
+
+def summary(prefix=""):
+    """Count, sum and p50/p95/max for every series whose name starts with ``prefix``."""
+    result = {}
+    for name in names():
+        if not name.startswith(prefix):
+            continue
+        data = values(name)
+        if data:
+            result[name] = {
+                "count": len(data),
+                "sum": sum(data),
+                "p50": percentile(name, 50),
+                "p95": percentile(name, 95),
+                "max": max(data),
+            }
+    return result
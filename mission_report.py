@@ -0,0 +1,125 @@
+"""Per-student mission report PDFs, rendered off the script thread.
+
+After a student submits the design challenge, ``request`` queues a PDF of
+their mission summary (and Professor Xavier's feedback once they have it) on
+a small thread pool and returns a Future right away, so the rerun that shows
+the summary never waits for the layout. Futures are kept per hash of the
+mission design, feedback text, student ID and the date printed on the
+report, so rerunning the page or pressing download again reuses the
+finished render.
+"""
+import collections
+import datetime
+import hashlib
+import json
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import orbit_sim
+import tradeoffs
+from packets import FOOTER, markdown_items
+from pdf_writer import PdfDocument
+
+WORKERS = int(os.environ.get("MISSION_REPORT_WORKERS", "2"))
+MAX_CACHED = int(os.environ.get("MISSION_REPORT_CACHE_SIZE", "256"))
+
+
+def report_date(mission):
+    """The day the design was submitted; designs saved before that was recorded get today."""
+    submitted = mission.get("submitted_on")
+    return datetime.date.fromisoformat(submitted) if submitted else datetime.date.today()
+
+
+def report_key(mission, feedback=None, student_id=None):
+    payload = json.dumps({"mission": mission, "feedback": feedback, "student": student_id,
+                          "date": report_date(mission).isoformat()}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def file_name(mission):
+    slug = re.sub(r"[^A-Za-z0-9]+", "-", mission.get("name") or "").strip("-").lower()
+    return f"mission-report-{slug or 'unnamed'}.pdf"
+
+
+def render(mission, feedback=None, student_id=None):
+    """The mission report PDF as bytes."""
+    name = mission.get("name") or "Unnamed Mission"
+    satellites = mission["num_satellites"]
+    doc = PdfDocument(f"Mission Report - {name}", FOOTER)
+    doc.add(f"Mission Report: {name}", "title")
+    byline = f"Prepared for {student_id}" if student_id else "Satellite Design Challenge"
+    doc.add(f"{byline} - {report_date(mission):%B %d, %Y}", "small")
+
+    doc.add("Mission Summary", "h1")
+    doc.add(f"Scenario: {mission['type']}", "bullet")
+    doc.add(f"Satellites: {satellites}", "bullet")
+    doc.add(f"Estimated cost: ${tradeoffs.mission_cost(mission) / 1_000_000:.1f}M", "bullet")
+    doc.add(f"Orbit: {mission['orbit']} (recommended: {mission['recommended_orbit']})", "bullet")
+    doc.add("Instruments: " + (", ".join(mission["instruments"]) or "none selected"), "bullet")
+    doc.add("Recommended instruments: " + ", ".join(mission["recommended_instruments"]), "bullet")
+    doc.add(f"Budget: {mission['budget']}  Timeline: {mission['timeline']}  Data priority: {mission['data_priority']}",
+            "bullet")
+    if mission.get("scenario_match") is not None:
+        doc.add(f"Scenario match: {mission['scenario_match']:.0f}/100 (orbit, instruments and budget fit "
+                "against the scenario's recommendations)", "bullet")
+    if mission.get("coverage"):
+        coverage = orbit_sim.Coverage(**mission["coverage"])
+        doc.add(f"Simulated coverage ({mission['region']}, 24 hours): {coverage.coverage:.0%} of the region "
+                f"seen; the constellation {orbit_sim.describe(coverage)}; longest gap "
+                f"{coverage.max_gap_hours:.1f} hours.", "bullet")
+
+    doc.add("Mission Goal", "h2")
+    doc.add(mission.get("goal") or "Not specified")
+    doc.add("Michigan Impact", "h2")
+    doc.add(mission.get("michigan_impact") or "Not specified")
+
+    doc.add("3D Printing", "h2")
+    if mission["use_3d_printing"]:
+        doc.add(f"Yes - 3D-printed fuel tanks saved ${satellites * tradeoffs.PRINTING_SAVINGS_PER_SATELLITE:,} "
+                f"(${tradeoffs.PRINTING_SAVINGS_PER_SATELLITE:,} per satellite).")
+    else:
+        doc.add("No - traditional manufacturing.")
+
+    if feedback:
+        doc.page_break()
+        doc.add("Professor Xavier's Feedback", "h1")
+        for style, text in markdown_items(feedback):
+            doc.add(text, style)
+    return doc.to_bytes()
+
+
+class ReportRenderer:
+    """Thread pool rendering reports, with a bounded map of Futures keyed by content hash."""
+
+    def __init__(self, workers=WORKERS, max_cached=MAX_CACHED):
+        self.max_cached = max_cached
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mission-report")
+        self._futures = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.renders = 0
+        self.hits = 0
+
+    def request(self, mission, feedback=None, student_id=None):
+        """Future for the report PDF; starts rendering only if it isn't cached or in progress."""
+        key = report_key(mission, feedback, student_id)
+        with self._lock:
+            future = self._futures.get(key)
+            if future is not None and not (future.done() and future.exception()):
+                self._futures.move_to_end(key)
+                self.hits += 1
+                return future
+            future = self._pool.submit(render, mission, feedback, student_id)
+            self._futures[key] = future
+            self.renders += 1
+            while len(self._futures) > self.max_cached:
+                self._futures.popitem(last=False)
+            return future
+
+    def stats(self):
+        with self._lock:
+            return {"cached": len(self._futures), "renders": self.renders, "hits": self.hits}
+
+
+renderer = ReportRenderer()
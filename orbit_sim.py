@@ -0,0 +1,165 @@
+"""Coverage and revisit time of a satellite constellation over a mission region.
+
+Satellites fly circular Keplerian orbits. The constellation is spread over
+``ceil(sqrt(n))`` evenly spaced orbital planes (a Walker-style pattern), and
+geostationary satellites are spaced around the equator starting above the
+region. Every ``STEP_SECONDS`` of one day the sub-satellite directions are
+rotated into Earth-fixed coordinates and compared against a grid of points
+covering the region: a point is seen when the satellite is at least
+``MIN_ELEVATION_DEG`` above its horizon, i.e. when the angle between the two
+unit vectors is below the footprint's Earth-central angle. The whole day is a
+few matrix products, so a simulation takes milliseconds and results are
+memoized per (orbit, satellites, region).
+
+    python orbit_sim.py "Polar Orbit" 4
+"""
+import math
+import sys
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0
+MU_KM3_S2 = 398600.4418
+EARTH_ROTATION_RAD_S = 7.2921159e-5
+DAY_SECONDS = 86400
+STEP_SECONDS = 60
+MIN_ELEVATION_DEG = 20.0
+MAX_GRID_POINTS = 600
+TIME_CHUNK = 240  # time steps per matrix product; bounds memory at ~10 MB for 20 satellites
+
+# Typical altitude and inclination for each orbit in the design challenge
+ORBITS = {
+    "Low Earth Orbit (LEO)": (550.0, 51.6),
+    "Medium Earth Orbit (MEO)": (20200.0, 55.0),
+    "Geostationary (GEO)": (35786.0, 0.0),
+    "Polar Orbit": (705.0, 98.2),
+}
+
+# (south, north, west, east) in degrees
+GREAT_LAKES = (41.0, 49.0, -92.5, -76.0)
+
+Coverage = namedtuple("Coverage", [
+    "coverage",        # fraction of the region seen at least once during the day
+    "time_covered",    # average fraction of the day a point in the region is in view
+    "revisit_hours",   # median time between passes over a point; 0 when always in view
+    "max_gap_hours",   # longest time any seen point waits for a pass
+    "passes",          # median passes per point per day
+    "period_minutes",  # orbital period
+])
+
+
+def footprint_angle(altitude_km, min_elevation_deg=MIN_ELEVATION_DEG):
+    """Earth-central angle (radians) from the sub-satellite point to the edge of the footprint."""
+    elevation = math.radians(min_elevation_deg)
+    nadir = math.asin(EARTH_RADIUS_KM * math.cos(elevation) / (EARTH_RADIUS_KM + altitude_km))
+    return math.pi / 2 - elevation - nadir
+
+
+def period_seconds(altitude_km):
+    return 2 * math.pi * math.sqrt((EARTH_RADIUS_KM + altitude_km) ** 3 / MU_KM3_S2)
+
+
+def region_grid(region, max_points=MAX_GRID_POINTS):
+    """Unit vectors (N x 3) and (lat, lon) of a regular grid over ``region``."""
+    south, north, west, east = region
+    spacing = max(0.25, math.sqrt((north - south) * (east - west) / max_points))
+    lat = np.arange(south + spacing / 2, north, spacing)
+    lon = np.arange(west + spacing / 2, east, spacing)
+    lat, lon = np.meshgrid(np.radians(lat), np.radians(lon), indexing="ij")
+    lat, lon = lat.ravel(), lon.ravel()
+    points = np.stack([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)], axis=1)
+    return points, np.degrees(lat), np.degrees(lon)
+
+
+def constellation(orbit, num_satellites, region=GREAT_LAKES):
+    """Orbital elements as arrays: RAAN, initial argument of latitude (radians) and inclination."""
+    altitude, inclination = ORBITS[orbit]
+    start = math.radians((region[2] + region[3]) / 2)
+    index = np.arange(num_satellites)
+    if inclination == 0.0:
+        # Geostationary: parked at evenly spaced longitudes, the first above the region
+        return np.zeros(num_satellites), start + 2 * np.pi * index / num_satellites, 0.0
+    planes = math.ceil(math.sqrt(num_satellites))
+    plane = index % planes
+    slot = index // planes
+    per_plane = np.bincount(plane, minlength=planes)[plane]
+    raan = start + 2 * np.pi * plane / planes
+    phase = 2 * np.pi * slot / per_plane + 2 * np.pi * plane / num_satellites
+    return raan, phase, math.radians(inclination)
+
+
+def ground_directions(orbit, num_satellites, times, region=GREAT_LAKES):
+    """Earth-fixed unit vectors of every satellite at ``times`` (seconds), shape (T, S, 3)."""
+    altitude, _ = ORBITS[orbit]
+    raan, phase, inclination = constellation(orbit, num_satellites, region)
+    mean_motion = 2 * np.pi / period_seconds(altitude)
+    u = phase[None, :] + mean_motion * times[:, None]
+    cos_u, sin_u = np.cos(u), np.sin(u)
+    cos_raan, sin_raan = np.cos(raan), np.sin(raan)
+    x = cos_raan * cos_u - sin_raan * sin_u * math.cos(inclination)
+    y = sin_raan * cos_u + cos_raan * sin_u * math.cos(inclination)
+    z = sin_u * math.sin(inclination)
+    # Earth turns underneath: rotate inertial directions by -theta about the pole
+    theta = (EARTH_ROTATION_RAD_S * times)[:, None]
+    cos_t, sin_t = np.cos(theta), np.sin(theta)
+    return np.stack([x * cos_t + y * sin_t, y * cos_t - x * sin_t, z], axis=2)
+
+
+def visibility(orbit, num_satellites, region=GREAT_LAKES, step=STEP_SECONDS):
+    """Boolean (T, N) array: whether grid point N is seen by any satellite at time step T."""
+    altitude, _ = ORBITS[orbit]
+    points, _, _ = region_grid(region)
+    threshold = math.cos(footprint_angle(altitude))
+    times = np.arange(0, DAY_SECONDS, step, dtype=np.float64)
+    seen = np.empty((len(times), len(points)), dtype=bool)
+    points32 = points.T.astype(np.float32)
+    for start in range(0, len(times), TIME_CHUNK):
+        chunk = times[start:start + TIME_CHUNK]
+        directions = ground_directions(orbit, num_satellites, chunk, region).astype(np.float32)
+        cosines = directions.reshape(-1, 3) @ points32
+        seen[start:start + len(chunk)] = (cosines.reshape(len(chunk), num_satellites, -1) >= threshold).any(axis=1)
+    return seen
+
+
+@lru_cache(maxsize=512)
+def _simulate(orbit, num_satellites, region, step):
+    seen = visibility(orbit, num_satellites, region, step)
+    steps = seen.shape[0]
+    ever = seen.any(axis=0)
+    passes = (seen & ~np.roll(seen, 1, axis=0)).sum(axis=0)
+    always = seen.all(axis=0)
+    # Longest run without coverage per point, wrapping around midnight
+    doubled = np.concatenate([seen, seen])
+    index = np.arange(2 * steps)[:, None]
+    last_seen = np.maximum.accumulate(np.where(doubled, index, -1), axis=0)
+    gaps = (index - last_seen)[steps:].max(axis=0)
+    revisit = np.where(always, 0.0, DAY_SECONDS / 3600 / np.maximum(passes, 1))
+    return Coverage(
+        coverage=float(ever.mean()),
+        time_covered=float(seen.mean()),
+        revisit_hours=float(np.median(revisit[ever])) if ever.any() else math.inf,
+        max_gap_hours=float(gaps[ever].max() * step / 3600) if ever.any() else math.inf,
+        passes=float(np.median(passes[ever])) if ever.any() else 0.0,
+        period_minutes=period_seconds(ORBITS[orbit][0]) / 60,
+    )
+
+
+def simulate(orbit, num_satellites, region=GREAT_LAKES, step=STEP_SECONDS):
+    """One-day ``Coverage`` of ``region`` (south, north, west, east) by ``num_satellites`` in ``orbit``."""
+    return _simulate(orbit, int(num_satellites), tuple(float(edge) for edge in region), step)
+
+
+def describe(result):
+    """Short student-facing summary of a ``Coverage``."""
+    if result.coverage == 0:
+        return "never passes over the region"
+    if result.revisit_hours == 0:
+        return "keeps the region in continuous view"
+    return f"passes over a typical point every {result.revisit_hours:.1f} hours"
+
+
+if __name__ == "__main__":
+    orbit_name, satellites = sys.argv[1], int(sys.argv[2])
+    print(simulate(orbit_name, satellites))
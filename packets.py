@@ -0,0 +1,411 @@
+"""Printable student and teacher packets and the presentation bundle.
+
+Everything is generated from the lesson content in ``content/``: the student
+packet is the lesson text, quick checks, design-challenge worksheet and quiz;
+the teacher packet adds the lesson sequence, standards alignment, answer keys
+and design-challenge notes; the presentation ZIP has a slide outline per page,
+the data tables as CSV, the student packet and every file under ``ASSETS_DIR``
+(slide decks, high-resolution images, maps).
+
+Files are built once per content version. The version is a hash of the
+content files, the asset listing and the generator code, taken once per
+process like ``content_store`` loads the content itself, so edits show up
+after a restart. The PDFs are kept in
+memory (``st.cache_resource``, which also makes concurrent first requests wait
+for a single build) and on disk under ``CACHE_DIR`` so a server restart doesn't
+rebuild them either. The presentation bundle can be hundreds of MB, so it is
+never held in memory: ``zip_stream`` writes it chunk by chunk into
+``static/downloads/`` and Streamlit's static file route sends it to the
+browser straight from disk. That route refuses files over 200 MB, so a bundle
+bigger than ``BUNDLE_PART_BYTES`` is split into standalone ZIPs below it; only
+a single asset over the limit still needs the reverse proxy or the CLI.
+
+    python packets.py presentation > presentation_materials.zip
+"""
+import hashlib
+import html
+import os
+import re
+import sys
+
+import streamlit as st
+
+import content_store
+import item_bank
+import zip_stream
+from pdf_writer import PdfDocument
+from ranks import LEVELS
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.environ.get("PACKET_CACHE_DIR", os.path.join(APP_DIR, ".cache", "packets"))
+ASSETS_DIR = os.environ.get("PRESENTATION_ASSETS_DIR", os.path.join(APP_DIR, "assets", "presentation"))
+# Streamlit serves <app dir>/static/ at app/static/ when server.enableStaticServing is on
+BUNDLE_DIR = os.path.join(APP_DIR, "static", "downloads")
+BUNDLE_URL = "./app/static/downloads"
+BUNDLE_NAME = "presentation_materials"
+STATIC_FILE_LIMIT = 200 * 1024 * 1024  # Streamlit's static route refuses anything bigger
+# Source bytes per bundle part; the margin covers ZIP headers and deflate overhead
+BUNDLE_PART_BYTES = int(float(os.environ.get("PRESENTATION_PART_MB", "190")) * 1_000_000)
+
+LESSON_TITLE = "Space Technology & Earth Science"
+FOOTER = "Grosse Pointe South High School - Earth Science 9-12"
+OVERVIEW = ["Grade Level: 9-12", "Duration: 50-60 minutes", "Subject: Earth Science", "State: Michigan"]
+
+_LINK = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+_EMPHASIS = re.compile(r"(\*\*|__|\*|`)")
+_TAG = re.compile(r"<[^>]+>")
+_BLOCK_END = re.compile(r"</(p|div|li|h[1-6]|tr)>|<br\s*/?>", re.IGNORECASE)
+_HEADING_TAG = re.compile(r"<h([1-6])[^>]*>", re.IGNORECASE)
+
+
+def _plain(text):
+    """Inline markdown/HTML reduced to plain text."""
+    text = _LINK.sub(lambda m: m.group(1) if m.group(1) == m.group(2) else f"{m.group(1)} ({m.group(2)})", text)
+    return html.unescape(_TAG.sub("", _EMPHASIS.sub("", text))).strip()
+
+
+def _html_to_markdown(text):
+    text = _HEADING_TAG.sub(lambda m: "\n" + "#" * (int(m.group(1)) + 1) + " ", text)
+    text = re.sub(r"<li[^>]*>", "\n- ", text, flags=re.IGNORECASE)
+    return _BLOCK_END.sub("\n", text)
+
+
+def markdown_items(text):
+    """(style, text) pairs for a markdown string: headings, bullets and paragraphs."""
+    items, paragraph = [], []
+
+    def end_paragraph():
+        if paragraph:
+            items.append(("body", " ".join(paragraph)))
+            paragraph.clear()
+
+    for line in text.splitlines():
+        stripped = line.strip()
+        heading = re.match(r"^(#{1,6})\s+(.*)", stripped)
+        bullet = re.match(r"^([-*•]|\d+\.)\s+(.*)", stripped)
+        if not stripped or set(stripped) <= {"-", "*", "_"}:
+            end_paragraph()
+        elif heading:
+            end_paragraph()
+            level = min(3, max(1, len(heading.group(1)) - 1))
+            items.append((f"h{level}", _plain(heading.group(2))))
+        elif bullet:
+            end_paragraph()
+            marker = bullet.group(1) + " " if bullet.group(1)[0].isdigit() else ""
+            items.append(("bullet", marker + _plain(bullet.group(2))))
+        else:
+            paragraph.append(_plain(stripped))
+    end_paragraph()
+    return [(style, text) for style, text in items if text]
+
+
+def block_items(blocks, answers=False):
+    """(style, text) pairs for compiled content blocks, in reading order.
+
+    Quick checks become questions followed by their options; with
+    ``answers`` the correct option is marked.
+    """
+    items = []
+    for block in blocks:
+        kind = block["type"]
+        if kind == "html":
+            items += markdown_items(_html_to_markdown(block["html"]))
+        elif kind in content_store.TEXT_BLOCKS:
+            items += markdown_items(block[kind])
+        elif kind == "metric":
+            label, value = block["metric"][:2]
+            items.append(("bullet", f"{_plain(str(label))}: {_plain(str(value))}"))
+        elif kind == "table":
+            table = block["table"]
+            items += [("bullet", "; ".join(f"{column}: {_plain(str(value))}" for column, value in row.items()))
+                      for row in table.to_dict("records")]
+        elif kind == "columns":
+            for children in block["blocks"]:
+                items += block_items(children, answers)
+        elif kind == "tabs":
+            for title, children in zip(block["tabs"], block["blocks"]):
+                items.append(("h2", _plain(title)))
+                items += block_items(children, answers)
+        elif kind in ("expander", "reveal"):
+            items.append(("h3", _plain(block[kind])))
+            items += block_items(block["blocks"], answers)
+        elif kind == "check":
+            items += question_items(block["check"], answers)
+    return items
+
+
+def question_items(item, answers=False):
+    items = [("h3", _plain(item["question"]))]
+    for index, option in enumerate(item["options"]):
+        mark = "[correct] " if answers and index == item["answer"] else ""
+        items.append(("bullet", mark + _plain(option)))
+    return items
+
+
+def _add(doc, items):
+    for style, text in items:
+        doc.add(text, style)
+
+
+def _pages():
+    """(navigation label, page content) for every lesson page with a content file."""
+    for entry in content_store.load("lesson")["navigation"]:
+        if content_store.has_page(entry["page"]):
+            yield entry, content_store.load_page(entry["page"])
+
+
+def build_student_packet():
+    doc = PdfDocument(f"{LESSON_TITLE} - Student Packet", FOOTER)
+    doc.add(f"{LESSON_TITLE}: Student Packet", "title")
+    doc.add("Name: ____________________________    Class period: ______    Date: __________")
+    for entry, content in _pages():
+        if entry["page"] in ("quiz", "design_challenge"):
+            continue
+        doc.page_break()
+        doc.add(content["title"], "h1")
+        _add(doc, block_items(content.get("blocks", [])))
+
+    challenge = content_store.load_page("design_challenge")
+    doc.page_break()
+    doc.add(challenge["title"] + " - Worksheet", "h1")
+    _add(doc, block_items(challenge["sections"]["intro"]))
+    doc.add("Mission scenarios", "h2")
+    for name, scenario in challenge["scenarios"].items():
+        doc.add(name, "h3")
+        doc.add(scenario["description"])
+        doc.add("Measures: " + ", ".join(scenario["measures"]), "small")
+    for prompt, options, lines in [
+        ("Mission name", None, 1),
+        ("Scenario you chose", None, 1),
+        ("Orbit (circle one)", challenge["orbits"], 0),
+        ("Instruments (circle all you need)", challenge["instruments"], 0),
+        ("Number of satellites and why", None, 2),
+        ("Mission goal: what problem will you solve?", None, 3),
+        ("How will your mission benefit Michigan?", None, 3),
+    ]:
+        doc.add(prompt, "h3")
+        if options:
+            doc.add("   /   ".join(options))
+        doc.lines(lines)
+
+    quiz = content_store.load_page("quiz")
+    doc.page_break()
+    doc.add(quiz["title"], "h1")
+    _add(doc, block_items(quiz.get("blocks", [])))
+    for part in quiz["parts"]:
+        _add(doc, markdown_items(part["heading"]))
+        for item in part["items"]:
+            _add(doc, question_items(item))
+    _add(doc, markdown_items(quiz["short_answer_heading"]))
+    for item in quiz["short_answers"]:
+        doc.add(_plain(item["question"]), "h3")
+        doc.lines(5)
+    return doc.to_bytes()
+
+
+def build_teacher_packet():
+    doc = PdfDocument(f"{LESSON_TITLE} - Teacher Packet", FOOTER)
+    doc.add(f"{LESSON_TITLE}: Teacher Packet", "title")
+    doc.add("Lesson overview", "h1")
+    for line in OVERVIEW:
+        doc.add(line, "bullet")
+    doc.add("Lesson sequence", "h2")
+    for number, entry in enumerate(content_store.load("lesson")["navigation"], start=1):
+        doc.add(f"{number}. {entry['label']}", "bullet")
+
+    objectives = content_store.load_page("objectives")
+    doc.add(objectives["title"], "h1")
+    _add(doc, block_items(objectives["blocks"]))
+
+    banks = {"Final quiz": item_bank.load_bank("quiz"), "Quick checks": item_bank.load_bank("checks")}
+    doc.page_break()
+    doc.add("Michigan Science Standards alignment", "h1")
+    alignment = {}
+    for bank in banks.values():
+        for tag, positions in bank.standards.items():
+            alignment.setdefault(tag, []).extend(bank.ids[position] for position in positions)
+    for tag in sorted(alignment):
+        doc.add(f"MSS {tag}: " + ", ".join(alignment[tag]), "bullet")
+
+    doc.add("Answer keys", "h1")
+    for title, bank in banks.items():
+        doc.add(title, "h2")
+        for item in bank.items:
+            doc.add(f"{item['id']}: {_plain(item['question'])}", "h3")
+            doc.add(f"Answer: {_plain(item['options'][item['answer']])}")
+            doc.add(f"{item['xp']} XP · standards: {', '.join(item['standards']) or '-'}", "small")
+
+    doc.add("Assessment and rank thresholds", "h2")
+    doc.add("Final quiz status: 80% or more Excellent, 60% or more Good Work, otherwise Keep Studying.", "bullet")
+    for threshold, name in LEVELS:
+        doc.add(f"{name}: {threshold}+ XP", "bullet")
+
+    challenge = content_store.load_page("design_challenge")
+    doc.page_break()
+    doc.add("Design challenge notes", "h1")
+    for name, scenario in challenge["scenarios"].items():
+        doc.add(name, "h2")
+        doc.add(f"Recommended orbit: {scenario['recommended_orbit']}. {scenario['orbit_reason']}")
+        doc.add("Recommended instruments: " + ", ".join(scenario["recommended_instruments"]))
+        doc.add(f"Michigan relevance: {scenario['michigan_relevance']}", "small")
+    return doc.to_bytes()
+
+
+def _slide_outline(content):
+    lines = [f"# {_plain(content['title'])}", ""]
+    for style, text in block_items(content.get("blocks", [])):
+        if style.startswith("h"):
+            lines += ["", "#" * (int(style[1]) + 1) + " " + text]
+        elif style == "bullet":
+            lines.append(f"- {text}")
+        else:
+            lines += ["", text]
+    return "\n".join(lines).strip() + "\n"
+
+
+def _walk_tables(blocks):
+    for block in blocks:
+        if block["type"] == "table":
+            yield block["table"]
+        children = block.get("blocks", [])
+        if block["type"] in ("columns", "tabs"):
+            children = [child for column in children for child in column]
+        yield from _walk_tables(children)
+
+
+def presentation_entries():
+    """(archive name, bytes or file path) for everything in the presentation bundle."""
+    yield "README.txt", (
+        f"{LESSON_TITLE} - presentation materials\n\n"
+        "slides/   one outline per lesson page (Markdown; paste into your slide tool)\n"
+        "data/     data tables from the lesson as CSV\n"
+        "assets/   slide decks, images and maps supplied with the lesson\n"
+        "student_packet.pdf   printable student packet\n").encode()
+    for number, (entry, content) in enumerate(_pages(), start=1):
+        yield f"slides/{number:02d}-{entry['page']}.md", _slide_outline(content).encode()
+        for index, table in enumerate(_walk_tables(content.get("blocks", [])), start=1):
+            yield f"data/{entry['page']}-table-{index}.csv", table.to_csv(index=False).encode()
+    # The teacher packet holds the answer keys; this bundle is served from a public URL
+    yield "student_packet.pdf", packet("student")
+    if os.path.isdir(ASSETS_DIR):
+        yield from zip_stream.tree_entries(ASSETS_DIR, "assets/")
+
+
+PACKETS = {
+    "student": (build_student_packet, "student_packet.pdf", "application/pdf"),
+    "teacher": (build_teacher_packet, "teacher_packet.pdf", "application/pdf"),
+}
+
+
+@st.cache_resource(show_spinner=False)
+def content_digest():
+    """Hash of the content files, the assets and this generator, i.e. the version of every packet."""
+    digest = hashlib.sha256()
+    paths = [os.path.join(APP_DIR, name) for name in ("packets.py", "pdf_writer.py", "zip_stream.py")]
+    for root, _, names in os.walk(content_store.CONTENT_DIR):
+        paths += [os.path.join(root, name) for name in names if name.endswith(".json")]
+    for path in sorted(paths):
+        digest.update(os.path.relpath(path, content_store.CONTENT_DIR).encode())
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    if os.path.isdir(ASSETS_DIR):
+        # Assets can be large, so they are versioned by name, size and mtime rather than read
+        for name, path in zip_stream.tree_entries(ASSETS_DIR):
+            status = os.stat(path)
+            digest.update(f"{name}:{status.st_size}:{status.st_mtime_ns}".encode())
+    return digest.hexdigest()[:16]
+
+
+def _replace_versions(directory, stem, extension, keep):
+    for old in os.listdir(directory):
+        if old.startswith(f"{stem}-") and old.endswith(extension) and old not in keep:
+            os.remove(os.path.join(directory, old))
+
+
+@st.cache_resource(show_spinner=False)
+def _packet_bytes(name, digest):
+    build, file_name, _ = PACKETS[name]
+    stem, extension = os.path.splitext(file_name)
+    path = os.path.join(CACHE_DIR, f"{stem}-{digest}{extension}")
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            return f.read()
+    data = build()
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "wb") as f:
+        f.write(data)
+    os.replace(temporary, path)
+    _replace_versions(CACHE_DIR, stem, extension, {os.path.basename(path)})
+    return data
+
+
+def packet(name):
+    """Bytes of the ``student`` or ``teacher`` packet for the current content."""
+    return _packet_bytes(name, content_digest())
+
+
+def _source_size(source):
+    return len(source) if isinstance(source, (bytes, bytearray)) else os.path.getsize(source)
+
+
+def bundle_parts(entries, limit=BUNDLE_PART_BYTES):
+    """Split ``entries`` into lists of at most ``limit`` source bytes, keeping their order.
+
+    An entry bigger than ``limit`` gets a part of its own.
+    """
+    parts, part, size = [], [], 0
+    for name, source in entries:
+        entry_size = _source_size(source)
+        if part and size + entry_size > limit:
+            parts.append(part)
+            part, size = [], 0
+        part.append((name, source))
+        size += entry_size
+    if part or not parts:
+        parts.append(part)
+    return parts
+
+
+@st.cache_resource(show_spinner=False)
+def _bundle_files(digest):
+    parts = bundle_parts(presentation_entries())
+    names = [f"{BUNDLE_NAME}-{digest}.zip"] if len(parts) == 1 else [
+        f"{BUNDLE_NAME}-{digest}-part{number}of{len(parts)}.zip" for number in range(1, len(parts) + 1)]
+    os.makedirs(BUNDLE_DIR, exist_ok=True)
+    files = []
+    for file_name, part in zip(names, parts):
+        path = os.path.join(BUNDLE_DIR, file_name)
+        if not os.path.exists(path):
+            zip_stream.write_zip(part, path)
+        files.append((file_name, os.path.getsize(path)))
+    _replace_versions(BUNDLE_DIR, BUNDLE_NAME, ".zip", set(names))
+    return files
+
+
+@st.cache_resource(show_spinner=False)
+def _discard_stale_bundles(digest):
+    if os.path.isdir(BUNDLE_DIR):
+        _replace_versions(BUNDLE_DIR, BUNDLE_NAME, ".zip", {
+            name for name in os.listdir(BUNDLE_DIR) if name.startswith(f"{BUNDLE_NAME}-{digest}")})
+
+
+def discard_stale_bundles():
+    """Remove bundles of older content versions from the public static folder, once per process."""
+    _discard_stale_bundles(content_digest())
+
+
+def presentation_bundle():
+    """[(URL, size in bytes)] of the presentation ZIP, one per part, building it if needed."""
+    return [(f"{BUNDLE_URL}/{file_name}", size) for file_name, size in _bundle_files(content_digest())]
+
+
+def main():
+    if sys.argv[1:] != ["presentation"]:
+        sys.exit("usage: python packets.py presentation > presentation_materials.zip")
+    for chunk in zip_stream.iter_zip(presentation_entries()):
+        sys.stdout.buffer.write(chunk)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""A small text-only PDF writer for the printable lesson packets.
+
+The packets are headings, paragraphs and bullet lists, so instead of adding
+a PDF dependency this lays text out in the standard Helvetica fonts that
+every PDF viewer ships. Text is encoded as WinAnsi (cp1252): typographic
+quotes and dashes survive, emoji and other symbols are dropped. Output is
+deterministic (no timestamps), so identical content gives identical bytes.
+"""
+import re
+import zlib
+
+PAGE_WIDTH, PAGE_HEIGHT = 612, 792  # US Letter, points
+MARGIN = 54
+
+# Advance widths (1/1000 em) of Helvetica for ASCII 32..126, from the standard AFM metrics
+_HELVETICA = [
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+]
+_BOLD_SCALE = 1.08  # Helvetica-Bold is a little wider; close enough for line breaking
+
+STYLES = {
+    # name: (font, size, leading, space before, indent)
+    "title": ("F2", 20, 26, 0, 0),
+    "h1": ("F2", 15, 20, 14, 0),
+    "h2": ("F2", 12.5, 17, 10, 0),
+    "h3": ("F2", 11, 15, 8, 0),
+    "body": ("F1", 10.5, 14, 4, 0),
+    "bullet": ("F1", 10.5, 14, 2, 14),
+    "small": ("F1", 9, 12, 2, 0),
+}
+
+_REPLACEMENTS = {"→": "->", "←": "<-", "≈": "~", "≥": ">=", "≤": "<=", "✓": "v", "✅": "v", "❌": "x", "×": "x"}
+
+
+def to_winansi(text):
+    """``text`` as cp1252 bytes with arrows spelled out and anything unencodable dropped."""
+    for old, new in _REPLACEMENTS.items():
+        text = text.replace(old, new)
+    data = text.encode("cp1252", errors="ignore")
+    return re.sub(rb"  +", b" ", data).strip()
+
+
+def text_width(data, size, font="F1"):
+    """Width in points of cp1252 ``data`` set in Helvetica at ``size``."""
+    units = sum(_HELVETICA[byte - 32] if 32 <= byte <= 126 else 556 for byte in data)
+    return units * size / 1000 * (_BOLD_SCALE if font == "F2" else 1)
+
+
+def wrap(data, size, width, font="F1"):
+    """Break cp1252 ``data`` into lines no wider than ``width`` points."""
+    lines, line = [], b""
+    for word in data.split(b" "):
+        candidate = word if not line else line + b" " + word
+        if line and text_width(candidate, size, font) > width:
+            lines.append(line)
+            line = word
+        else:
+            line = candidate
+    if line:
+        lines.append(line)
+    return lines
+
+
+def _escape(data):
+    return data.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+
+
+class PdfDocument:
+    """Flowing text laid out top to bottom onto as many pages as needed."""
+
+    def __init__(self, title, footer=""):
+        self.title = title
+        self.footer = footer
+        self._pages = []
+        self._ops = None
+        self._y = 0
+        self.page_break()
+
+    def page_break(self):
+        self._ops = []
+        self._pages.append(self._ops)
+        self._y = PAGE_HEIGHT - MARGIN
+
+    def add(self, text, style="body"):
+        """Add a paragraph of ``text`` in one of ``STYLES``."""
+        font, size, leading, before, indent = STYLES[style]
+        data = to_winansi(text)
+        if not data:
+            return
+        x = MARGIN + indent
+        lines = wrap(data, size, PAGE_WIDTH - MARGIN - x, font)
+        keep_with_next = leading * (3 if style in ("title", "h1", "h2", "h3") else 1)
+        if self._y - before - keep_with_next < MARGIN:
+            self.page_break()
+        elif self._y < PAGE_HEIGHT - MARGIN:
+            self._y -= before
+        for number, line in enumerate(lines):
+            if self._y - leading < MARGIN:
+                self.page_break()
+            self._y -= leading
+            if style == "bullet" and number == 0:
+                self._ops.append(b"BT /F1 %.1f Tf %.1f %.1f Td (\x95) Tj ET" % (size, x - 10, self._y))
+            self._ops.append(b"BT /%s %.1f Tf %.1f %.1f Td (%s) Tj ET" % (
+                font.encode(), size, x, self._y, _escape(line)))
+
+    def lines(self, count=3):
+        """Ruled blank lines for handwritten answers."""
+        for _ in range(count):
+            if self._y - 22 < MARGIN:
+                self.page_break()
+            self._y -= 22
+            self._ops.append(b"0.6 G 0.5 w %d %.1f m %d %.1f l S 0 G" % (
+                MARGIN, self._y, PAGE_WIDTH - MARGIN, self._y))
+
+    def to_bytes(self):
+        objects = [
+            b"<< /Type /Catalog /Pages 2 0 R >>",
+            None,  # page tree, filled in below
+            b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+            b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>",
+            # Document info strings aren't WinAnsi; UTF-16 hex keeps the title intact
+            b"<< /Title <FEFF%s> /Producer (pdf_writer.py) >>" % self.title.encode("utf-16-be").hex().upper().encode(),
+        ]
+        page_ids = []
+        total = len(self._pages)
+        for number, ops in enumerate(self._pages, start=1):
+            footer = to_winansi(f"{self.footer}    Page {number} of {total}".strip())
+            stream = b"\n".join(ops + [b"BT /F1 8 Tf %d %d Td (%s) Tj ET" % (MARGIN, MARGIN - 24, _escape(footer))])
+            stream = zlib.compress(stream, 9)
+            objects.append(b"<< /Length %d /Filter /FlateDecode >>\nstream\n%s\nendstream" % (len(stream), stream))
+            content_id = len(objects)
+            objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] /Contents %d 0 R "
+                           b"/Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> >>"
+                           % (PAGE_WIDTH, PAGE_HEIGHT, content_id))
+            page_ids.append(len(objects))
+        objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+            b" ".join(b"%d 0 R" % page_id for page_id in page_ids), len(page_ids))
+
+        out = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        offsets = []
+        for number, body in enumerate(objects, start=1):
+            offsets.append(len(out))
+            out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+        xref = len(out)
+        out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+        out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+        out += b"trailer\n<< /Size %d /Root 1 0 R /Info 5 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+        return bytes(out)
@@ -0,0 +1,114 @@
+"""Completed checks and achievements as integer bitmasks.
+
+Every check ID and achievement name has a fixed bit in a registry, so a
+student's progress is two small ints instead of a set of strings and a list
+scanned with ``not in``. Membership is one AND, "are all of these done" is a
+mask comparison, and the persisted form is just the integers.
+
+Bits are positions in the tuples below, so new names must be appended at the
+end; reordering or removing a name would reinterpret saved progress.
+"""
+
+CHECK_IDS = (
+    "atmo_q1", "atmo_q2", "ocean_q1", "ocean_q2", "land_q1", "land_q2", "ice_q1", "ice_q2",
+    "satellite_scholar_bonus", "printing_q1", "design_challenge", "professor_feedback",
+    "quiz_complete", "quiz_short_answer_feedback",
+)
+
+ACHIEVEMENT_NAMES = (
+    "🌟 First Steps", "🌤️ Atmosphere Expert", "🌊 Ocean Expert", "🌲 Land Expert", "🧊 Ice Expert",
+    "🛰️ Satellite Scholar", "🔧 Space Engineer", "📝 Quiz Champion", "🏆 Perfect Score",
+)
+
+
+class Registry:
+    """Fixed name -> bit assignment."""
+
+    def __init__(self, kind, names):
+        self.kind = kind
+        self.names = tuple(names)
+        self._bits = {name: 1 << position for position, name in enumerate(self.names)}
+
+    def bit(self, name):
+        try:
+            return self._bits[name]
+        except KeyError:
+            raise KeyError(f"unknown {self.kind} {name!r}; add it to progress_bits") from None
+
+    def mask(self, names):
+        """OR of the bits for ``names``."""
+        mask = 0
+        for name in names:
+            mask |= self.bit(name)
+        return mask
+
+    def decode(self, mask):
+        """Names whose bits are set in ``mask``, in registry order."""
+        return [name for position, name in enumerate(self.names) if mask >> position & 1]
+
+
+CHECKS = Registry("check", CHECK_IDS)
+ACHIEVEMENTS = Registry("achievement", ACHIEVEMENT_NAMES)
+
+
+class BitSet:
+    """Set-like view over an int mask; subclasses pick the registry.
+
+    Only the int is stored on the instance, so a pickled session holds a few
+    bytes regardless of how many checks are done.
+    """
+
+    __slots__ = ("mask",)
+    registry = None
+
+    def __init__(self, mask=0):
+        self.mask = mask
+
+    @classmethod
+    def of(cls, value):
+        """Coerce a stored int, an iterable of names or an existing set."""
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, int):
+            return cls(value)
+        return cls(cls.registry.mask(value or ()))
+
+    def __contains__(self, name):
+        return bool(self.mask & self.registry.bit(name))
+
+    def add(self, name):
+        """Set ``name``'s bit; True if it was not set before."""
+        bit = self.registry.bit(name)
+        if self.mask & bit:
+            return False
+        self.mask |= bit
+        return True
+
+    def has_all(self, mask):
+        """True if every bit in ``mask`` (see ``Registry.mask``) is set."""
+        return self.mask & mask == mask
+
+    def __iter__(self):
+        return iter(self.registry.decode(self.mask))
+
+    def __len__(self):
+        return bin(self.mask).count("1")
+
+    def __eq__(self, other):
+        return type(other) is type(self) and other.mask == self.mask
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.registry.decode(self.mask)!r})"
+
+    def __reduce__(self):
+        return type(self), (self.mask,)
+
+
+class CheckSet(BitSet):
+    __slots__ = ()
+    registry = CHECKS
+
+
+class AchievementSet(BitSet):
+    __slots__ = ()
+    registry = ACHIEVEMENTS
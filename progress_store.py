@@ -0,0 +1,245 @@
+"""Durable student progress: XP, achievements, completed checks and answers.
+
+Progress used to live only in ``st.session_state``, so a refresh, a dropped
+Chromebook connection or a server restart wiped it. It is now saved under a
+student ID in a local SQLite file in WAL mode and restored when the student
+reconnects with the same ID.
+
+Saving is write-behind: ``save`` only records the latest snapshot in memory
+(and skips it entirely when nothing changed), and a background thread writes
+every pending student in one transaction each ``FLUSH_INTERVAL`` seconds or
+as soon as ``MAX_BATCH`` students are waiting. Several clicks between two
+flushes cost one row write. Pending rows are flushed at interpreter exit, so
+only a hard crash can lose the last few seconds.
+"""
+import atexit
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+
+from progress_bits import AchievementSet, CheckSet
+
+STORE_PATH = os.environ.get(
+    "PROGRESS_STORE_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "progress.sqlite3"),
+)
+FLUSH_INTERVAL = float(os.environ.get("PROGRESS_FLUSH_INTERVAL", "2.0"))
+MAX_BATCH = int(os.environ.get("PROGRESS_MAX_BATCH", "200"))
+
+FIELDS = ("xp_points", "achievements", "completed_checks", "mission_data", "quiz_answers", "quiz_short_answers")
+
+_ID_PATTERN = re.compile(r"[^a-z0-9._-]")
+
+
+def normalize_id(raw):
+    """Lower-case ``raw`` and drop anything but letters, digits, dot, dash and underscore."""
+    return _ID_PATTERN.sub("", (raw or "").strip().lower())[:64]
+
+
+# Stored as bitmask ints; rows saved before the bitsets hold lists of names, which ``of`` also accepts
+_BITSETS = {"completed_checks": CheckSet, "achievements": AchievementSet}
+
+
+def snapshot(state):
+    """The persisted part of ``state`` as a JSON-serialisable dict."""
+    data = {field: state[field] for field in FIELDS if field in state}
+    for field, bitset in _BITSETS.items():
+        if field in data:
+            data[field] = bitset.of(data[field]).mask
+    return data
+
+
+def apply(state, data):
+    """Copy a stored snapshot back into ``state``."""
+    for field in FIELDS:
+        if field in data:
+            state[field] = _BITSETS[field].of(data[field]) if field in _BITSETS else data[field]
+
+
+class ProgressStore:
+    """SQLite-backed progress rows with coalesced, batched background writes."""
+
+    def __init__(self, path=STORE_PATH, flush_interval=FLUSH_INTERVAL, max_batch=MAX_BATCH):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self._pending = {}
+        self._inflight = {}
+        self._last_saved = {}
+        self._cond = threading.Condition()
+        self._db_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._conn = None
+        self._writer = None
+        self._stopped = False
+        self.rows_written = 0
+        self.batches = 0
+
+    def _connection(self):
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=10)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS progress ("
+                " student_id TEXT PRIMARY KEY,"
+                " data TEXT NOT NULL,"
+                " updated_at REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS progress_updated_at ON progress (updated_at)")
+            self._conn.commit()
+        return self._conn
+
+    def _start_writer(self):
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._write_loop, name="progress-writer", daemon=True)
+            self._writer.start()
+
+    def save(self, student_id, state):
+        """Queue the current progress in ``state`` for ``student_id``; no I/O on this thread."""
+        data = json.dumps(snapshot(state), sort_keys=True, default=str)
+        with self._cond:
+            if self._latest(student_id) == data:
+                return False
+            self._pending[student_id] = (data, time.time())
+            self._start_writer()
+            if len(self._pending) >= self.max_batch:
+                self._cond.notify()
+        return True
+
+    def _latest(self, student_id):
+        """Newest known JSON for ``student_id``: pending, being written, or last written. Hold ``_cond``."""
+        entry = self._pending.get(student_id) or self._inflight.get(student_id)
+        return entry[0] if entry else self._last_saved.get(student_id)
+
+    def _unflushed(self):
+        """``{student_id: (data, updated_at)}`` not yet committed, including the batch being written."""
+        with self._cond:
+            return {**self._inflight, **self._pending}
+
+    @staticmethod
+    def _merge(rows, unflushed):
+        # Read the unflushed rows before the table: a batch that commits in
+        # between is then in one or the other, and the newer entry wins
+        for student_id, entry in unflushed.items():
+            if student_id not in rows or entry[1] >= rows[student_id][1]:
+                rows[student_id] = entry
+        return rows
+
+    def load(self, student_id):
+        """Return the stored snapshot for ``student_id`` (including unflushed saves) or None."""
+        pending = self._unflushed().get(student_id)
+        if pending is not None:
+            return json.loads(pending[0])
+        with self._db_lock:
+            row = self._connection().execute(
+                "SELECT data FROM progress WHERE student_id = ?", (student_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        with self._cond:
+            self._last_saved.setdefault(student_id, row[0])
+        return json.loads(row[0])
+
+    def snapshots(self):
+        """Every stored snapshot keyed by student ID, unflushed saves included."""
+        unflushed = self._unflushed()
+        with self._db_lock:
+            rows = self._connection().execute("SELECT student_id, data, updated_at FROM progress").fetchall()
+        rows = self._merge({student_id: (data, updated_at) for student_id, data, updated_at in rows}, unflushed)
+        return {student_id: json.loads(data) for student_id, (data, _) in rows.items()}
+
+    def changed_since(self, cursor):
+        """``{student_id: (snapshot, updated_at)}`` saved at or after ``cursor`` (a ``time.time()`` value)
+        and the cursor for the next call. Rows saved exactly at the cursor come back again next time.
+        """
+        unflushed = {student_id: entry for student_id, entry in self._unflushed().items() if entry[1] >= cursor}
+        with self._db_lock:
+            rows = self._connection().execute(
+                "SELECT student_id, data, updated_at FROM progress WHERE updated_at >= ?", (cursor,)
+            ).fetchall()
+        changed = self._merge({student_id: (data, updated_at) for student_id, data, updated_at in rows}, unflushed)
+        next_cursor = max((updated_at for _, updated_at in changed.values()), default=cursor)
+        return {student_id: (json.loads(data), updated_at)
+                for student_id, (data, updated_at) in changed.items()}, next_cursor
+
+    def restore(self, student_id, state):
+        """Load ``student_id``'s progress into ``state``; False if nothing is stored yet."""
+        data = self.load(student_id)
+        if data is None:
+            return False
+        apply(state, data)
+        return True
+
+    def flush(self):
+        """Write every pending snapshot in a single transaction.
+
+        The batch stays visible to readers as ``_inflight`` until it has
+        committed; flushes from the writer thread and ``close`` run one at a time.
+        """
+        with self._flush_lock:
+            return self._flush()
+
+    def _flush(self):
+        with self._cond:
+            batch, self._pending = self._pending, {}
+            self._inflight = batch
+        if not batch:
+            return 0
+        rows = [(student_id, data, updated_at) for student_id, (data, updated_at) in batch.items()]
+        try:
+            with self._db_lock:
+                conn = self._connection()
+                with conn:
+                    conn.executemany(
+                        "INSERT INTO progress (student_id, data, updated_at) VALUES (?, ?, ?)"
+                        " ON CONFLICT(student_id) DO UPDATE SET data = excluded.data, updated_at = excluded.updated_at",
+                        rows,
+                    )
+        except sqlite3.Error:
+            # Put the batch back unless a newer snapshot arrived meanwhile
+            with self._cond:
+                for student_id, entry in batch.items():
+                    self._pending.setdefault(student_id, entry)
+                self._inflight = {}
+            raise
+        with self._cond:
+            for student_id, data, _ in rows:
+                self._last_saved[student_id] = data
+            self._inflight = {}
+            self.rows_written += len(rows)
+            self.batches += 1
+        return len(rows)
+
+    def _write_loop(self):
+        while not self._stopped:
+            with self._cond:
+                self._cond.wait(self.flush_interval)
+            try:
+                self.flush()
+            except sqlite3.Error:
+                # The batch is still pending; try again on the next tick
+                time.sleep(self.flush_interval)
+
+    def close(self):
+        """Flush and stop the writer thread."""
+        self._stopped = True
+        with self._cond:
+            self._cond.notify()
+        self.flush()
+
+    def stats(self):
+        with self._cond:
+            pending = len(self._pending) + len(self._inflight)
+        with self._db_lock:
+            students = self._connection().execute("SELECT COUNT(*) FROM progress").fetchone()[0]
+        return {"students": students, "pending": pending, "rows_written": self.rows_written,
+                "batches": self.batches}
+
+
+store = ProgressStore()
+atexit.register(store.flush)
@@ -0,0 +1,18 @@
+"""Rank badges by XP, shared by the sidebar, the class dashboard and the teacher packet.
+
+Kept free of Streamlit so offline tools (``class_stats``, ``packets``) can
+import it without starting the app's background threads.
+"""
+
+# Highest first
+LEVELS = [
+    (400, "🌟 Earth Science Master"),
+    (250, "🛰️ Satellite Expert"),
+    (100, "🔬 Science Explorer"),
+    (25, "📚 Learner"),
+    (0, "🌱 Beginner"),
+]
+
+
+def level_for(xp):
+    return next(name for threshold, name in LEVELS if xp >= threshold)
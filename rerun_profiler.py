@@ -0,0 +1,144 @@
+"""Per-rerun timings behind the teacher-mode instrumentation panel.
+
+Every script run of ``app.py`` is one trace: wall time for the whole rerun,
+time spent drawing the active page, widgets created and the size of the
+session's state. Traces from every session land in one bounded buffer so a
+teacher can see which pages slow down when a whole class is connected, and
+export them to a JSON Lines file for later analysis. Totals also go to
+``metrics`` as ``rerun.wall`` and ``rerun.page.<page>``.
+"""
+import json
+import os
+import pickle
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import metrics
+
+TRACE_DIR = os.environ.get(
+    "RERUN_TRACE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "traces"))
+MAX_TRACES = int(os.environ.get("RERUN_MAX_TRACES", "5000"))
+
+_lock = threading.Lock()
+_traces = deque(maxlen=MAX_TRACES)
+
+
+class RerunTrace:
+    """Timings for one script run, filled in as the run progresses."""
+
+    def __init__(self, session_id, page):
+        self.session_id = session_id
+        self.page = page
+        self.started_at = time.time()
+        self._start = time.perf_counter()
+        self.page_seconds = None
+        self.wall_seconds = None
+        self.widgets = None
+        self.session_state_bytes = None
+
+    @contextmanager
+    def time_page(self, page):
+        """Time the block that draws ``page``, the page actually shown this run."""
+        self.page = page
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.page_seconds = time.perf_counter() - start
+
+    def finish(self, session_state):
+        """Close the trace and add it to the shared buffer."""
+        self.wall_seconds = time.perf_counter() - self._start
+        self.widgets = widget_count()
+        self.session_state_bytes = state_size(session_state)
+        metrics.record("rerun.wall", self.wall_seconds)
+        if self.page_seconds is not None:
+            metrics.record(f"rerun.page.{self.page}", self.page_seconds)
+        with _lock:
+            _traces.append(self.as_dict())
+
+    def as_dict(self):
+        return {
+            "started_at": self.started_at,
+            "session": self.session_id[:8],
+            "page": self.page,
+            "wall_ms": _ms(self.wall_seconds),
+            "page_ms": _ms(self.page_seconds),
+            "widgets": self.widgets,
+            "session_state_bytes": self.session_state_bytes,
+        }
+
+
+def _ms(seconds):
+    return None if seconds is None else round(seconds * 1000, 2)
+
+
+def widget_count():
+    """Widgets registered so far in the current script run, or None if Streamlit won't say.
+
+    This reads Streamlit's run context, which is not a public API, so any
+    surprise there turns into None rather than breaking the app.
+    """
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+        ctx = get_script_run_ctx(suppress_warning=True)
+        widget_ids = getattr(getattr(ctx, "shared", None), "widget_ids_this_run", None)
+        if widget_ids is None:
+            widget_ids = getattr(ctx, "widget_ids_this_run", None)
+        if hasattr(widget_ids, "snapshot"):
+            widget_ids = widget_ids.snapshot()
+        return None if widget_ids is None else len(widget_ids)
+    except Exception:
+        return None
+
+
+def state_size(session_state):
+    """Approximate bytes held by ``session_state``: pickled size, or shallow size if unpicklable."""
+    total = 0
+    for key in list(session_state.keys()):
+        try:
+            value = session_state[key]
+        except KeyError:
+            continue
+        try:
+            total += len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception:
+            total += sys.getsizeof(value)
+    return total
+
+
+def traces():
+    """Every buffered trace, oldest first."""
+    with _lock:
+        return list(_traces)
+
+
+def page_summary():
+    """Rows of count, p50, p95 and max page time (ms) for every page seen so far."""
+    rows = []
+    for name, stats in metrics.summary("rerun.page.").items():
+        rows.append({
+            "page": name[len("rerun.page."):],
+            "reruns": stats["count"],
+            "p50 ms": _ms(stats["p50"]),
+            "p95 ms": _ms(stats["p95"]),
+            "max ms": _ms(stats["max"]),
+        })
+    return sorted(rows, key=lambda row: row["p95 ms"], reverse=True)
+
+
+def export_traces(directory=TRACE_DIR):
+    """Write buffered traces plus the current metric summary to a new JSON Lines file."""
+    os.makedirs(directory, exist_ok=True)
+    now = time.time()
+    stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(now)) + f"-{int(now * 1000) % 1000:03d}"
+    path = os.path.join(directory, f"rerun_traces-{stamp}.jsonl")
+    with open(path, "w", encoding="utf-8") as f:
+        for trace in traces():
+            f.write(json.dumps(trace) + "\n")
+        f.write(json.dumps({"summary": metrics.summary()}) + "\n")
+    return path
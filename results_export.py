@@ -0,0 +1,329 @@
+"""Gradebook export: every quiz and mission submission as date-partitioned Parquet.
+
+Submitting the final quiz or a mission design records one row (student,
+XP, achievements, quiz answers and short answers, mission choices). Rows are
+buffered in memory and a background thread appends them every
+``FLUSH_INTERVAL`` seconds as a new file
+``EXPORT_DIR/month=YYYY-MM/<date>-part-*.parquet``; files for the current day
+are never rewritten. When the date rolls over, the finished days of each month
+are compacted into a single ``<last date>-compacted.parquet``, so a semester is
+a handful of files: opening a Parquet file costs about as much as decoding a
+whole day of rows, so a file per day would make loading slower than CSV.
+Each row also carries its ``date``, the local day of the submission (run the
+server with ``TZ`` set to the school's time zone), and row-group statistics on
+it let a date range skip files without reading them.
+
+``load`` reads any date range back into pandas through a pyarrow dataset,
+and ``iter_csv`` turns the same dataset into CSV one record batch at a time
+for gradebooks:
+
+    python results_export.py csv --start 2026-09-01 > gradebook.csv
+"""
+import argparse
+import atexit
+import datetime
+import io
+import os
+import sys
+import threading
+import time
+import uuid
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from progress_bits import AchievementSet, CheckSet
+
+EXPORT_DIR = os.environ.get(
+    "RESULTS_EXPORT_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "exports", "submissions"),
+)
+FLUSH_INTERVAL = float(os.environ.get("RESULTS_FLUSH_INTERVAL", "30"))
+MAX_BATCH = int(os.environ.get("RESULTS_MAX_BATCH", "500"))
+CSV_BATCH_ROWS = 2000
+
+SCHEMA = pa.schema([
+    ("submitted_at", pa.timestamp("ms", tz="UTC")),
+    ("date", pa.string()),
+    ("kind", pa.string()),
+    ("student_id", pa.string()),
+    ("session_id", pa.string()),
+    ("xp_points", pa.int32()),
+    ("achievements", pa.list_(pa.string())),
+    ("completed_checks", pa.list_(pa.string())),
+    ("quiz_score", pa.int16()),
+    ("quiz_total", pa.int16()),
+    ("quiz_answers", pa.map_(pa.string(), pa.int16())),
+    ("short_answer_q7", pa.string()),
+    ("short_answer_q8", pa.string()),
+    ("mission_name", pa.string()),
+    ("mission_type", pa.string()),
+    ("orbit", pa.string()),
+    ("instruments", pa.list_(pa.string())),
+    ("num_satellites", pa.int16()),
+    ("use_3d_printing", pa.bool_()),
+    ("budget", pa.string()),
+    ("timeline", pa.string()),
+    ("data_priority", pa.string()),
+])
+PARTITIONING = ds.partitioning(pa.schema([("month", pa.string())]), flavor="hive")
+
+
+def submission(kind, state, now=None):
+    """One export row for a ``quiz`` or ``mission`` submission from ``state``."""
+    now = now or datetime.datetime.now(datetime.timezone.utc)
+    quiz = state.get("quiz_short_answers") or {}
+    mission = state.get("mission_data") or {}
+    row = {
+        "submitted_at": now,
+        # The school day the submission belongs to, in the server's local time (set TZ to the school's zone)
+        "date": now.astimezone().date().isoformat(),
+        "kind": kind,
+        "student_id": state.get("student_id") or None,
+        "session_id": state.get("session_id"),
+        "xp_points": state.get("xp_points", 0),
+        "achievements": list(AchievementSet.of(state.get("achievements"))),
+        "completed_checks": list(CheckSet.of(state.get("completed_checks"))),
+    }
+    if kind == "quiz":
+        row.update({
+            "quiz_score": quiz.get("mc_score"),
+            "quiz_total": quiz.get("mc_total"),
+            "quiz_answers": list((state.get("quiz_answers") or {}).items()),
+            "short_answer_q7": quiz.get("q7"),
+            "short_answer_q8": quiz.get("q8"),
+        })
+    elif kind == "mission":
+        row.update({
+            "mission_name": mission.get("name"),
+            "mission_type": mission.get("type"),
+            "orbit": mission.get("orbit"),
+            "instruments": mission.get("instruments"),
+            "num_satellites": mission.get("num_satellites"),
+            "use_3d_printing": mission.get("use_3d_printing"),
+            "budget": mission.get("budget"),
+            "timeline": mission.get("timeline"),
+            "data_priority": mission.get("data_priority"),
+        })
+    return row
+
+
+class ResultsExporter:
+    """Buffers submission rows and appends them to the Parquet dataset in the background."""
+
+    def __init__(self, directory=EXPORT_DIR, flush_interval=FLUSH_INTERVAL, max_batch=MAX_BATCH):
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self._pending = []
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._writer = None
+        self._last_date = None
+        self.rows_written = 0
+        self.files_written = 0
+
+    def record(self, kind, state):
+        """Queue a submission; no I/O on the calling thread."""
+        row = submission(kind, state)
+        with self._cond:
+            self._pending.append(row)
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name="results-export", daemon=True)
+                self._writer.start()
+            if len(self._pending) >= self.max_batch:
+                self._cond.notify()
+
+    def flush(self):
+        """Append every pending row as one new file per date; returns the number of rows."""
+        with self._cond:
+            rows, self._pending = self._pending, []
+        if not rows:
+            return 0
+        by_date = {}
+        for row in rows:
+            by_date.setdefault(row["date"], []).append(row)
+        with self._write_lock:
+            written = set()
+            try:
+                for date, date_rows in by_date.items():
+                    table = pa.Table.from_pylist(date_rows, schema=SCHEMA)
+                    self._write_part(date, table)
+                    written.add(date)
+                    self.rows_written += len(date_rows)
+            except Exception:
+                # Queue the dates that didn't make it to disk ahead of newer submissions
+                with self._cond:
+                    self._pending[:0] = [row for row in rows if row["date"] not in written]
+                raise
+            today = max(by_date)
+            if self._last_date is not None and today > self._last_date:
+                self.compact(before=today)
+            self._last_date = today
+        return len(rows)
+
+    def _write_part(self, date, table, kind="part", replaces=()):
+        """Write ``table`` as a new file for ``date``; the files in ``replaces`` are retired as it goes live."""
+        directory = os.path.join(self.directory, f"month={date[:7]}")
+        os.makedirs(directory, exist_ok=True)
+        name = f"{date}-{kind}-{time.strftime('%H%M%S')}-{uuid.uuid4().hex[:8]}.parquet"
+        # Write under a dot-name (ignored by dataset discovery) so readers never see a half-written file
+        path = os.path.join(directory, name)
+        temporary = os.path.join(directory, f".{name}.tmp")
+        pq.write_table(table, temporary, compression="zstd")
+        # Hide the replaced files before the new one appears, so no reader counts their rows twice
+        hidden = []
+        try:
+            for source in replaces:
+                os.replace(source, _hidden(source))
+                hidden.append(source)
+            os.replace(temporary, path)
+        except OSError:
+            for source in hidden:
+                os.replace(_hidden(source), source)
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            raise
+        for source in hidden:
+            os.remove(_hidden(source))
+        self.files_written += 1
+        return path
+
+    def compact(self, before=None):
+        """Merge each month's files for days earlier than ``before`` (ISO date) into one file.
+
+        Returns the number of months rewritten. The merged files are hidden before
+        the merged file goes live, so a reader never sees their rows twice. A
+        reader in another process that lists the files in that moment can miss
+        them; ``load`` in this process waits for compaction to finish.
+        """
+        merged = 0
+        if not os.path.isdir(self.directory):
+            return merged
+        for entry in sorted(os.listdir(self.directory)):
+            if not entry.startswith("month="):
+                continue
+            directory = os.path.join(self.directory, entry)
+            # File names start with the (last) date they hold
+            files = sorted(name for name in os.listdir(directory)
+                           if name.endswith(".parquet") and not (before and name[:10] >= before))
+            if len(files) < 2:
+                continue
+            table = pa.concat_tables(pq.read_table(os.path.join(directory, name), schema=SCHEMA)
+                                     for name in files)
+            table = table.sort_by([("submitted_at", "ascending")])
+            self._write_part(files[-1][:10], table, kind="compacted",
+                             replaces=[os.path.join(directory, name) for name in files])
+            merged += 1
+        return merged
+
+    def _write_loop(self):
+        while True:
+            with self._cond:
+                self._cond.wait(self.flush_interval)
+            try:
+                self.flush()
+            except (OSError, pa.ArrowException):
+                time.sleep(self.flush_interval)
+
+    def dataset(self):
+        """The export as a pyarrow dataset, or None before anything was written."""
+        if not os.path.isdir(self.directory) or not os.listdir(self.directory):
+            return None
+        return ds.dataset(self.directory, format="parquet", schema=SCHEMA.append(pa.field("month", pa.string())),
+                          partitioning=PARTITIONING)
+
+    def _filter(self, start, end):
+        condition = None
+        if start:
+            condition = (ds.field("month") >= str(start)[:7]) & (ds.field("date") >= str(start))
+        if end:
+            clause = (ds.field("month") <= str(end)[:7]) & (ds.field("date") <= str(end))
+            condition = clause if condition is None else condition & clause
+        return condition
+
+    def load(self, start=None, end=None, columns=None):
+        """Submissions between ``start`` and ``end`` (ISO dates, inclusive) as a DataFrame."""
+        columns = columns or SCHEMA.names
+        with self._write_lock:  # not halfway through a compaction
+            dataset = self.dataset()
+            if dataset is None:
+                table = SCHEMA.empty_table().select(columns)
+            else:
+                table = dataset.to_table(columns=columns, filter=self._filter(start, end))
+        # Lists and maps stay Arrow-backed instead of becoming one Python object per cell
+        return table.to_pandas(types_mapper=lambda type_: pd.ArrowDtype(type_) if pa.types.is_nested(type_) else None)
+
+    def iter_csv(self, start=None, end=None):
+        """Yield the export as CSV bytes, one record batch at a time (header first)."""
+        dataset = self.dataset()
+        yield _csv_bytes(SCHEMA.empty_table(), header=True)
+        if dataset is None:
+            return
+        scanner = dataset.scanner(columns=SCHEMA.names, filter=self._filter(start, end),
+                                  batch_size=CSV_BATCH_ROWS, batch_readahead=1, fragment_readahead=1)
+        for batch in scanner.to_batches():
+            if batch.num_rows:
+                yield _csv_bytes(pa.Table.from_batches([batch]), header=False)
+
+    def write_csv(self, out, start=None, end=None):
+        """Stream the CSV export into the binary file object ``out``."""
+        for chunk in self.iter_csv(start, end):
+            out.write(chunk)
+
+    def stats(self):
+        files = 0
+        if os.path.isdir(self.directory):
+            files = sum(name.endswith(".parquet") for _, _, names in os.walk(self.directory) for name in names)
+        with self._cond:
+            pending = len(self._pending)
+        return {"files": files, "pending": pending, "rows_written": self.rows_written}
+
+
+def _hidden(path):
+    directory, name = os.path.split(path)
+    return os.path.join(directory, f".{name}.retired")
+
+
+def _csv_bytes(table, header):
+    """CSV for ``table`` with list columns joined by "; " and answer maps as "item=index"."""
+    columns = []
+    for name in SCHEMA.names:
+        column = table.column(name)
+        if pa.types.is_map(column.type):
+            column = pa.chunked_array(
+                [pa.array([None if value is None else "; ".join(f"{k}={v}" for k, v in value)
+                           for value in chunk.to_pylist()], pa.string()) for chunk in column.chunks],
+                pa.string())
+        elif pa.types.is_list(column.type):
+            column = pc.binary_join(column, "; ")
+        columns.append(column)
+    sink = io.BytesIO()
+    pacsv.write_csv(pa.Table.from_arrays(columns, names=SCHEMA.names), sink,
+                    write_options=pacsv.WriteOptions(include_header=header))
+    return sink.getvalue()
+
+
+exporter = ResultsExporter()
+atexit.register(exporter.flush)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export saved quiz and mission submissions")
+    parser.add_argument("command", choices=["csv", "compact"])
+    parser.add_argument("--start", help="first date, YYYY-MM-DD")
+    parser.add_argument("--end", help="last date, YYYY-MM-DD")
+    args = parser.parse_args()
+
+    if args.command == "csv":
+        exporter.write_csv(sys.stdout.buffer, args.start, args.end)
+    else:
+        print(f"compacted {exporter.compact(before=datetime.date.today().isoformat())} months", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
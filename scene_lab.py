@@ -0,0 +1,303 @@
+"""Sample multispectral scenes and the NDVI and albedo math for the satellite lab.
+
+A scene is one uint16 ``.npy`` file shaped (band, row, column). It holds
+surface reflectance x 10,000 in six Landsat-like bands: blue, green, red,
+near-infrared and two shortwave-infrared bands. Scenes live in
+``data/scenes/v<N>/`` next to a ``manifest.json`` with titles, points of
+interest and a SHA-256 per file. ``SceneSet`` maps them read-only, so
+picking a band is a view of the file. The indices are computed at full
+resolution with NumPy and memoized per scene. A threshold change is then
+one comparison, and previews are strided views of the result.
+
+- NDVI = (NIR - Red) / (NIR + Red)
+- broadband albedo uses Liang's (2001) Landsat coefficients:
+  0.356 Blue + 0.130 Red + 0.373 NIR + 0.085 SWIR1 + 0.072 SWIR2 - 0.0018
+
+The bundled v1 scenes are SYNTHETIC. They are painted by
+``python scene_lab.py build`` from typical reflectance spectra of crops,
+soil, forest, water, ice and snow, and they are not satellite images.
+
+    python scene_lab.py                  # verify and summarize
+    python scene_lab.py build            # regenerate the synthetic scenes
+"""
+import json
+import os
+import sys
+from functools import lru_cache
+
+import numpy as np
+import streamlit as st
+
+from lake_data import APP_DIR, DatasetError, file_sha256
+
+DATA_DIR = os.environ.get("SCENE_DATA_DIR", os.path.join(APP_DIR, "data", "scenes"))
+VERSION = os.environ.get("SCENE_DATA_VERSION", "1")
+MANIFEST = "manifest.json"
+BANDS = ["blue", "green", "red", "nir", "swir1", "swir2"]
+SCALE = 10_000
+PREVIEW_SIZE = 200
+ALBEDO_WEIGHTS = {"blue": 0.356, "red": 0.130, "nir": 0.373, "swir1": 0.085, "swir2": 0.072}
+ALBEDO_OFFSET = -0.0018
+INDICES = {
+    "ndvi": {"label": "NDVI", "range": (-1.0, 1.0), "threshold": 0.5},
+    "albedo": {"label": "Albedo", "range": (0.0, 1.0), "threshold": 0.4},
+}
+
+# Color ramps for previews: (value, (r, g, b)) stops
+RAMPS = {
+    "ndvi": [(-1.0, (40, 70, 160)), (0.0, (200, 180, 140)), (0.3, (230, 220, 90)), (0.6, (90, 170, 60)),
+             (1.0, (10, 90, 30))],
+    "albedo": [(0.0, (15, 20, 50)), (0.3, (70, 100, 150)), (0.6, (170, 200, 230)), (1.0, (255, 255, 255))],
+}
+HIGHLIGHT = np.array([255, 60, 140])
+HIGHLIGHT_ALPHA = 0.55
+
+# Typical surface reflectance (blue, green, red, NIR, SWIR1, SWIR2) used to paint the synthetic scenes
+SPECTRA = {
+    "healthy crop": (0.04, 0.08, 0.05, 0.45, 0.25, 0.12),
+    "stressed crop": (0.06, 0.09, 0.12, 0.22, 0.30, 0.22),
+    "bare soil": (0.10, 0.14, 0.18, 0.25, 0.32, 0.28),
+    "forest": (0.03, 0.06, 0.04, 0.35, 0.16, 0.08),
+    "water": (0.06, 0.05, 0.03, 0.01, 0.005, 0.003),
+    "road": (0.12, 0.13, 0.14, 0.18, 0.22, 0.20),
+    "snow": (0.90, 0.88, 0.85, 0.75, 0.10, 0.05),
+    "thick ice": (0.70, 0.68, 0.65, 0.55, 0.08, 0.04),
+    "thin ice": (0.25, 0.23, 0.20, 0.15, 0.03, 0.02),
+}
+SAMPLE_SIZE = 400
+SAMPLE_SEED = 2031
+
+
+class SceneSet:
+    """One version of the sample scenes, memory-mapped."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        try:
+            with open(os.path.join(directory, MANIFEST), encoding="utf-8") as f:
+                self.manifest = json.load(f)
+        except (OSError, ValueError) as error:
+            raise DatasetError(f"{directory}: can't read {MANIFEST}: {error}")
+        self.version = self.manifest["version"]
+        self.synthetic = bool(self.manifest.get("synthetic"))
+        self.scenes = self.manifest["scenes"]
+        self._arrays = {}
+        for name, scene in self.scenes.items():
+            path = os.path.join(directory, scene["file"])
+            try:
+                array = np.load(path, mmap_mode="r")
+            except (OSError, ValueError) as error:
+                raise DatasetError(f"{path}: {error}")
+            if array.ndim != 3 or array.shape[0] != len(BANDS):
+                raise DatasetError(f"{path}: expected ({len(BANDS)}, rows, columns), got {array.shape}")
+            self._arrays[name] = array
+
+    def verify(self):
+        for scene in self.scenes.values():
+            path = os.path.join(self.directory, scene["file"])
+            if file_sha256(path) != scene["sha256"]:
+                raise DatasetError(f"{path}: contents don't match {MANIFEST}")
+
+    def band(self, scene, band, step=1):
+        """Raw uint16 band, every ``step``-th pixel, as a view of the mapped file."""
+        return self._arrays[scene][BANDS.index(band), ::step, ::step]
+
+    def reflectance(self, scene, band, step=1):
+        return self.band(scene, band, step).astype(np.float32) / SCALE
+
+    @lru_cache(maxsize=16)
+    def index(self, scene, name):
+        """Full-resolution NDVI or albedo of a scene (float32, read-only), computed once."""
+        values = ndvi(self.reflectance(scene, "red"), self.reflectance(scene, "nir")) if name == "ndvi" \
+            else albedo({band: self.reflectance(scene, band) for band in ALBEDO_WEIGHTS})
+        values.flags.writeable = False
+        return values
+
+    def pixel(self, scene, row, column):
+        """Reflectance of every band at one pixel."""
+        return {band: float(value) / SCALE for band, value in zip(BANDS, self._arrays[scene][:, row, column])}
+
+    def preview_step(self, scene):
+        return max(1, -(-max(self._arrays[scene].shape[1:]) // PREVIEW_SIZE))
+
+    @lru_cache(maxsize=16)
+    def true_color(self, scene):
+        """Contrast-stretched RGB preview (uint8), shared by every interaction."""
+        step = self.preview_step(scene)
+        rgb = np.stack([self.reflectance(scene, band, step) for band in ("red", "green", "blue")], axis=-1)
+        low, high = np.percentile(rgb, [1, 99])
+        rgb = (np.clip((rgb - low) / max(high - low, 1e-6), 0, 1) ** 0.8 * 255).astype(np.uint8)
+        rgb.flags.writeable = False
+        return rgb
+
+
+def ndvi(red, nir):
+    total = nir + red
+    return np.divide(nir - red, total, out=np.zeros_like(total), where=total > 0)
+
+
+def albedo(reflectance):
+    """Broadband shortwave albedo from the band reflectances in ``ALBEDO_WEIGHTS``."""
+    total = sum(weight * reflectance[band] for band, weight in ALBEDO_WEIGHTS.items()) + ALBEDO_OFFSET
+    return np.clip(total, 0.0, 1.0)
+
+
+@lru_cache(maxsize=4)
+def _lut(name):
+    values, colors = zip(*RAMPS[name])
+    low, high = INDICES[name]["range"]
+    x = np.linspace(low, high, 256)
+    lut = np.stack([np.interp(x, values, channel) for channel in zip(*colors)], axis=1).astype(np.uint8)
+    lut.flags.writeable = False
+    return lut
+
+
+def colorize(values, name):
+    """RGB uint8 image of an index through its color ramp."""
+    low, high = INDICES[name]["range"]
+    levels = np.clip((values - low) / (high - low) * 255, 0, 255).astype(np.uint8)
+    return _lut(name)[levels]
+
+
+def highlight(rgb, mask):
+    """``rgb`` with the pixels in ``mask`` tinted."""
+    tinted = (rgb * (1 - HIGHLIGHT_ALPHA) + HIGHLIGHT * HIGHLIGHT_ALPHA).astype(np.uint8)
+    return np.where(mask[..., None], tinted, rgb)
+
+
+def version_dir(version=VERSION, data_dir=DATA_DIR):
+    return os.path.join(data_dir, f"v{version}")
+
+
+@st.cache_resource(show_spinner=False)
+def load_scenes(version=VERSION):
+    """The sample scenes, mapped once per process and shared by every session."""
+    return SceneSet(version_dir(version))
+
+
+def _smooth_field(rng, shape, scale):
+    """Smooth random field in [0, 1]: white noise low-pass filtered to features about ``scale`` pixels wide."""
+    frequencies = np.hypot(*np.meshgrid(np.fft.fftfreq(shape[0]), np.fft.rfftfreq(shape[1]), indexing="ij"))
+    spectrum = np.fft.rfft2(rng.normal(size=shape)) * np.exp(-(frequencies * scale) ** 2)
+    field = np.fft.irfft2(spectrum, s=shape)
+    return (field - field.min()) / (field.max() - field.min())
+
+
+def _paint(classes, mix, rng):
+    """(band, row, column) uint16 reflectance from per-pixel weights over ``classes``."""
+    spectra = np.array([SPECTRA[name] for name in classes], dtype=np.float64)  # (class, band)
+    reflectance = np.einsum("kb,krc->brc", spectra, mix)
+    reflectance *= 1 + rng.normal(0.0, 0.03, reflectance.shape)
+    return np.clip(np.round(reflectance * SCALE), 0, SCALE).astype(np.uint16)
+
+
+def _farmland(rng, size):
+    """Square fields of healthy, stressed and bare cropland with roads, a woodlot and a pond."""
+    classes = ["healthy crop", "stressed crop", "bare soil", "forest", "water", "road"]
+    field = 50
+    per_side = -(-size // field)
+    rows, columns = np.mgrid[0:size, 0:size]
+    kinds = rng.choice(3, size=per_side ** 2, p=[0.55, 0.2, 0.25])
+    kind = kinds[(rows // field) * per_side + columns // field]
+    # Crop vigor varies within each field; stressed fields also dry out toward one corner
+    vigor = 0.75 + 0.25 * _smooth_field(rng, (size, size), 12)
+    vigor = np.where(kind == 1, 0.5 * vigor * (1 - (rows % field + columns % field) / (2 * field)), vigor)
+    mix = np.zeros((len(classes), size, size))
+    crop = kind < 2
+    mix[0] = np.where(crop, vigor, 0)
+    mix[1] = np.where(crop, 1 - vigor, 0)
+    mix[2] = np.where(kind == 2, 1, 0)
+    woodlot = (rows - 0.7 * size) ** 2 + (columns - 0.25 * size) ** 2 < (0.12 * size) ** 2
+    pond = (rows - 0.3 * size) ** 2 / 1.5 + (columns - 0.7 * size) ** 2 < (0.07 * size) ** 2
+    road = (rows % field < 2) | (columns % field < 2)
+    for layer, area in ((5, road), (3, woodlot), (4, pond)):
+        mix[:, area] = 0
+        mix[layer, area] = 1
+    centres = np.stack([np.arange(per_side ** 2) // per_side, np.arange(per_side ** 2) % per_side], axis=1)
+    centres = centres * field + field // 2
+    clear = ~(woodlot | pond)[centres[:, 0], centres[:, 1]]
+    points = {label: centres[np.flatnonzero(clear & (kinds == k))[0]]
+              for k, label in enumerate(["Healthy crop field", "Stressed crop field", "Bare soil"])}
+    points["Woodlot"] = np.array([int(0.7 * size), int(0.25 * size)])
+    points["Farm pond"] = np.array([int(0.3 * size), int(0.7 * size)])
+    return classes, mix, points
+
+
+def _lake_ice(rng, size):
+    """Snowy shoreline along the top, then pack ice, thin ice and open water with leads."""
+    classes = ["snow", "forest", "thick ice", "thin ice", "water"]
+    rows, columns = np.mgrid[0:size, 0:size]
+    shore = 0.2 * size + 0.06 * size * np.sin(columns / size * 5 * np.pi) + 8 * _smooth_field(rng, (1, size), 20)
+    land = rows < shore
+    trees = _smooth_field(rng, (size, size), 10) > 0.6
+    # Ice concentration falls with distance from shore, broken up by leads of open water
+    distance = (rows - shore) / size
+    concentration = np.clip(1.2 - 1.6 * distance + 0.5 * (_smooth_field(rng, (size, size), 25) - 0.5), 0, 1)
+    lead = np.abs(np.sin((rows + 0.6 * columns) / size * 3 * np.pi)) < 0.015
+    concentration = np.where(lead, 0.0, concentration)
+    mix = np.zeros((len(classes), size, size))
+    mix[0] = np.where(land, np.where(trees, 0.4, 1.0), 0)
+    mix[1] = np.where(land & trees, 0.6, 0)
+    mix[2] = np.where(land, 0, np.clip(2 * concentration - 1, 0, 1))
+    mix[3] = np.where(land, 0, 1 - np.abs(2 * concentration - 1))
+    mix[4] = np.where(land, 0, np.clip(1 - 2 * concentration, 0, 1))
+    water = ~land & (concentration == 0)
+    points = {
+        "Snow on shore": np.argwhere(land & ~trees)[len(np.argwhere(land & ~trees)) // 2],
+        "Thick pack ice": np.argwhere(~land & (concentration > 0.95))[0],
+        "Thin gray ice": np.argwhere(~land & (np.abs(concentration - 0.5) < 0.02))[0],
+        "Open water": np.argwhere(water & (rows > 0.8 * size))[0],
+    }
+    return classes, mix, points
+
+
+SAMPLE_SCENES = {
+    "farmland": ("🌽 Michigan farmland (summer)", _farmland),
+    "lake_ice": ("🧊 Lake Erie ice (late winter)", _lake_ice),
+}
+
+
+def build_sample(directory, size=SAMPLE_SIZE, seed=SAMPLE_SEED):
+    """Write the synthetic sample scenes as version 1 into ``directory``."""
+    rng = np.random.default_rng(seed)
+    os.makedirs(directory, exist_ok=True)
+    scenes = {}
+    for name, (title, paint) in SAMPLE_SCENES.items():
+        classes, mix, points = paint(rng, size)
+        path = os.path.join(directory, f"{name}.npy")
+        np.save(path, _paint(classes, mix, rng))
+        scenes[name] = {"title": title, "file": f"{name}.npy", "sha256": file_sha256(path),
+                        "points": {label: [int(row), int(column)] for label, (row, column) in points.items()}}
+    manifest = {
+        "name": "sample-scenes",
+        "version": "1",
+        "synthetic": True,
+        "about": (f"Synthetic scenes generated by scene_lab.py build (seed {seed}) from typical "
+                  "surface reflectance spectra; not satellite imagery."),
+        "bands": BANDS,
+        "scale": SCALE,
+        "scenes": scenes,
+    }
+    with open(os.path.join(directory, MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    return manifest
+
+
+def main(argv):
+    if argv[:1] == ["build"]:
+        manifest = build_sample(version_dir("1"))
+        print(f"wrote v{manifest['version']}: {', '.join(manifest['scenes'])}")
+        return
+    scenes = SceneSet(version_dir())
+    scenes.verify()
+    for name, scene in scenes.scenes.items():
+        print(f"{scene['title']}: {scenes._arrays[name].shape}")
+        for index in INDICES:
+            values = scenes.index(name, index)
+            share = (values > INDICES[index]["threshold"]).mean()
+            print(f"  {index}: mean {values.mean():.2f}, {share:.0%} above {INDICES[index]['threshold']}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
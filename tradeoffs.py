@@ -0,0 +1,179 @@
+"""Mission cost and science-value model over every design option at once.
+
+A design is a choice along six axes: number of satellites, orbit, the set of
+instruments (every subset of the instrument list), 3D-printed fuel tanks or
+not, timeline and data priority; the budget slider is a cap on cost. A
+``TradeoffSweep`` evaluates all of them with broadcasting:
+
+- cost per satellite is the bus (with its fuel tank), the launch to that
+  orbit and the instruments on board, times the timeline's cost factor
+- science value (0-100) is how many of the scenario's recommended
+  instruments are flown, times a blend of coverage and resolution weighted
+  by the data priority, times the timeline's schedule risk
+
+Coverage comes from the revisit time of the constellation over the
+scenario's region, scaled from one ``orbit_sim`` simulation per orbit;
+resolution falls with altitude. Cutting the precomputed arrays down to one
+printing/timeline/priority/budget choice and finding the Pareto frontier is
+a few array operations, so the chart can follow a slider.
+"""
+import math
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+import content_store
+import orbit_sim
+
+SATELLITES = np.arange(1, 21)
+ORBITS = list(orbit_sim.ORBITS)
+
+BUS_COST = 5_000_000  # per satellite, including a conventionally made fuel tank
+TANK_COST = 150_000
+PRINTED_TANK_COST = 30_000
+PRINTING_SAVINGS_PER_SATELLITE = TANK_COST - PRINTED_TANK_COST
+LAUNCH_COST = {
+    "Low Earth Orbit (LEO)": 1_000_000,
+    "Medium Earth Orbit (MEO)": 6_000_000,
+    "Geostationary (GEO)": 12_000_000,
+    "Polar Orbit": 1_500_000,
+}
+INSTRUMENT_COST = {
+    "Multispectral Imager": 1_500_000,
+    "Radar Altimeter": 2_500_000,
+    "Thermal Sensor": 1_000_000,
+    "Microwave Radiometer": 2_000_000,
+    "SAR (Synthetic Aperture Radar)": 4_000_000,
+    "Spectrometer": 1_500_000,
+}
+DEFAULT_INSTRUMENT_COST = 2_000_000
+
+BUDGETS = {"Low ($10M)": 10_000_000, "Medium ($50M)": 50_000_000, "High ($200M)": 200_000_000}
+# Timeline: (cost factor, schedule risk factor on value)
+TIMELINES = {"Fast (1 year)": (1.25, 0.85), "Standard (3 years)": (1.0, 1.0), "Extended (5 years)": (0.9, 0.95)}
+# Data priority: weight on coverage; the rest goes to resolution
+PRIORITIES = {"Coverage (more area)": 0.7, "Balanced": 0.5, "Resolution (more detail)": 0.3}
+REVISIT_SCALE_HOURS = 3.0  # a 3-hour revisit scores 0.5 on coverage
+
+
+def design_cost(num_satellites, launch_cost, instrument_cost, printed, cost_factor):
+    """Mission cost in dollars; every argument may be a scalar or a broadcastable array."""
+    tank_savings = np.where(printed, PRINTING_SAVINGS_PER_SATELLITE, 0)
+    return num_satellites * (BUS_COST - tank_savings + launch_cost + instrument_cost) * cost_factor
+
+
+def mission_cost(mission):
+    """Estimated cost in dollars of one ``st.session_state.mission_data`` design."""
+    instruments = sum(INSTRUMENT_COST.get(name, DEFAULT_INSTRUMENT_COST) for name in mission["instruments"])
+    cost_factor = TIMELINES.get(mission.get("timeline"), (1.0, 1.0))[0]
+    return float(design_cost(mission["num_satellites"], LAUNCH_COST[mission["orbit"]], instruments,
+                             mission["use_3d_printing"], cost_factor))
+
+
+def recommended(option, recommendations):
+    """Whether an instrument option is one of the recommendations ("SAR" matches "SAR (...)")."""
+    return any(option.startswith(name) or name.startswith(option) for name in recommendations)
+
+
+def coverage_score(revisit_hours):
+    return 1.0 / (1.0 + np.asarray(revisit_hours) / REVISIT_SCALE_HOURS)
+
+
+def resolution_score(orbit):
+    lowest = min(altitude for altitude, _ in orbit_sim.ORBITS.values())
+    return math.sqrt(lowest / orbit_sim.ORBITS[orbit][0])
+
+
+def instrument_subsets(instruments):
+    """Boolean (2**n, n) table: row ``mask`` flags the instruments in that bitmask."""
+    masks = np.arange(2 ** len(instruments))
+    return (masks[:, None] >> np.arange(len(instruments)) & 1).astype(bool)
+
+
+def instrument_mask(instruments, selected):
+    return sum(1 << instruments.index(name) for name in selected if name in instruments)
+
+
+def cost_grid(instruments):
+    """Instrument subsets and the cost of every design.
+
+    The cost array has axes (satellites, orbit, instrument subset, printing, timeline).
+    """
+    subsets = instrument_subsets(instruments)
+    instrument_cost = subsets @ np.array(
+        [INSTRUMENT_COST.get(name, DEFAULT_INSTRUMENT_COST) for name in instruments], dtype=np.float64)
+    satellites = SATELLITES[:, None, None, None, None]
+    launch = np.array([LAUNCH_COST[orbit] for orbit in ORBITS])[None, :, None, None, None]
+    printed = np.array([False, True])[None, None, None, :, None]
+    cost_factor = np.array([factor for factor, _ in TIMELINES.values()])[None, None, None, None, :]
+    return subsets, design_cost(satellites, launch, instrument_cost[None, None, :, None, None], printed, cost_factor)
+
+
+class TradeoffSweep:
+    """Cost and value of every design for one scenario, as arrays indexed by option."""
+
+    def __init__(self, instruments, recommendations, region=orbit_sim.GREAT_LAKES):
+        self.instruments = list(instruments)
+        self.subsets, self.cost = cost_grid(self.instruments)
+        matches = np.array([recommended(name, recommendations) for name in self.instruments], dtype=np.float64)
+        fit = self.subsets @ matches / max(1, len(recommendations))
+
+        # Revisit time per (satellites, orbit), scaled from one simulated satellite per orbit
+        revisit = np.empty((len(SATELLITES), len(ORBITS)))
+        for column, orbit in enumerate(ORBITS):
+            single = orbit_sim.simulate(orbit, 1, region)
+            continuous = 1 - (1 - single.time_covered) ** SATELLITES >= 0.999
+            revisit[:, column] = np.where(continuous, 0.0, 24.0 / np.maximum(single.passes, 1e-9) / SATELLITES)
+        self.revisit_hours = revisit
+
+        # value axes: (satellites, orbit, instrument subset, timeline, priority)
+        risk = np.array([risk for _, risk in TIMELINES.values()])[None, None, None, :, None]
+        weight = np.array(list(PRIORITIES.values()))[None, None, None, None, :]
+        science = (weight * coverage_score(revisit)[:, :, None, None, None]
+                   + (1 - weight) * np.array([resolution_score(orbit) for orbit in ORBITS])[None, :, None, None, None])
+        self.value = 100 * fit[None, None, :, None, None] * science * risk
+
+        # feasible: the cost axes plus budget
+        self.feasible = self.cost[..., None] <= np.array(list(BUDGETS.values()), dtype=np.float64)
+
+    def designs(self, printing, timeline, priority, budget):
+        """Flat cost and value arrays for one slider setting, plus the affordable mask."""
+        p, t = int(bool(printing)), list(TIMELINES).index(timeline)
+        q, b = list(PRIORITIES).index(priority), list(BUDGETS).index(budget)
+        cost = self.cost[:, :, :, p, t].ravel()
+        value = self.value[:, :, :, t, q].ravel()
+        return cost, value, self.feasible[:, :, :, p, t, b].ravel()
+
+    def frontier(self, printing, timeline, priority, budget):
+        """Affordable designs that no cheaper design beats on value, cheapest first."""
+        cost, value, affordable = self.designs(printing, timeline, priority, budget)
+        candidates = np.flatnonzero(affordable & (value > 0))
+        order = candidates[np.lexsort((-value[candidates], cost[candidates]))]
+        best_before = np.concatenate([[-np.inf], np.maximum.accumulate(value[order])[:-1]])
+        pareto = order[value[order] > best_before]
+        satellites, orbits, subsets = np.unravel_index(pareto, self.cost.shape[:3])
+        return pd.DataFrame({
+            "satellites": SATELLITES[satellites],
+            "orbit": [ORBITS[index] for index in orbits],
+            "instruments": [", ".join(np.array(self.instruments)[self.subsets[index]]) for index in subsets],
+            "cost ($M)": cost[pareto] / 1e6,
+            "science value": value[pareto],
+        })
+
+    def evaluate(self, num_satellites, orbit, instruments, printing, timeline, priority):
+        """(cost, science value) of one design, read from the same arrays as the frontier."""
+        index = (list(SATELLITES).index(num_satellites), ORBITS.index(orbit),
+                 instrument_mask(self.instruments, instruments))
+        t = list(TIMELINES).index(timeline)
+        return (float(self.cost[index + (int(bool(printing)), t)]),
+                float(self.value[index + (t, list(PRIORITIES).index(priority))]))
+
+
+@st.cache_resource(show_spinner=False)
+def load_sweep(scenario_name):
+    """The sweep for one design-challenge scenario, built once per process."""
+    content = content_store.load_page("design_challenge")
+    scenario = content["scenarios"][scenario_name]
+    region = scenario.get("region", {}).get("bounds", orbit_sim.GREAT_LAKES)
+    return TradeoffSweep(content["instruments"], scenario["recommended_instruments"], region)
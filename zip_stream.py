@@ -0,0 +1,115 @@
+"""ZIP archives produced as a stream of chunks, in constant memory.
+
+``iter_zip`` yields the bytes of an archive while it is being written: each
+source file is memory-mapped and fed to the compressor ``CHUNK_SIZE`` bytes at
+a time, and whatever the compressor has produced is yielded straight away.
+The output is never seeked, so sizes and CRCs go in data descriptors after
+each member (``zipfile`` does this for unseekable outputs), and the only
+thing that grows with the archive is the central directory, one small record
+per member. Images and other already-compressed formats are stored rather
+than deflated again.
+
+    python zip_stream.py slides/ maps/ > bundle.zip
+"""
+import mmap
+import os
+import sys
+import zipfile
+
+CHUNK_SIZE = 1 << 20
+STORED_EXTENSIONS = {".gif", ".gz", ".jpeg", ".jpg", ".mov", ".mp4", ".pdf", ".png", ".pptx", ".webp", ".zip"}
+DATE_TIME = (2026, 1, 1, 0, 0, 0)  # fixed, so identical inputs give identical archives
+
+
+class _Chunks:
+    """Write-only, unseekable file object collecting what ``zipfile`` writes until it is taken."""
+
+    def __init__(self):
+        self._parts = []
+
+    def write(self, data):
+        self._parts.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def take(self):
+        data = b"".join(self._parts)
+        self._parts.clear()
+        return data
+
+
+def _member(name, size):
+    info = zipfile.ZipInfo(name, date_time=DATE_TIME)
+    extension = os.path.splitext(name)[1].lower()
+    info.compress_type = zipfile.ZIP_STORED if extension in STORED_EXTENSIONS else zipfile.ZIP_DEFLATED
+    info.file_size = size  # lets zipfile switch to ZIP64 for huge members up front
+    return info
+
+
+def iter_zip(entries, chunk_size=CHUNK_SIZE):
+    """Yield a ZIP archive of ``entries`` as byte chunks.
+
+    ``entries`` is an iterable of (archive name, source) where the source is
+    either bytes or the path of a file to include.
+    """
+    sink = _Chunks()
+    with zipfile.ZipFile(sink, "w") as archive:
+        for name, source in entries:
+            if isinstance(source, (bytes, bytearray)):
+                with archive.open(_member(name, len(source)), "w") as member:
+                    member.write(source)
+            else:
+                with open(source, "rb") as f:
+                    size = os.fstat(f.fileno()).st_size
+                    with archive.open(_member(name, size), "w") as member:
+                        if size:
+                            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                                for offset in range(0, size, chunk_size):
+                                    member.write(view[offset:offset + chunk_size])
+                                    chunk = sink.take()
+                                    if chunk:
+                                        yield chunk
+            yield sink.take()
+    yield sink.take()
+
+
+def write_zip(entries, path, chunk_size=CHUNK_SIZE):
+    """Stream a ZIP of ``entries`` into ``path`` (atomically); returns its size in bytes."""
+    temporary = f"{path}.{os.getpid()}.tmp"
+    size = 0
+    try:
+        with open(temporary, "wb") as out:
+            for chunk in iter_zip(entries, chunk_size):
+                out.write(chunk)
+                size += len(chunk)
+        os.replace(temporary, path)
+    finally:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+    return size
+
+
+def tree_entries(directory, prefix=""):
+    """(archive name, path) for every file under ``directory``, in a stable order."""
+    for root, dirs, names in os.walk(directory):
+        dirs.sort()
+        for name in sorted(names):
+            if name.startswith("."):
+                continue
+            path = os.path.join(root, name)
+            yield prefix + os.path.relpath(path, directory).replace(os.sep, "/"), path
+
+
+def main():
+    if len(sys.argv) < 2:
+        sys.exit("usage: python zip_stream.py DIRECTORY... > archive.zip")
+    entries = (entry for directory in sys.argv[1:]
+               for entry in tree_entries(directory, os.path.basename(os.path.normpath(directory)) + "/"))
+    for chunk in iter_zip(entries):
+        sys.stdout.buffer.write(chunk)
+
+
+if __name__ == "__main__":
+    main()